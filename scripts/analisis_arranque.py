@@ -0,0 +1,163 @@
+"""Costo de importación y arranque de los puntos de entrada.
+
+Para cada objetivo lanza ``--runs`` intérpretes nuevos con ``-X importtime``
+y toma la mediana de:
+
+- el tiempo de importación que informa el propio Python (suma de los
+  tiempos propios de cada módulo cargado por el objetivo),
+- el tiempo de reloj del proceso completo, y ese mismo tiempo menos el de
+  un intérprete vacío (``-c pass``), que es lo que agrega el objetivo.
+
+También lista los módulos que más tiempo acumulado costaron y señala si se
+cargó ``rich``, que solo debería aparecer en el camino interactivo.
+
+Uso rápido en consola:
+  py scripts/analisis_arranque.py
+  py scripts/analisis_arranque.py --runs 20 --top 15
+
+Parámetros:
+  --runs 10            Procesos por objetivo (se reporta la mediana)
+  --top 10             Módulos más caros listados por objetivo
+  --targets a;b        Código a medir, separado por ';' (por defecto, TARGETS)
+  --out resultados     Carpeta para JSON/MD (se omite con --no-save)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics as stats
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# código pasado a ``python -c``; los scripts se importan igual que con -m
+TARGETS = [
+    "import src",
+    "from src import TablaHashAbierta",
+    "import src.menu",
+    "import scripts.analisis_tercera_entrega",
+]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Líneas ``import time: propio | acumulado | módulo`` como (módulo, µs, µs)."""
+    rows: list[tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_once(code: str) -> tuple[float, list[tuple[str, int, int]]]:
+    """Un intérprete nuevo: (segundos de reloj, filas de importtime)."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - t0
+    if proc.returncode != 0:
+        raise RuntimeError(f"{code!r} terminó con código {proc.returncode}:\n{proc.stderr[-2000:]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def measure(code: str, runs: int, top: int, baseline: set[str]) -> dict:
+    """Medianas de ``runs`` procesos; ``baseline`` son los módulos de ``-c pass``."""
+    walls: list[float] = []
+    totals: list[int] = []
+    cumulative: dict[str, list[int]] = {}
+    for _ in range(runs):
+        wall, rows = run_once(code)
+        own = [r for r in rows if r[0] not in baseline]
+        walls.append(wall)
+        totals.append(sum(r[1] for r in own))
+        for name, _, cum in own:
+            cumulative.setdefault(name, []).append(cum)
+    modules = sorted(
+        ({"module": name, "cumulative_us": stats.median(v)} for name, v in cumulative.items()),
+        key=lambda m: m["cumulative_us"], reverse=True,
+    )
+    return {
+        "code": code,
+        "wall_ms": stats.median(walls) * 1e3,
+        "import_us": stats.median(totals),
+        "modules": len(cumulative),
+        "rich": any(name == "rich" or name.startswith("rich.") for name in cumulative),
+        "top": modules[:top],
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Costo de importación de los puntos de entrada")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--targets", type=str, default=";".join(TARGETS))
+    parser.add_argument("--out", type=str, default="resultados")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs debe ser al menos 1")
+
+    # -c pass: arranque del intérprete y los módulos que carga site
+    empty_walls: list[float] = []
+    baseline: set[str] = set()
+    for _ in range(args.runs):
+        wall, rows = run_once("pass")
+        empty_walls.append(wall)
+        baseline.update(r[0] for r in rows)
+    empty_ms = stats.median(empty_walls) * 1e3
+    print(f"Intérprete vacío: {empty_ms:.1f} ms ({args.runs} procesos, mediana)\n")
+    print(f"{'objetivo':<44} {'importación':>12} {'reloj':>9} {'agregado':>9} {'módulos':>8}  rich")
+
+    rows: list[dict] = []
+    for code in [x.strip() for x in args.targets.split(";") if x.strip()]:
+        r = measure(code, args.runs, args.top, baseline)
+        r["added_ms"] = r["wall_ms"] - empty_ms
+        rows.append(r)
+        print(
+            f"{code:<44} {r['import_us'] / 1e3:>10.1f}ms {r['wall_ms']:>7.1f}ms {r['added_ms']:>7.1f}ms "
+            f"{r['modules']:>8}  {'sí' if r['rich'] else 'no'}"
+        )
+
+    if args.no_save:
+        return
+    os.makedirs(args.out, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_path = os.path.join(args.out, f"arranque_{ts}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "python": sys.version, "runs": args.runs, "empty_ms": empty_ms, "results": rows,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados JSON: {json_path}")
+
+    md_lines = [f"# Costo de importación ({ts})\n"]
+    md_lines.append(
+        f"Mediana de {args.runs} procesos con `-X importtime`; `agregado` es el reloj menos el "
+        f"de un intérprete vacío ({empty_ms:.1f} ms). Tiempos acumulados en ms.\n"
+    )
+    md_lines.append("| objetivo | importación (ms) | reloj (ms) | agregado (ms) | módulos | rich |")
+    md_lines.append("|:---|---:|---:|---:|---:|:---:|")
+    for r in rows:
+        md_lines.append(
+            f"| `{r['code']}` | {r['import_us'] / 1e3:.1f} | {r['wall_ms']:.1f} | {r['added_ms']:.1f} | "
+            f"{r['modules']} | {'sí' if r['rich'] else 'no'} |"
+        )
+    for r in rows:
+        md_lines.append(f"\n## `{r['code']}`\n")
+        md_lines.append("| módulo | acumulado (ms) |")
+        md_lines.append("|:---|---:|")
+        md_lines.extend(f"| `{m['module']}` | {m['cumulative_us'] / 1e3:.2f} |" for m in r["top"])
+    md_path = os.path.join(args.out, f"arranque_{ts}.md")
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(md_lines) + "\n")
+    print(f"Resumen Markdown: {md_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
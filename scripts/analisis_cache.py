@@ -0,0 +1,114 @@
+"""Análisis de la memoria de búsquedas (DiccionarioCache) con tráfico sesgado.
+
+Construye cada estructura con N palabras, genera un flujo de consultas con
+la carga ``zipf`` de ``cargas_trabajo`` (unas pocas palabras concentran casi
+todo el tráfico, como en producción) y mide el tiempo medio de ``miembro``
+sin memoria y con ``DiccionarioCache`` en política LRU y LFU.
+
+Uso rápido en consola:
+  py scripts/analisis_cache.py
+  py scripts/analisis_cache.py --n 5000 --queries 50000 --zipf 1.2 --capacity 256
+
+Parámetros:
+  --n 2000             Palabras en cada estructura
+  --queries 20000      Consultas del flujo sesgado
+  --zipf 1.1           Exponente s de Zipf (mayor = más sesgo)
+  --miss-rate 0.1      Fracción de consultas por palabras ausentes
+  --capacity 256       Entradas de la memoria
+  --structures a,b     Subconjunto de estructuras (por defecto, todas)
+  --out resultados     Carpeta para el JSON (se omite con --no-save)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.analisis_tercera_entrega import STRUCTURES, build_factory
+from scripts.cargas_trabajo import make_workload
+from src.diccionariocache import DiccionarioCache
+
+
+def with_misses(picks: list[str], misses: list[str], miss_rate: float, rng: random.Random) -> list[str]:
+    """Reemplaza al azar una fracción ``miss_rate`` de ``picks`` por palabras ausentes."""
+    return [rng.choice(misses) if rng.random() < miss_rate else w for w in picks]
+
+
+def time_stream(d: object, stream: list[str]) -> float:
+    """Tiempo medio (ns) por ``miembro`` sobre todo el flujo."""
+    miembro = d.miembro  # type: ignore[attr-defined]
+    t0 = time.perf_counter_ns()
+    for w in stream:
+        miembro(w)
+    return (time.perf_counter_ns() - t0) / len(stream)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Memoria de búsquedas con tráfico Zipf")
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--miss-rate", type=float, default=0.1)
+    parser.add_argument("--capacity", type=int, default=256)
+    parser.add_argument("--structures", type=str, default=",".join(STRUCTURES))
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--out", type=str, default="resultados")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    wl = make_workload("zipf", args.n, rng)
+    wl.exponent = args.zipf
+    words = wl.base()
+    base = set(words)
+    misses = [w for w in wl.fresh(256) if w not in base]
+    stream = with_misses(wl.pick(words, args.queries), misses, args.miss_rate, rng)
+
+    print(f"N={args.n}, consultas={args.queries}, zipf s={args.zipf}, capacidad={args.capacity}\n")
+    print(f"{'estructura':<30} {'sin memoria':>12} {'LRU':>10} {'LFU':>10} {'acel. LRU':>10} {'acel. LFU':>10} {'aciertos':>9}")
+    rows: list[dict] = []
+    skipped: list[dict] = []
+    for name in [x.strip() for x in args.structures.split(",") if x.strip()]:
+        try:
+            d = build_factory(name)(args.n)
+            for w in words:
+                d.inserte(w)
+        except MemoryError:
+            skipped.append({"name": name, "n": args.n, "error": "MemoryError"})
+            print(f"{name:<30} omitida (MemoryError al construir)")
+            continue
+        plain = time_stream(d, stream)
+        row = {"name": name, "plain_ns": plain}
+        for policy in ("lru", "lfu"):
+            cached = DiccionarioCache(d, capacidad=args.capacity, politica=policy)
+            row[f"{policy}_ns"] = time_stream(cached, stream)
+            row[f"{policy}_hit_rate"] = cached.tasa_aciertos()
+        rows.append(row)
+        print(
+            f"{name:<30} {plain:>10.0f}ns {row['lru_ns']:>8.0f}ns {row['lfu_ns']:>8.0f}ns "
+            f"{plain / row['lru_ns']:>9.2f}x {plain / row['lfu_ns']:>9.2f}x {row['lru_hit_rate']:>8.1%}"
+        )
+
+    if not args.no_save:
+        os.makedirs(args.out, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(args.out, f"cache_{ts}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "n": args.n, "queries": args.queries, "zipf": args.zipf,
+                "miss_rate": args.miss_rate, "capacity": args.capacity,
+                "skipped": skipped, "results": rows,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\nResultados JSON: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
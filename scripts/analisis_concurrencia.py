@@ -0,0 +1,147 @@
+"""Rendimiento multihilo con DiccionarioConcurrente.
+
+Para cada estructura, cantidad de hilos y proporción de lecturas, lanza los
+hilos a la vez durante un tiempo fijo sobre un mismo ``DiccionarioConcurrente``
+y reporta operaciones por segundo. Las escrituras alternan ``inserte`` de una
+palabra nueva y su ``borre``, de modo que el tamaño se mantiene estable.
+
+Con el GIL activo las lecturas no escalan con los hilos (solo se ve el costo
+del cerrojo); en compilaciones *free-threaded* de Python 3.13+ (``python3.13t``)
+sí debería verse el escalamiento de lectores.
+
+Uso rápido en consola:
+  py scripts/analisis_concurrencia.py
+  py scripts/analisis_concurrencia.py --threads 1,2,4,8 --read-ratios 1,0.99,0.9 --duration 2
+
+Parámetros:
+  --n 2000               Palabras en cada estructura
+  --threads 1,2,4        Cantidades de hilos a probar
+  --read-ratios 1,0.9    Proporciones de lecturas (miembro) a probar
+  --duration 1.0         Segundos por celda
+  --structures a,b       Subconjunto de estructuras (por defecto, todas)
+  --workload uniforme    Carga de ``cargas_trabajo`` para las palabras y las lecturas
+  --out resultados       Carpeta para el JSON (se omite con --no-save)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.analisis_tercera_entrega import STRUCTURES, build_factory
+from scripts.cargas_trabajo import WORKLOADS, make_workload
+from src.diccionarioconcurrente import DiccionarioConcurrente
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else bool(check())
+
+
+def run_cell(d: DiccionarioConcurrente, keys: list[str], threads: int, read_ratio: float, duration: float, seed: int) -> float:
+    """Ejecuta ``threads`` hilos durante ``duration`` s y devuelve ops/s.
+
+    Las lecturas eligen al azar dentro de ``keys``, que ya trae la
+    distribución de la carga de trabajo (``Workload.pick``).
+    """
+    stop = threading.Event()
+    barrier = threading.Barrier(threads + 1)
+    counts = [0] * threads
+
+    def worker(k: int) -> None:
+        rng = random.Random(seed + k)
+        pending: str | None = None
+        ops = 0
+        barrier.wait()
+        while not stop.is_set():
+            if rng.random() < read_ratio:
+                d.miembro(keys[rng.randrange(len(keys))])
+            elif pending is None:
+                pending = f"~{k}-{ops}"
+                d.inserte(pending)
+            else:
+                d.borre(pending)
+                pending = None
+            ops += 1
+        if pending is not None:
+            d.borre(pending)
+        counts[k] = ops
+
+    pool = [threading.Thread(target=worker, args=(k,)) for k in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for t in pool:
+        t.join()
+    return sum(counts) / (time.perf_counter() - t0)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rendimiento multihilo con cerrojo lectores/escritores")
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--threads", type=str, default="1,2,4")
+    parser.add_argument("--read-ratios", type=str, default="1,0.99,0.9")
+    parser.add_argument("--duration", type=float, default=1.0)
+    parser.add_argument("--structures", type=str, default=",".join(STRUCTURES))
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="uniforme")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--out", type=str, default="resultados")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    thread_counts = [int(x) for x in args.threads.split(",") if x.strip()]
+    ratios = [float(x) for x in args.read_ratios.split(",") if x.strip()]
+    wl = make_workload(args.workload, args.n, random.Random(args.seed))
+    words = wl.base()
+    keys = wl.pick(words, max(10_000, 4 * args.n))
+
+    print(f"GIL activo: {'sí' if gil_enabled() else 'no'}; N={args.n}; carga {args.workload}; {args.duration}s por celda\n")
+    rows: list[dict] = []
+    skipped: list[dict] = []
+    for name in [x.strip() for x in args.structures.split(",") if x.strip()]:
+        try:
+            inner = build_factory(name)(args.n)
+            for w in words:
+                inner.inserte(w)
+        except MemoryError:
+            skipped.append({"name": name, "n": args.n, "error": "MemoryError"})
+            print(f"==> {name}: omitida (MemoryError al construir)")
+            continue
+        d = DiccionarioConcurrente(inner)
+        print(f"==> {name}")
+        for ratio in ratios:
+            line = [f"  lecturas={ratio:>5.0%}:"]
+            base: float | None = None
+            for threads in thread_counts:
+                ops = run_cell(d, keys, threads, ratio, args.duration, args.seed)
+                base = base or ops
+                rows.append({"name": name, "read_ratio": ratio, "threads": threads, "ops_per_s": ops})
+                line.append(f"{threads}h {ops:>10.0f} ops/s ({ops / base:.2f}x)")
+            print("  ".join(line))
+
+    if not args.no_save:
+        os.makedirs(args.out, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(args.out, f"concurrencia_{ts}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "gil_enabled": gil_enabled(), "n": args.n, "workload": args.workload,
+                "duration_s": args.duration, "skipped": skipped, "results": rows,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\nResultados JSON: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,104 @@
+"""Tiempo de construcción de DiccionarioParticionado según cantidad de procesos.
+
+Para cada estructura mide:
+- la construcción de una sola instancia con N palabras, por el mismo camino
+  que cada partición (``inserte_ordenados`` si la estructura lo tiene);
+- ``DiccionarioParticionado.construya`` con P particiones y W procesos
+  trabajadores (W=1 arma las particiones en el proceso actual, sin
+  serializar), incluyendo el envío de cada partición como instantánea.
+
+Uso rápido en consola:
+  py scripts/analisis_particionado.py
+  py scripts/analisis_particionado.py --n 20000 --workers 1,2,4,8 --shards 8
+
+Parámetros:
+  --n 5000               Palabras a insertar
+  --workers 1,2,4        Cantidades de procesos trabajadores a probar
+  --shards 4             Particiones (por defecto, el máximo de --workers)
+  --structures a,b       Subconjunto de estructuras (por defecto, todas)
+  --workload uniforme    Carga de ``cargas_trabajo`` que genera las palabras
+  --out resultados       Carpeta para el JSON (se omite con --no-save)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from functools import partial
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.analisis_tercera_entrega import STRUCTURES, build_factory
+from scripts.cargas_trabajo import WORKLOADS, make_workload
+from src.diccionarioparticionado import DiccionarioParticionado, _llene
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Construcción paralela por particiones")
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--workers", type=str, default="1,2,4")
+    parser.add_argument("--shards", type=int, default=0)
+    parser.add_argument("--structures", type=str, default=",".join(STRUCTURES))
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="uniforme")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--out", type=str, default="resultados")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    workers = [int(x) for x in args.workers.split(",") if x.strip()]
+    shards = args.shards or max(workers)
+    words = make_workload(args.workload, args.n, random.Random(args.seed)).base()
+
+    print(f"N={args.n}, carga {args.workload}, particiones={shards}, CPUs={os.cpu_count()}\n")
+    rows: list[dict] = []
+    skipped: list[dict] = []
+    for name in [x.strip() for x in args.structures.split(",") if x.strip()]:
+        # fábrica sin argumentos que se puede enviar a los procesos trabajadores
+        factory = partial(build_factory(name), args.n)
+        # la instancia única se llena por el mismo camino que cada partición
+        # (carga masiva ordenada si la estructura la tiene)
+        t0 = time.perf_counter()
+        try:
+            single = _llene(factory(), words)
+        except MemoryError:
+            skipped.append({"name": name, "workers": 0, "error": "MemoryError"})
+            print(f"{name:<30} omitida (MemoryError al construir una instancia)")
+            continue
+        base = time.perf_counter() - t0
+        row = {"name": name, "sequential_s": base, "shards": shards, "build_s": {}}
+        line = [f"{name:<30} 1 instancia {base:>8.3f}s"]
+        for k in workers:
+            d = DiccionarioParticionado(factory, shards)
+            t0 = time.perf_counter()
+            try:
+                d.construya(words, trabajadores=k)
+            except MemoryError:
+                skipped.append({"name": name, "workers": k, "error": "MemoryError"})
+                line.append(f"{k}p omitida (MemoryError)")
+                continue
+            elapsed = time.perf_counter() - t0
+            if len(d) != len(single):
+                raise RuntimeError(f"{name}: tamaño {len(d)} != {len(single)}")
+            row["build_s"][str(k)] = elapsed
+            line.append(f"{k}p {elapsed:>8.3f}s ({base / elapsed:.2f}x)")
+        rows.append(row)
+        print("  ".join(line))
+
+    if not args.no_save:
+        os.makedirs(args.out, exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(args.out, f"particionado_{ts}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"n": args.n, "workload": args.workload, "shards": shards, "cpus": os.cpu_count(),
+                       "skipped": skipped, "results": rows}, f, ensure_ascii=False, indent=2)
+        print(f"\nResultados JSON: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -7,13 +7,17 @@ Mide tiempos promedio y desviación estándar para:
 - print
 - done (limpie)
 
-en las 7 implementaciones del Modelo Diccionario para tamaños:
+en las 7 implementaciones del Modelo Diccionario (más sus variantes
+desenrollada y compactas) para tamaños:
 - pequeño (100)
 - mediano (50 000)
 - grande (1 000 000) 
 
-Además, estima el uso de memoria por estructura (via tracemalloc) y genera
-un resumen en consola y archivos JSON/Markdown.
+Además, reporta la memoria por estructura de dos formas: el tamaño retenido
+que la propia estructura cuenta con ``memoria_bytes()`` (bytes/clave con y
+sin las hileras) y el pico de tracemalloc durante la construcción, que
+también incluye asignaciones temporales. Genera un resumen en consola y
+archivos JSON/Markdown.
 
 Uso rápido en consola:
   py scripts/analisis_tercera_entrega.py --quick     # 100 y 50k, 3 corridas
@@ -25,6 +29,23 @@ Parámetros:
   --trials 100                Operaciones por corrida para promediar
   --no-large                  Omite el tamaño grande
   --quick                     Alias de: --sizes 100,50000 --runs 3 --trials 50 --no-large
+  --bloom                     Antepone un filtro de Bloom con contadores a cada estructura
+  --jobs 1                    Procesos en paralelo; cada (estructura, N, corrida) es una celda
+  --pin                       Fija cada proceso a un CPU propio (sched_setaffinity, Linux)
+  --timing batch              batch: lotes calibrados menos el bucle vacío; single: una llamada por medición
+  --workload uniforme         Distribución de palabras (ver scripts/cargas_trabajo.py)
+  --corpus-cache DIR          Guarda/reutiliza las listas de palabras generadas en DIR
+  --mix 90,8,2                En lugar de la matriz, lazo cerrado mezclando miembro,inserte,borre
+  --mix-duration 2            Segundos por celda en modo --mix
+  --curve 7,20                En lugar de la matriz, barre N = 2^7 … 2^20 y ajusta pendientes log–log
+  --curve-budget 30           Segundos máximos por punto del barrido
+  --curve-fit-min 1024        N mínimo usado en el ajuste
+  --curve-tolerance 0.3       Diferencia de exponente a partir de la cual se marca desvío
+  --budget 0                  Segundos máximos por celda (estructura × N; con --jobs, por corrida); 0 = sin límite
+  --resume ARCHIVO            Retoma un bench_*.partial.jsonl saltando las celdas ya terminadas
+  --profile                   En lugar de la matriz, perfila cada (estructura, N, operación) con cProfile
+  --profile-top 15            Funciones con más tiempo propio listadas por celda en el Markdown
+  --count-ops                 Agrega una pasada aparte con los contadores internos (estadisticas())
     --out resultados            Carpeta donde guardar JSON/MD
     --print-large               Permite medir print() también en tamaño grande 
 """
@@ -36,47 +57,47 @@ import json
 import math
 import os
 import random
+import re
+import signal
 import statistics as stats
 import sys
 import time
 import tracemalloc
-from dataclasses import dataclass, asdict
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Callable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    # pstats y el pool de procesos cuestan más que el resto de los imports
+    # juntos; se importan solo en los modos que los usan
+    import cProfile
+    import multiprocessing
+    import pstats
 
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from src.listaordenadadinamica import ListaOrdenadaDinámica
-from src.listaordenadaestatica import ListaOrdenadaEstática
-from src.tablahashabierta import TablaHashAbierta
-from src.abbpunteros import AbbPunteros
-from src.abbvectorheap import ABBVectorHeap
-from src.triepunteros import TriePunteros
-from src.triearreglos import TrieArreglos
-
-
-ABC = "abcdefghijklmnopqrstuvwxyz"
-
-
-def rand_word(rng: random.Random, length: int = 20) -> str:
-    return "".join(rng.choice(ABC) for _ in range(length))
-
-
-def gen_words_unique(n: int, seed: int) -> list[str]:
-    rng = random.Random(seed)
-    s: set[str] = set()
-    while len(s) < n:
-        s.add(rand_word(rng, 20))
-    return list(s)
+from src import cargue_clase
+from src.filtrobloom import DiccionarioConFiltro
+from scripts.cargas_trabajo import CORPUS_CACHE_ENV, WORKLOADS, gen_words_unique, make_workload, rand_word
+from scripts.histograma_latencias import LatencyHistogram
 
 
 @dataclass
 class OpStats:
     mean_ns: float
     stdev_ns: float
+    # percentiles de las llamadas individuales (histograma de todas las corridas)
+    p50_ns: float = 0.0
+    p90_ns: float = 0.0
+    p99_ns: float = 0.0
+    p999_ns: float = 0.0
+    max_ns: float = 0.0
 
 
 @dataclass
@@ -85,9 +106,19 @@ class SizeStats:
     insert: OpStats
     delete: OpStats
     search: OpStats
+    search_hit: OpStats
+    search_miss: OpStats
     print_ns: float | None
     done_ns: float
     memory_peak_bytes: int
+    build: OpStats | None = None
+    histograms: dict[str, dict] = field(default_factory=dict)
+    retained_bytes: int = 0
+    retained_bytes_with_keys: int = 0
+    bytes_per_key: float = 0.0
+    bytes_per_key_with_keys: float = 0.0
+    runs: int = 0
+    counters: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
 @dataclass
@@ -102,153 +133,1184 @@ def time_ns(fn: Callable[[], None]) -> int:
     return time.perf_counter_ns() - t0
 
 
-def benchmark_one_size(
-    name: str,
+def batch_ns(
+    op: Callable[[str], object],
+    words: list[str],
+    repair: Callable[[str], object] | None = None,
+    min_total_ns: int = 2_000_000,
+    repeat: int = 3,
+) -> float:
+    """Tiempo por operación medido en lotes, al estilo de ``timeit``.
+
+    Calibra cuántas pasadas sobre ``words`` hacen falta para acumular al
+    menos ``min_total_ns``, repite la medición ``repeat`` veces y se queda
+    con la menor. A esa le resta el costo del mismo bucle vacío. ``repair``
+    (p. ej. borrar lo insertado) se aplica después de cada pasada, fuera
+    del tiempo medido.
+    """
+    if not words:
+        return 0.0
+    clock = time.perf_counter_ns
+
+    def one_pass() -> int:
+        t0 = clock()
+        for w in words:
+            op(w)
+        t = clock() - t0
+        if repair is not None:
+            for w in words:
+                repair(w)
+        return t
+
+    def empty_pass() -> int:
+        t0 = clock()
+        for w in words:
+            pass
+        return clock() - t0
+
+    first = max(1, one_pass())
+    loops = max(1, min(1000, math.ceil(min_total_ns / first)))
+    best = min(sum(one_pass() for _ in range(loops)) for _ in range(repeat))
+    empty = min(sum(empty_pass() for _ in range(loops)) for _ in range(repeat))
+    return max(0.0, (best - empty) / (loops * len(words)))
+
+
+def per_call_ns(
+    op: Callable[[str], object],
+    words: list[str],
+    repair: Callable[[str], object] | None = None,
+) -> list[int]:
+    """Tiempo de cada llamada por separado (incluye el costo del reloj)."""
+    times: list[int] = []
+    for w in words:
+        times.append(time_ns(lambda: op(w)))
+        if repair is not None:
+            repair(w)
+    return times
+
+
+def histogram_of(values: list[int]) -> LatencyHistogram:
+    h = LatencyHistogram()
+    for v in values:
+        h.record(v)
+    return h
+
+
+@dataclass
+class RunSample:
+    """Promedios de una sola corrida (una celda estructura × tamaño × corrida)."""
+    insert_ns: float
+    delete_ns: float
+    search_ns: float
+    search_hit_ns: float
+    search_miss_ns: float | None
+    print_ns: int | None
+    done_ns: int
+    memory_peak_bytes: int
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict)
+    retained_bytes: int = 0
+    retained_bytes_with_keys: int = 0
+    counters: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+HISTOGRAM_OPS = ("build", "insert", "delete", "search_hit", "search_miss")
+
+
+class CellTimeout(Exception):
+    """La celda superó su presupuesto de tiempo (``--budget``)."""
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Lanza ``CellTimeout`` dentro del bloque al pasar ``seconds`` (0 = sin límite).
+
+    Usa ``SIGALRM`` (``signal.setitimer``), que corta incluso una operación
+    O(n) a medias. Donde no existe (Windows) o fuera del hilo principal no
+    hace nada y el presupuesto solo se revisa entre corridas.
+    """
+    if seconds <= 0 or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def expire(signum: int, frame: object) -> None:
+        raise CellTimeout()
+
+    try:
+        previous = signal.signal(signal.SIGALRM, expire)
+    except ValueError:  # no es el hilo principal
+        yield
+        return
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def error_label(e: BaseException) -> str:
+    return "timeout" if isinstance(e, CellTimeout) else type(e).__name__
+
+
+def retained_bytes(d: object, with_keys: bool) -> int:
+    """``memoria_bytes`` de la estructura, o 0 si no la implementa."""
+    try:
+        return d.memoria_bytes(with_keys)  # type: ignore[attr-defined]
+    except (AttributeError, NotImplementedError):
+        return 0
+
+
+def count_ops(
+    d: object,
+    insert_words: list[str],
+    delete_words: list[str],
+    hits: list[str],
+    misses: list[str],
+) -> dict[str, dict[str, float]]:
+    """Contadores internos (``estadisticas``) promedio por llamada de cada operación.
+
+    Se corre aparte de las mediciones, porque encenderlos recorre de nuevo
+    cada camino; las reparaciones (borrar lo insertado, reinsertar lo
+    borrado) se hacen con los contadores apagados.
+    """
+    if not hasattr(d, "active_estadisticas"):
+        return {}
+    groups = (
+        ("insert", d.inserte, insert_words, d.borre),
+        ("delete", d.borre, list(dict.fromkeys(delete_words)), d.inserte),
+        ("search_hit", d.miembro, hits, None),
+        ("search_miss", d.miembro, misses, None),
+    )
+    out: dict[str, dict[str, float]] = {}
+    for label, op, words, repair in groups:
+        if not words:
+            continue
+        d.active_estadisticas()
+        for w in words:
+            op(w)
+        snapshot = d.estadisticas()
+        d.active_estadisticas(False)
+        if repair is not None:
+            for w in words:
+                repair(w)
+        if snapshot:
+            out[label] = {k: v / len(words) for k, v in sorted(snapshot.items())}
+    return out
+
+
+def corpus_seed(seed: int, r: int) -> int:
+    """Semilla de las palabras base de la corrida ``r``, igual para todas las
+    estructuras: comparan sobre el mismo corpus y ``--corpus-cache`` guarda
+    una sola lista por (carga, N, corrida, ``seed``).
+    """
+    return seed * 9176 + r * 101
+
+
+def run_seed(name: str, seed: int, r: int) -> int:
+    """Semilla del resto de la corrida ``r`` (palabras nuevas, elecciones).
+
+    La parte de cada estructura sale de ``zlib.crc32`` y no de ``hash``, que
+    cambia entre procesos: así la misma ``seed`` repite los resultados entre
+    invocaciones y en cualquier proceso de ``--jobs``.
+    """
+    return corpus_seed(seed, r) + zlib.crc32(name.encode("utf-8")) % 10_000
+
+
+def benchmark_one_run(
     factory: Callable[[int], object],
     n: int,
-    runs: int,
     trials: int,
     seed: int,
     enable_print_large: bool,
-) -> SizeStats:
-    insert_avgs: list[float] = []
-    delete_avgs: list[float] = []
-    search_avgs: list[float] = []
-    print_times: list[int] = []
-    done_times: list[int] = []
-    memory_peaks: list[int] = []
+    timing: str = "batch",
+    workload: str = "uniforme",
+    base_seed: int | None = None,
+    with_counters: bool = False,
+) -> RunSample:
+    rng = random.Random(seed)
+    wl = make_workload(workload, n, rng, base_seed)
+    base_words = wl.base()
+    extra_words = wl.fresh(trials * 2)
+    base_set = set(base_words)
+    extra_words = [w for w in extra_words if w not in base_set][:trials]
+    if len(extra_words) < trials:
+    
+        while len(extra_words) < trials:
+            w = rand_word(rng)
+            if w not in base_set:
+                extra_words.append(w)
 
-    for r in range(runs):
-        rng = random.Random(seed * 9176 + r * 101 + hash(name) % 10_000)
-        base_words = gen_words_unique(n, rng.randrange(1_000_000_000))
-        extra_words = gen_words_unique(trials * 2, rng.randrange(1_000_000_000))
-        base_set = set(base_words)
-        extra_words = [w for w in extra_words if w not in base_set][:trials]
-        if len(extra_words) < trials:
-        
-            while len(extra_words) < trials:
-                w = rand_word(rng)
-                if w not in base_set:
-                    extra_words.append(w)
-
-       
-        tracemalloc.start()
+   
+    build_hist = LatencyHistogram()
+    clock = time.perf_counter_ns
+    tracemalloc.start()
+    try:
         d = factory(n)
         for w in base_words:
+            # copia propia de la clave en todas las estructuras, no solo en
+            # las de arena: las demás guardan la referencia, y sin la copia
+            # su pico no contaría las hileras (ver "owned_key_copies")
+            w = w.encode().decode()
+            t0 = clock()
             d.inserte(w)
+            build_hist.record(clock() - t0)
         current, peak = tracemalloc.get_traced_memory()
+    finally:
         tracemalloc.stop()
-        memory_peaks.append(peak)
-
-        
-        del_words = [base_words[rng.randrange(0, n)] for _ in range(trials)]
-        # Asegurar que las palabras a borrar estén en la base
-        del_words = [w for w in del_words if w in base_set]
-        miss_words = gen_words_unique(trials, rng.randrange(1_000_000_000))
-        miss_words = [w for w in miss_words if w not in base_set][:trials]
-        while len(miss_words) < trials:
-            w = rand_word(rng)
-            if w not in base_set:
-                miss_words.append(w)
-        search_pool = [base_words[rng.randrange(0, n)] for _ in range(trials)]
-
-        def bench_insert_once(word: str) -> int:
-            t = time_ns(lambda: d.inserte(word))
-            d.borre(word)
-            return t
-
-        insert_times = [bench_insert_once(w) for w in extra_words]
-        insert_avgs.append(sum(insert_times) / len(insert_times))
-
-        def bench_delete_once(word: str) -> int:
-            t = time_ns(lambda: d.borre(word))
-            d.inserte(word)
-            return t
-
-        delete_times = [bench_delete_once(w) for w in del_words]
-        delete_avgs.append(sum(delete_times) / len(delete_times))
+    # fuera de tracemalloc: recorrer la estructura no debe inflar el pico
+    retained = retained_bytes(d, False)
+    retained_with_keys = retained_bytes(d, True)
+
+    
+    del_words = wl.pick(base_words, trials)
+    # Asegurar que las palabras a borrar estén en la base
+    del_words = [w for w in del_words if w in base_set]
+    miss_words = wl.fresh(trials)
+    miss_words = [w for w in miss_words if w not in base_set][:trials]
+    while len(miss_words) < trials:
+        w = rand_word(rng)
+        if w not in base_set:
+            miss_words.append(w)
+    search_pool = wl.pick(base_words, trials)
+
+    # llamadas individuales: alimentan los histogramas en ambos modos y,
+    # con --timing single, también los promedios
+    hits = search_pool[0::2]
+    misses = miss_words[1::2]
+    insert_times = per_call_ns(d.inserte, extra_words, repair=d.borre)
+    delete_times = per_call_ns(d.borre, del_words, repair=d.inserte)
+    hit_times = per_call_ns(d.miembro, hits)
+    miss_times = per_call_ns(d.miembro, misses)
+
+    if timing == "batch":
+        insert_ns = batch_ns(d.inserte, extra_words, repair=d.borre)
+        # sin repetidos: borrar dos veces la misma clave mediría un fallo
+        delete_ns = batch_ns(d.borre, list(dict.fromkeys(del_words)), repair=d.inserte)
+        search_hit_ns = batch_ns(d.miembro, hits)
+        search_miss_ns: float | None = batch_ns(d.miembro, misses) if misses else None
+        search_ns = (
+            (search_hit_ns * len(hits) + search_miss_ns * len(misses)) / (len(hits) + len(misses))
+            if search_miss_ns is not None else search_hit_ns
+        )
+    else:
+        search_times = hit_times + miss_times
+        insert_ns = sum(insert_times) / len(insert_times)
+        delete_ns = sum(delete_times) / len(delete_times)
+        search_ns = sum(search_times) / len(search_times)
+        search_hit_ns = sum(hit_times) / len(hit_times)
+        search_miss_ns = sum(miss_times) / len(miss_times) if miss_times else None
+
+    counters = count_ops(d, extra_words, del_words, hits, misses) if with_counters else {}
+
+    pt: int | None = None
+    if enable_print_large or n <= 100_000:
+        buf = io.StringIO()
+        def do_print():
+            s = str(d)  
+            buf.write(s)
+            buf.seek(0)
+            buf.truncate(0)
+        pt = time_ns(do_print)
+
+    dt = time_ns(lambda: d.limpie())
+    del d
+
+    return RunSample(
+        insert_ns=insert_ns,
+        delete_ns=delete_ns,
+        search_ns=search_ns,
+        search_hit_ns=search_hit_ns,
+        search_miss_ns=search_miss_ns,
+        print_ns=pt,
+        done_ns=dt,
+        memory_peak_bytes=peak,
+        retained_bytes=retained,
+        retained_bytes_with_keys=retained_with_keys,
+        counters=counters,
+        histograms={
+            "build": build_hist,
+            "insert": histogram_of(insert_times),
+            "delete": histogram_of(delete_times),
+            "search_hit": histogram_of(hit_times),
+            "search_miss": histogram_of(miss_times),
+        },
+    )
 
 
-        def bench_search_once(word: str) -> int:
-            return time_ns(lambda: d.miembro(word))
+def mean_counters(per_run: list[dict[str, dict[str, float]]]) -> dict[str, dict[str, float]]:
+    """Promedia los contadores por operación entre corridas."""
+    out: dict[str, dict[str, float]] = {}
+    for counters in per_run:
+        for op, values in counters.items():
+            acc = out.setdefault(op, {})
+            for k, v in values.items():
+                acc[k] = acc.get(k, 0.0) + v / len(per_run)
+    return out
 
 
-        search_times: list[int] = []
-        for i in range(trials):
-            if i % 2 == 0:
-                search_times.append(bench_search_once(search_pool[i]))
-            else:
-                search_times.append(bench_search_once(miss_words[i]))
-        search_avgs.append(sum(search_times) / len(search_times))
-
-        pt: int | None = None
-        if enable_print_large or n <= 100_000:
-            buf = io.StringIO()
-            def do_print():
-                s = str(d)  
-                buf.write(s)
-                buf.seek(0)
-                buf.truncate(0)
-            pt = time_ns(do_print)
-            print_times.append(pt)
-
-        dt = time_ns(lambda: d.limpie())
-        done_times.append(dt)
-        del d
-
-    def to_stats(values: list[float]) -> OpStats:
-        if len(values) == 1:
-            return OpStats(mean_ns=float(values[0]), stdev_ns=0.0)
-        return OpStats(mean_ns=float(stats.mean(values)), stdev_ns=float(stats.stdev(values)))
+def aggregate_runs(n: int, samples: list[RunSample]) -> SizeStats:
+    """Combina las corridas de un tamaño en medias, desviaciones y percentiles.
 
+    Las medias y desviaciones son sobre los promedios de cada corrida; los
+    percentiles salen de los histogramas de todas las corridas combinados.
+    """
+    merged: dict[str, LatencyHistogram] = {op: LatencyHistogram() for op in HISTOGRAM_OPS}
+    for sample in samples:
+        for op, h in sample.histograms.items():
+            merged[op].merge(h)
+    search_hist = LatencyHistogram()
+    search_hist.merge(merged["search_hit"])
+    search_hist.merge(merged["search_miss"])
+
+    def to_stats(values: list[float], hist: LatencyHistogram | None = None) -> OpStats:
+        if not values:
+            out = OpStats(mean_ns=0.0, stdev_ns=0.0)
+        elif len(values) == 1:
+            out = OpStats(mean_ns=float(values[0]), stdev_ns=0.0)
+        else:
+            out = OpStats(mean_ns=float(stats.mean(values)), stdev_ns=float(stats.stdev(values)))
+        if hist is not None and hist.total:
+            out.p50_ns = float(hist.percentile(50))
+            out.p90_ns = float(hist.percentile(90))
+            out.p99_ns = float(hist.percentile(99))
+            out.p999_ns = float(hist.percentile(99.9))
+            out.max_ns = float(hist.max_ns)
+        return out
+
+    print_times = [s.print_ns for s in samples if s.print_ns is not None]
+    done_times = [s.done_ns for s in samples]
+    memory_peaks = [s.memory_peak_bytes for s in samples]
     print_ns = float(stats.mean(print_times)) if print_times else None
     done_ns = float(stats.mean(done_times)) if done_times else 0.0
     memory_peak = int(stats.mean(memory_peaks)) if memory_peaks else 0
+    retained = int(stats.mean(s.retained_bytes for s in samples)) if samples else 0
+    retained_with_keys = int(stats.mean(s.retained_bytes_with_keys for s in samples)) if samples else 0
+    build = merged["build"]
 
     return SizeStats(
         n=n,
-        insert=to_stats(insert_avgs),
-        delete=to_stats(delete_avgs),
-        search=to_stats(search_avgs),
+        insert=to_stats([s.insert_ns for s in samples], merged["insert"]),
+        delete=to_stats([s.delete_ns for s in samples], merged["delete"]),
+        search=to_stats([s.search_ns for s in samples], search_hist),
+        search_hit=to_stats([s.search_hit_ns for s in samples], merged["search_hit"]),
+        search_miss=to_stats([s.search_miss_ns for s in samples if s.search_miss_ns is not None], merged["search_miss"]),
         print_ns=print_ns,
         done_ns=done_ns,
         memory_peak_bytes=memory_peak,
+        build=to_stats([build.mean()], build) if build.total else None,
+        histograms={op: h.to_dict() for op, h in merged.items() if h.total},
+        retained_bytes=retained,
+        retained_bytes_with_keys=retained_with_keys,
+        bytes_per_key=retained / n if n else 0.0,
+        bytes_per_key_with_keys=retained_with_keys / n if n else 0.0,
+        runs=len(samples),
+        counters=mean_counters([s.counters for s in samples]),
     )
 
 
+def benchmark_one_size(
+    name: str,
+    factory: Callable[[int], object],
+    n: int,
+    runs: int,
+    trials: int,
+    seed: int,
+    enable_print_large: bool,
+    timing: str = "batch",
+    workload: str = "uniforme",
+    budget: float = 0.0,
+    with_counters: bool = False,
+) -> SizeStats:
+    """Todas las corridas de un tamaño; ``budget`` (s) limita la celda completa."""
+    start = time.perf_counter()
+    samples: list[RunSample] = []
+    for r in range(runs):
+        remaining = budget - (time.perf_counter() - start) if budget else 0.0
+        if budget and remaining <= 0:
+            raise CellTimeout()
+        with deadline(remaining):
+            samples.append(
+                benchmark_one_run(
+                    factory, n, trials, run_seed(name, seed, r), enable_print_large, timing, workload,
+                    corpus_seed(seed, r), with_counters,
+                )
+            )
+    return aggregate_runs(n, samples)
+
+
+STRUCTURES = [
+    "ListaOrdenadaDinámica",
+    "ListaOrdenadaDesenrollada",
+    "ListaOrdenadaEstática",
+    "ListaOrdenadaEstáticaCompacta",
+    "TablaHashAbierta",
+    "TablaHashCompacta",
+    "AbbPunteros",
+    "ABBVectorHeap",
+    "TriePunteros",
+    "TrieArreglos",
+]
+
+
+def _factory_sized(cls: type, n: int) -> object:
+    return cls(max(100, n * 2))
+
+
+def _factory_hash(cls: type, _: int) -> object:
+    return cls(101)
+
+
+def _factory_plain(cls: type, _: int) -> object:
+    return cls()
+
+
 def build_factory(name: str) -> Callable[[int], object]:
-    def factory_lo_dinamica(_: int) -> object:
-        return ListaOrdenadaDinámica()
+    """Fábrica de ``name`` para un tamaño N.
 
-    def factory_lo_estatica(n: int) -> object:
-        cap = max(100, n * 2)
-        return ListaOrdenadaEstática(cap)
+    La clase se importa recién aquí (registro perezoso de ``src``), así que
+    cada proceso de ``--jobs`` carga solo las estructuras que le tocan. La
+    fábrica es un ``partial`` de funciones del módulo, así que se puede
+    enviar a otro proceso (``DiccionarioParticionado.construya``).
+    """
+    cls = cargue_clase(name)
+    if name in ("ListaOrdenadaEstática", "ListaOrdenadaEstáticaCompacta"):
+        return partial(_factory_sized, cls)
+    if name in ("TablaHashAbierta", "TablaHashCompacta"):
+        return partial(_factory_hash, cls)
+    return partial(_factory_plain, cls)
 
-    def factory_hash(_: int) -> object:
-        return TablaHashAbierta(101)
 
-    def factory_abb_ptr(_: int) -> object:
-        return AbbPunteros()
+def with_bloom(factory: Callable[[int], object]) -> Callable[[int], object]:
+    """Envuelve la fábrica para anteponer un filtro de Bloom dimensionado a N."""
+    def factory_bloom(n: int) -> object:
+        return DiccionarioConFiltro(factory(n), capacidad=max(1024, n))
 
-    def factory_abb_vec(_: int) -> object:
-        return ABBVectorHeap()
+    return factory_bloom
 
-    def factory_trie_ptr(_: int) -> object:
-        return TriePunteros()
 
-    def factory_trie_arr(_: int) -> object:
-        return TrieArreglos()
+def _pin_worker(cpus: multiprocessing.Queue) -> None:
+    """Inicializador de cada proceso: lo fija a un CPU propio."""
+    os.sched_setaffinity(0, {cpus.get()})
+
+
+def run_cell(
+    name: str,
+    bloom: bool,
+    n: int,
+    trials: int,
+    seed: int,
+    enable_print_large: bool,
+    timing: str,
+    workload: str,
+    budget: float = 0.0,
+    base_seed: int | None = None,
+    with_counters: bool = False,
+) -> RunSample:
+    """Una celda (estructura, tamaño, corrida) ejecutable en otro proceso."""
+    factory = build_factory(name)
+    if bloom:
+        factory = with_bloom(factory)
+    with deadline(budget):
+        return benchmark_one_run(
+            factory, n, trials, seed, enable_print_large, timing, workload, base_seed, with_counters,
+        )
+
+
+def run_matrix_parallel(
+    structures: list[str],
+    sizes: list[int],
+    runs: int,
+    trials: int,
+    seed: int,
+    bloom: bool,
+    enable_print_large: bool,
+    jobs: int,
+    pin: bool,
+    timing: str = "batch",
+    workload: str = "uniforme",
+    budget: float = 0.0,
+    skip: Iterable[tuple[str, int]] = (),
+    on_cell: Callable[[str, int, list[RunSample] | str], None] | None = None,
+    with_counters: bool = False,
+) -> dict[tuple[str, int], list[RunSample] | str]:
+    """Ejecuta todas las celdas en ``jobs`` procesos.
+
+    Devuelve, por (estructura, N), las corridas en orden o el nombre de la
+    excepción si alguna falló (``"timeout"`` si una corrida superó
+    ``budget``). Las semillas salen de ``run_seed`` en este proceso, así que
+    coinciden con las del modo secuencial. Los pares en ``skip`` no se
+    ejecutan, y ``on_cell`` se llama apenas un par termina todas sus
+    corridas (o falla la primera), para guardar avances.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    initializer = None
+    initargs: tuple = ()
+    if pin:
+        if hasattr(os, "sched_setaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+            jobs = min(jobs, len(cpus))
+            import multiprocessing
+
+            queue = multiprocessing.Queue()
+            for cpu in cpus[:jobs]:
+                queue.put(cpu)
+            initializer, initargs = _pin_worker, (queue,)
+        else:
+            print("  [--pin no disponible en esta plataforma; se ignora]")
+
+    skip = set(skip)
+    cells = [
+        (name, n, r)
+        for n in sorted(sizes, reverse=True) for name in structures if (name, n) not in skip
+        for r in range(runs)
+    ]
+    samples: dict[tuple[str, int, int], RunSample] = {}
+    errors: dict[tuple[str, int], str] = {}
+    pending = {(name, n): runs for name, n, r in cells}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        futures = {
+            pool.submit(
+                run_cell, name, bloom, n, trials, run_seed(name, seed, r), enable_print_large, timing, workload,
+                budget, corpus_seed(seed, r), with_counters,
+            ): (name, n, r)
+            for name, n, r in cells
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            name, n, r = futures[future]
+            try:
+                samples[(name, n, r)] = future.result()
+            except Exception as e:
+                errors.setdefault((name, n), error_label(e))
+            print(f"  [{done}/{len(cells)}] {name} N={n} corrida {r + 1}", flush=True)
+            if on_cell is None or (name, n) not in pending:
+                continue
+            pending[(name, n)] -= 1
+            if (name, n) in errors:
+                del pending[(name, n)]
+                on_cell(name, n, errors[(name, n)])
+            elif pending[(name, n)] == 0:
+                del pending[(name, n)]
+                on_cell(name, n, [samples[(name, n, i)] for i in range(runs)])
+
+    merged: dict[tuple[str, int], list[RunSample] | str] = {}
+    for name in structures:
+        for n in sizes:
+            if (name, n) in skip:
+                continue
+            if (name, n) in errors:
+                merged[(name, n)] = errors[(name, n)]
+            else:
+                merged[(name, n)] = [samples[(name, n, r)] for r in range(runs)]
+    return merged
+
+
+MIX_OPS = ("miembro", "inserte", "borre")
+# capacidad fija: descartan en silencio lo que no cabe, y un lazo por tiempo
+# no sabe de antemano cuántas inserciones hará
+FIXED_CAPACITY = ("ListaOrdenadaEstática", "ListaOrdenadaEstáticaCompacta")
+
+
+@dataclass
+class MixResult:
+    """Resultado de un lazo cerrado de operaciones mezcladas (``--mix``).
+
+    ``ops_per_s`` es el rendimiento sostenido (``ops / wall_s``);
+    ``busy_ops_per_s`` cuenta solo el tiempo dentro de las llamadas.
+    """
+    n: int
+    ops: int
+    busy_s: float
+    wall_s: float
+    ops_per_s: float
+    busy_ops_per_s: float
+    final_size: int
+    all: dict[str, float]
+    by_op: dict[str, dict[str, float]]
+    histograms: dict[str, dict] = field(default_factory=dict)
+
+
+def parse_mix(text: str) -> tuple[float, float, float]:
+    """``"90,8,2"`` -> pesos de (miembro, inserte, borre)."""
+    parts = [float(x) for x in text.split(",")]
+    if len(parts) != 3 or any(p < 0 for p in parts) or not sum(parts):
+        raise ValueError("--mix espera tres pesos no negativos: miembro,inserte,borre")
+    return parts[0], parts[1], parts[2]
+
+
+def benchmark_mix(
+    factory: Callable[[int], object],
+    n: int,
+    seed: int,
+    mix: tuple[float, float, float],
+    duration_s: float,
+    workload: str = "uniforme",
+    chunk: int = 1024,
+    base_seed: int | None = None,
+) -> MixResult:
+    """Lazo cerrado: cada operación empieza cuando termina la anterior.
+
+    Construye la base sin medir y luego, durante ``duration_s`` segundos,
+    elige cada operación según los pesos de ``mix``. ``miembro`` busca una
+    clave presente o una ausente con igual probabilidad, ``inserte`` usa una
+    clave nueva y ``borre`` quita una presente. ``ops_per_s`` es sobre
+    ``wall_s``, que incluye la elección de claves y el resto del arnés;
+    ``busy_ops_per_s`` deja eso fuera.
+
+    Si al final el tamaño no coincide con las claves presentes (la
+    estructura descartó inserciones), lanza ``RuntimeError``.
+    """
+    rng = random.Random(seed)
+    wl = make_workload(workload, n, rng, base_seed)
+    d = factory(n)
+    present = wl.base()
+    for w in present:
+        d.inserte(w)
+    known = set(present)
+    pool: list[str] = []
+
+    def fresh_word() -> str:
+        while not pool:
+            pool.extend(w for w in wl.fresh(chunk) if w not in known)
+        w = pool.pop()
+        known.add(w)
+        return w
+
+    calls = {"miembro": d.miembro, "inserte": d.inserte, "borre": d.borre}
+    hists = {op: LatencyHistogram() for op in MIX_OPS}
+    clock = time.perf_counter_ns
+    busy_ns = 0
+    start = clock()
+    stop_ns = start + int(duration_s * 1e9)
+    now = start
+    while now < stop_ns:
+        for op in rng.choices(MIX_OPS, weights=mix, k=chunk):
+            if op == "inserte":
+                w = fresh_word()
+                present.append(w)
+            elif op == "borre" and present:
+                i = rng.randrange(len(present))
+                present[i], present[-1] = present[-1], present[i]
+                w = present.pop()
+            elif op == "miembro" and present and rng.random() < 0.5:
+                w = present[rng.randrange(len(present))]
+            else:
+                op = "miembro"
+                w = fresh_word()
+            fn = calls[op]
+            t0 = clock()
+            fn(w)
+            now = clock()
+            dt = now - t0
+            busy_ns += dt
+            hists[op].record(dt)
+            if now >= stop_ns:
+                break
+    wall_ns = clock() - start
+    if len(d) != len(present):  # type: ignore[arg-type]
+        raise RuntimeError(f"{len(d)} claves al final, se esperaban {len(present)}")  # type: ignore[arg-type]
+
+    total = LatencyHistogram()
+    for h in hists.values():
+        total.merge(h)
+    return MixResult(
+        n=n,
+        ops=total.total,
+        busy_s=busy_ns / 1e9,
+        wall_s=wall_ns / 1e9,
+        ops_per_s=total.total / (wall_ns / 1e9) if wall_ns else 0.0,
+        busy_ops_per_s=total.total / (busy_ns / 1e9) if busy_ns else 0.0,
+        final_size=len(d),  # type: ignore[arg-type]
+        all=total.summary(),
+        by_op={op: h.summary() for op, h in hists.items() if h.total},
+        histograms={op: h.to_dict() for op, h in hists.items() if h.total},
+    )
+
+
+def run_mix_mode(args: argparse.Namespace, structures: list[str], sizes: list[int], ts: str) -> None:
+    mix = parse_mix(args.mix)
+    print(f"Modo --mix {args.mix} (miembro,inserte,borre), {args.mix_duration:g} s por celda\n")
+    results: dict[str, list[dict]] = {}
+    skipped: list[dict] = []
+    for name in structures:
+        print(f"==> {name}")
+        factory = build_factory(name)
+        if args.bloom:
+            factory = with_bloom(factory)
+        results[name] = []
+        if name in FIXED_CAPACITY and mix[1]:
+            print("  - omitida: capacidad fija y la mezcla inserta")
+            skipped.extend({"name": name, "n": n, "error": "capacidad fija"} for n in sizes)
+            continue
+        for n in sizes:
+            try:
+                r = benchmark_mix(
+                    factory, n, run_seed(name, 12345, 0), mix, args.mix_duration, args.workload,
+                    base_seed=corpus_seed(12345, 0),
+                )
+            except Exception as e:
+                print(f"  - N={n}: [omitido por error: {type(e).__name__}]")
+                skipped.append({"name": name, "n": n, "error": type(e).__name__})
+                continue
+            results[name].append(asdict(r))
+            print(
+                f"  - N={n}: {r.ops_per_s:,.0f} ops/s ({r.busy_ops_per_s:,.0f} en llamadas, {r.ops} ops), p50≈{r.all['p50']/1e3:.1f}µs, "
+                f"p99≈{r.all['p99']/1e3:.1f}µs, max≈{r.all['max']/1e3:.1f}µs"
+            )
+
+    json_path = os.path.join(args.out, f"mix_{ts}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "mix": dict(zip(MIX_OPS, mix)), "duration_s": args.mix_duration, "bloom": bool(args.bloom),
+            "workload": args.workload, "skipped": skipped, "results": results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados JSON: {json_path}")
+
+    md_lines = [f"# Carga mixta {args.mix} (miembro, inserte, borre) ({ts})\n"]
+    md_lines.append(f"Lazo cerrado de {args.mix_duration:g} s por celda, carga `{args.workload}`; ops/s sostenidas (sobre el tiempo de pared), "
+                    "ops/s en llamadas sin el arnés, latencias en ns.\n")
+    md_lines.append("| estructura | N | ops/s | ops/s en llamadas | p50 | p90 | p99 | p99.9 | max | p99 miembro | p99 inserte | p99 borre |")
+    md_lines.append("|:---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
+    for name, rows in results.items():
+        for r in rows:
+            a = r["all"]
+            per_op = " | ".join(str(int(r["by_op"][op]["p99"])) if op in r["by_op"] else "-" for op in MIX_OPS)
+            md_lines.append(
+                f"| {name} | {r['n']} | {r['ops_per_s']:.0f} | {r['busy_ops_per_s']:.0f} | {int(a['p50'])} | {int(a['p90'])} | "
+                f"{int(a['p99'])} | {int(a['p99.9'])} | {int(a['max'])} | {per_op} |"
+            )
+    if skipped:
+        md_lines.append("\n## Celdas omitidas\n")
+        md_lines.extend(f"- {sk['name']} N={sk['n']}: {sk['error']}" for sk in skipped)
+    md_path = os.path.join(args.out, f"mix_{ts}.md")
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(md_lines) + "\n")
+    print(f"Resumen Markdown: {md_path}")
+
+
+CURVE_OPS = ("insert", "delete", "search_hit", "search_miss")
+
+# orden teórico por operación (insert, delete, search) y exponente esperado
+# de la pendiente log–log; O(log n), O(1) y O(L) con L fijo se ven planos
+ORDER_EXPONENT = {"O(n)": 1.0, "O(log n)": 0.0, "O(1)": 0.0, "O(L)": 0.0}
+_LIST = {"insert": "O(n)", "delete": "O(n)", "search": "O(n)"}
+_SORTED_ARRAY = {"insert": "O(n)", "delete": "O(n)", "search": "O(log n)"}
+_HASH = {"insert": "O(1)", "delete": "O(1)", "search": "O(1)"}
+_TREE = {"insert": "O(log n)", "delete": "O(log n)", "search": "O(log n)"}
+_TRIE = {"insert": "O(L)", "delete": "O(L)", "search": "O(L)"}
+EXPECTED_ORDERS: dict[str, dict[str, str]] = {
+    "ListaOrdenadaDinámica": _LIST,
+    "ListaOrdenadaDesenrollada": _LIST,
+    "ListaOrdenadaEstática": _SORTED_ARRAY,
+    "ListaOrdenadaEstáticaCompacta": _SORTED_ARRAY,
+    "TablaHashAbierta": _HASH,
+    "TablaHashCompacta": _HASH,
+    "AbbPunteros": _TREE,
+    "ABBVectorHeap": _TREE,
+    "TriePunteros": _TRIE,
+    "TrieArreglos": _TRIE,
+}
+
+
+def expected_order(name: str, op: str) -> str:
+    return EXPECTED_ORDERS[name]["search" if op.startswith("search") else op]
+
+
+def loglog_slope(ns: list[int], times: list[float]) -> float | None:
+    """Pendiente por mínimos cuadrados de log(tiempo) contra log(N)."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(ns, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def run_curve_mode(args: argparse.Namespace, structures: list[str], ts: str) -> None:
+    """Barrido geométrico de N con presupuesto de tiempo y ajuste log–log.
+
+    Para cada estructura se mide una corrida por punto N = 2^a … 2^b. Si un
+    punto superó ``--curve-budget`` segundos, o si al proyectarlo (la
+    construcción con invariantes O(n) crece como N²) el siguiente lo
+    superaría, el barrido de esa estructura se corta ahí. La pendiente se
+    ajusta con los puntos desde ``--curve-fit-min`` (los N chicos quedan
+    dominados por costos fijos) y se compara con el exponente teórico.
+    """
+    lo, hi = (int(x) for x in args.curve.split(","))
+    ns = [1 << k for k in range(lo, hi + 1)]
+    print(f"Modo --curve N=2^{lo}…2^{hi}, presupuesto {args.curve_budget:g} s por punto\n")
+    report: dict[str, dict] = {}
+    deviations = 0
+    for name in structures:
+        print(f"==> {name}")
+        factory = build_factory(name)
+        if args.bloom:
+            factory = with_bloom(factory)
+        points: list[dict] = []
+        stopped: str | None = None
+        last: tuple[int, float] | None = None
+        for n in ns:
+            if last is not None and last[1] * (n / last[0]) ** 2 > args.curve_budget:
+                stopped = f"proyección > {args.curve_budget:g} s en N={n}"
+                break
+            t0 = time.perf_counter()
+            try:
+                sample = benchmark_one_run(
+                    factory, n, args.trials, run_seed(name, 12345, 0), False, args.timing, args.workload,
+                    corpus_seed(12345, 0),
+                )
+            except Exception as e:
+                stopped = f"{type(e).__name__} en N={n}"
+                break
+            elapsed = time.perf_counter() - t0
+            points.append({
+                "n": n,
+                "elapsed_s": elapsed,
+                "insert": sample.insert_ns,
+                "delete": sample.delete_ns,
+                "search_hit": sample.search_hit_ns,
+                "search_miss": sample.search_miss_ns or 0.0,
+            })
+            last = (n, elapsed)
+            if elapsed > args.curve_budget:
+                stopped = f"N={n} tardó {elapsed:.1f} s"
+                break
+        fit_points = [p for p in points if p["n"] >= args.curve_fit_min]
+        if len(fit_points) < 3:
+            fit_points = points[-3:]
+        fits: dict[str, dict] = {}
+        for op in CURVE_OPS:
+            slope = loglog_slope([p["n"] for p in fit_points], [p[op] for p in fit_points])
+            order = expected_order(name, op)
+            expected = ORDER_EXPONENT[order]
+            deviation = slope is not None and abs(slope - expected) > args.curve_tolerance
+            deviations += deviation
+            fits[op] = {"order": order, "expected": expected, "slope": slope, "deviation": deviation}
+            shown = f"{slope:.2f}" if slope is not None else "-"
+            flag = "  <-- desvío" if deviation else ""
+            print(f"    {op:<12} esperado {order:<9} (≈{expected:.0f}) empírico {shown:>5}{flag}")
+        if stopped:
+            print(f"    [barrido cortado: {stopped}]")
+        report[name] = {"points": points, "fits": fits, "stopped": stopped}
+
+    json_path = os.path.join(args.out, f"curve_{ts}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "range": [lo, hi], "budget_s": args.curve_budget, "fit_min": args.curve_fit_min,
+            "tolerance": args.curve_tolerance, "timing": args.timing, "workload": args.workload,
+            "bloom": bool(args.bloom), "results": report,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados JSON: {json_path}")
+
+    md_lines = [f"# Curvas de crecimiento ({ts})\n"]
+    md_lines.append(
+        f"Pendiente log–log de la media por operación, ajustada con N ≥ {args.curve_fit_min}; "
+        f"se marca desvío si difiere del exponente teórico en más de {args.curve_tolerance:g}.\n"
+    )
+    md_lines.append("| estructura | operación | orden teórico | exponente esperado | exponente empírico | N máximo | |")
+    md_lines.append("|:---|:---|:---|---:|---:|---:|:---|")
+    for name, r in report.items():
+        top = r["points"][-1]["n"] if r["points"] else "-"
+        for op, fit in r["fits"].items():
+            slope = f"{fit['slope']:.2f}" if fit["slope"] is not None else "-"
+            md_lines.append(
+                f"| {name} | {op} | {fit['order']} | {fit['expected']:.0f} | {slope} | {top} | "
+                f"{'desvío' if fit['deviation'] else ''} |"
+            )
+    md_path = os.path.join(args.out, f"curve_{ts}.md")
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(md_lines) + "\n")
+    print(f"Resumen Markdown: {md_path}")
+    print(f"\n{deviations} desvío(s) respecto del orden teórico.")
+
+
+PROFILE_OPS = ("build", "insert", "delete", "search_hit", "search_miss")
+
+
+def frame_label(func: tuple[str, int, str]) -> str:
+    """``archivo.py:línea(función)``, o solo el nombre para las integradas."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def drop_profiler_frames(st: pstats.Stats) -> pstats.Stats:
+    """Quita las llamadas a ``Profile.disable`` que ``profile_cell`` hace entre operaciones."""
+    entries = st.stats  # type: ignore[attr-defined]
+    for func in [f for f in entries if f[0] == "~" and "_lsprof.Profiler" in f[2]]:
+        st.total_tt -= entries.pop(func)[2]  # type: ignore[attr-defined]
+        for other in entries.values():
+            other[4].pop(func, None)
+    return st
+
+
+def collapsed_stacks(st: pstats.Stats, max_depth: int = 64) -> list[str]:
+    """Pilas plegadas (``a;b;c microsegundos``) para herramientas de flamegraph.
+
+    cProfile solo guarda aristas llamador → llamado, no pilas completas, así
+    que las pilas se reconstruyen desde las raíces repartiendo el tiempo de
+    cada función entre sus llamados según la arista (como hace ``flameprof``).
+    Los ciclos de recursión se cortan en la primera repetición.
+    """
+    entries = st.stats  # type: ignore[attr-defined]
+    callees: dict[tuple, list[tuple[tuple, float]]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [f for f, e in entries.items() if not e[4]]
+    folded: dict[str, float] = {}
+
+    def walk(func: tuple, total: float, stack: list[str]) -> None:
+        _, _, tt, ct, _ = entries[func]
+        stack = stack + [frame_label(func)]
+        key = ";".join(stack)
+        folded[key] = folded.get(key, 0.0) + (total * tt / ct if ct else 0.0)
+        if len(stack) >= max_depth or not ct:
+            return
+        for child, edge_ct in callees.get(func, []):
+            label = frame_label(child)
+            if label in stack or not edge_ct:
+                continue
+            walk(child, total * edge_ct / ct, stack)
+
+    for root in roots:
+        walk(root, entries[root][3], [])
+    return [f"{k} {round(v * 1e6)}" for k, v in folded.items() if round(v * 1e6) > 0]
 
-    mapping = {
-        "ListaOrdenadaDinámica": factory_lo_dinamica,
-        "ListaOrdenadaEstática": factory_lo_estatica,
-        "TablaHashAbierta": factory_hash,
-        "AbbPunteros": factory_abb_ptr,
-        "ABBVectorHeap": factory_abb_vec,
-        "TriePunteros": factory_trie_ptr,
-        "TrieArreglos": factory_trie_arr,
-    }
-    return mapping[name]
+
+def top_self_time(st: pstats.Stats, top: int) -> list[dict]:
+    """Las ``top`` funciones con más tiempo propio (sin contar sus llamados)."""
+    rows = [
+        {"function": frame_label(func), "calls": nc, "self_s": tt, "cumulative_s": ct}
+        for func, (_, nc, tt, ct, _) in st.stats.items()  # type: ignore[attr-defined]
+    ]
+    rows.sort(key=lambda r: r["self_s"], reverse=True)
+    return rows[:top]
+
+
+def profile_cell(
+    op: Callable[[str], object],
+    words: list[str],
+    repair: Callable[[str], object] | None = None,
+) -> cProfile.Profile:
+    """Perfila ``op`` sobre cada palabra; ``repair`` corre fuera del perfil."""
+    import cProfile
+
+    prof = cProfile.Profile()
+    for w in words:
+        prof.enable()
+        try:
+            op(w)
+        finally:
+            # un CellTimeout a media llamada no debe dejar el perfilador activo
+            prof.disable()
+        if repair is not None:
+            repair(w)
+    return prof
+
+
+def profile_one_size(
+    factory: Callable[[int], object],
+    n: int,
+    trials: int,
+    seed: int,
+    workload: str = "uniforme",
+    base_seed: int | None = None,
+) -> dict[str, cProfile.Profile]:
+    """Un perfil por operación con las mismas palabras que ``benchmark_one_run``."""
+    rng = random.Random(seed)
+    wl = make_workload(workload, n, rng, base_seed)
+    base_words = wl.base()
+    base_set = set(base_words)
+    extra_words = [w for w in wl.fresh(trials * 2) if w not in base_set][:trials]
+    d = factory(n)
+    profiles = {"build": profile_cell(d.inserte, base_words)}
+    del_words = list(dict.fromkeys(w for w in wl.pick(base_words, trials) if w in base_set))
+    miss_words = [w for w in wl.fresh(trials) if w not in base_set][:trials]
+    profiles["insert"] = profile_cell(d.inserte, extra_words, repair=d.borre)
+    profiles["delete"] = profile_cell(d.borre, del_words, repair=d.inserte)
+    profiles["search_hit"] = profile_cell(d.miembro, wl.pick(base_words, trials))
+    profiles["search_miss"] = profile_cell(d.miembro, miss_words)
+    return profiles
+
+
+def run_profile_mode(args: argparse.Namespace, structures: list[str], sizes: list[int], ts: str) -> None:
+    """Corre cada celda (estructura, N, operación) bajo ``cProfile``.
+
+    Por celda guarda el ``.pstats`` (para ``pstats``/``snakeviz``) y un
+    ``.folded`` con pilas plegadas (para ``flamegraph.pl``, speedscope o
+    inferno) en ``perfil_<fecha>/``, y resume las funciones con más tiempo
+    propio en ``profile_<fecha>.md``. Los tiempos quedan inflados por el
+    propio perfilador: sirven para ver dónde se va el tiempo, no para
+    compararlos con ``bench_*.json``.
+    """
+    import pstats
+
+    folder = os.path.join(args.out, f"perfil_{ts}")
+    os.makedirs(folder, exist_ok=True)
+    print(f"Modo --profile: {args.trials} llamadas por operación, top {args.profile_top} por celda\n")
+    report: dict[str, list[dict]] = {}
+    skipped: list[dict] = []
+    for name in structures:
+        print(f"==> {name}")
+        factory = build_factory(name)
+        if args.bloom:
+            factory = with_bloom(factory)
+        report[name] = []
+        for n in sizes:
+            try:
+                with deadline(args.budget):
+                    profiles = profile_one_size(
+                        factory, n, args.trials, run_seed(name, 12345, 0), args.workload, corpus_seed(12345, 0),
+                    )
+            except Exception as e:
+                print(f"  - N={n}: [omitido: {error_label(e)}]")
+                skipped.append({"name": name, "n": n, "error": error_label(e)})
+                continue
+            for op in PROFILE_OPS:
+                st = drop_profiler_frames(pstats.Stats(profiles[op]))
+                base = os.path.join(folder, f"{name}_N{n}_{op}")
+                st.dump_stats(base + ".pstats")
+                with open(base + ".folded", "w", encoding="utf-8") as f:
+                    f.write("\n".join(collapsed_stacks(st)) + "\n")
+                top = top_self_time(st, args.profile_top)
+                report[name].append({
+                    "n": n, "op": op, "total_s": st.total_tt,  # type: ignore[attr-defined]
+                    "pstats": os.path.relpath(base + ".pstats", args.out),
+                    "folded": os.path.relpath(base + ".folded", args.out),
+                    "top": top,
+                })
+                lead = top[0]["function"] if top else "-"
+                print(f"  - N={n} {op:<12} {st.total_tt * 1e3:>9.2f} ms  más tiempo propio: {lead}")  # type: ignore[attr-defined]
+
+    json_path = os.path.join(args.out, f"profile_{ts}.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "trials": args.trials, "top": args.profile_top, "bloom": bool(args.bloom),
+            "workload": args.workload, "skipped": skipped, "results": report,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados JSON: {json_path}")
+
+    md_lines = [f"# Perfiles por celda ({ts})\n"]
+    md_lines.append(
+        f"cProfile sobre {args.trials} llamadas por operación (`build` = construir N), carga `{args.workload}`. "
+        "Tiempos en ms con el perfilador activo; `propio` excluye lo gastado en funciones llamadas. "
+        "Las pilas plegadas (`.folded`) se abren con `flamegraph.pl`, speedscope o inferno.\n"
+    )
+    for name, cells in report.items():
+        md_lines.append(f"## {name}\n")
+        for cell in cells:
+            md_lines.append(f"### N={cell['n']} · {cell['op']} ({cell['total_s'] * 1e3:.2f} ms)\n")
+            md_lines.append(f"`{cell['pstats']}` · `{cell['folded']}`\n")
+            md_lines.append("| función | llamadas | propio (ms) | acumulado (ms) |")
+            md_lines.append("|:---|---:|---:|---:|")
+            for row in cell["top"]:
+                md_lines.append(
+                    f"| `{row['function']}` | {row['calls']} | {row['self_s'] * 1e3:.3f} | {row['cumulative_s'] * 1e3:.3f} |"
+                )
+            md_lines.append("")
+    if skipped:
+        md_lines.append("## Celdas omitidas\n")
+        md_lines.extend(f"- {sk['name']} N={sk['n']}: {sk['error']}" for sk in skipped)
+    md_path = os.path.join(args.out, f"profile_{ts}.md")
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(md_lines) + "\n")
+    print(f"Resumen Markdown: {md_path}")
+
+
+def size_stats_from_dict(data: dict) -> SizeStats:
+    """Inversa de ``asdict`` para un ``SizeStats`` leído de JSON."""
+    data = dict(data)
+    for key in ("insert", "delete", "search", "search_hit", "search_miss", "build"):
+        if data.get(key) is not None:
+            data[key] = OpStats(**data[key])
+    return SizeStats(**data)
+
+
+class Checkpoint:
+    """Avance de una corrida larga: una línea JSON por celda (estructura, N) terminada.
+
+    La primera línea guarda la configuración; con ``--resume`` se vuelve a
+    abrir el mismo archivo, se saltan las celdas ya anotadas y se sigue
+    agregando al final. Cada línea se vacía al disco apenas se escribe, así
+    que una caída pierde a lo sumo la celda en curso.
+
+    Cada celda anota las semillas de sus corridas (``seeds_of``); al retomar
+    deben coincidir con las que se usarían ahora, para no mezclar corridas
+    sobre corpus distintos.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        settings: dict,
+        resume: bool = False,
+        seeds_of: Callable[[str, int], list[int]] | None = None,
+    ) -> None:
+        self.path = path
+        self.done: dict[tuple[str, int], dict] = {}
+        self.__seeds_of = seeds_of
+        if resume:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f if line.strip()]
+            saved = lines[0].get("settings", {}) if lines else {}
+            if saved != settings:
+                raise ValueError(f"La configuración no coincide con la de {path}: {saved}")
+            for rec in lines[1:]:
+                name, n = rec["name"], int(rec["n"])
+                if seeds_of is not None and rec.get("seeds") != seeds_of(name, n):
+                    raise ValueError(
+                        f"Las semillas de {name} N={n} en {path} no coinciden con las actuales: {rec.get('seeds')}"
+                    )
+                self.done[(name, n)] = rec
+            self.__file = open(path, "a", encoding="utf-8")
+        else:
+            self.__file = open(path, "w", encoding="utf-8")
+            self.__write({"settings": settings})
+
+    def record(self, name: str, n: int, ss: SizeStats | None, error: str | None = None) -> None:
+        rec = {"name": name, "n": n, "error": error, "stats": asdict(ss) if ss is not None else None}
+        if self.__seeds_of is not None:
+            rec["seeds"] = self.__seeds_of(name, n)
+        self.done[(name, n)] = rec
+        self.__write(rec)
+
+    def stats(self, name: str, n: int) -> SizeStats | None:
+        rec = self.done.get((name, n))
+        return size_stats_from_dict(rec["stats"]) if rec and rec["stats"] else None
+
+    def error(self, name: str, n: int) -> str | None:
+        rec = self.done.get((name, n))
+        return rec["error"] if rec else None
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __write(self, rec: dict) -> None:
+        self.__file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+
+
+def print_size_summary(ss: SizeStats) -> None:
+    print(
+        f"    insert≈{ss.insert.mean_ns/1e6:.3f}ms, delete≈{ss.delete.mean_ns/1e6:.3f}ms, "
+        f"search≈{ss.search.mean_ns/1e6:.3f}ms (hit≈{ss.search_hit.mean_ns/1e6:.3f}ms, "
+        f"miss≈{ss.search_miss.mean_ns/1e6:.3f}ms)"
+    )
+    print(
+        f"    retenida≈{ss.retained_bytes/1024/1024:.2f} MiB ({ss.bytes_per_key:.1f} B/clave, "
+        f"{ss.bytes_per_key_with_keys:.1f} con claves), pico≈{ss.memory_peak_bytes/1024/1024:.2f} MiB"
+    )
+    if ss.build is not None:
+        print(
+            f"    p99: insert≈{ss.insert.p99_ns/1e3:.1f}µs, delete≈{ss.delete.p99_ns/1e3:.1f}µs, "
+            f"search≈{ss.search.p99_ns/1e3:.1f}µs; build max≈{ss.build.max_ns/1e3:.1f}µs"
+        )
 
 
 def analyze_ranges(results: list[StructureResult]) -> str:
@@ -294,8 +1356,29 @@ def main(argv: list[str] | None = None) -> None:
     parser.add_argument("--quick", action="store_true")
     parser.add_argument("--out", type=str, default="resultados")
     parser.add_argument("--print-large", action="store_true")
+    parser.add_argument("--bloom", action="store_true")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--pin", action="store_true")
+    parser.add_argument("--timing", choices=("batch", "single"), default="batch")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="uniforme")
+    parser.add_argument("--corpus-cache", type=str, default="")
+    parser.add_argument("--mix", type=str, default="")
+    parser.add_argument("--mix-duration", type=float, default=2.0)
+    parser.add_argument("--curve", type=str, default="")
+    parser.add_argument("--curve-budget", type=float, default=30.0)
+    parser.add_argument("--curve-fit-min", type=int, default=1024)
+    parser.add_argument("--curve-tolerance", type=float, default=0.3)
+    parser.add_argument("--budget", type=float, default=0.0)
+    parser.add_argument("--resume", type=str, default="")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-top", type=int, default=15)
+    parser.add_argument("--count-ops", action="store_true")
     args = parser.parse_args(argv)
 
+    if args.corpus_cache:
+        # por variable de entorno para que también la vean los procesos de --jobs
+        os.environ[CORPUS_CACHE_ENV] = os.path.abspath(args.corpus_cache)
+
     if args.quick:
         args.sizes = "100,50000"
         args.runs = min(args.runs, 3) if args.runs else 3
@@ -308,71 +1391,175 @@ def main(argv: list[str] | None = None) -> None:
 
     os.makedirs(args.out, exist_ok=True)
 
-    structures = [
-        "ListaOrdenadaDinámica",
-        "ListaOrdenadaEstática",
-        "TablaHashAbierta",
-        "AbbPunteros",
-        "ABBVectorHeap",
-        "TriePunteros",
-        "TrieArreglos",
-    ]
+    structures = list(STRUCTURES)
 
-    print("Iniciando análisis de rendimiento...\n")
-    results: list[StructureResult] = []
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if args.mix:
+        run_mix_mode(args, structures, sizes, ts)
+        return
+    if args.curve:
+        run_curve_mode(args, structures, ts)
+        return
+    if args.profile:
+        run_profile_mode(args, structures, sizes, ts)
+        return
+
+    settings = {
+        "runs": args.runs, "trials": args.trials, "bloom": bool(args.bloom), "timing": args.timing,
+        "workload": args.workload, "print_large": bool(args.print_large), "seed": 12345,
+        "count_ops": bool(args.count_ops),
+    }
+
+    def seeds_of(name: str, n: int) -> list[int]:
+        return [run_seed(name, 12345, r) for r in range(args.runs)]
+
+    if args.resume:
+        m = re.search(r"bench_(\d{8}_\d{6})\.partial\.jsonl$", args.resume)
+        if m:
+            ts = m.group(1)
+        try:
+            checkpoint = Checkpoint(args.resume, settings, resume=True, seeds_of=seeds_of)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(f"Reanudando {args.resume}: {len(checkpoint.done)} celdas ya terminadas")
+    else:
+        checkpoint = Checkpoint(os.path.join(args.out, f"bench_{ts}.partial.jsonl"), settings, seeds_of=seeds_of)
+    print(f"Avance incremental: {checkpoint.path}")
+
+    def finish_cell(name: str, n: int, cell: list[RunSample] | str) -> None:
+        print(f"==> {name} N={n} (runs={args.runs}, trials={args.trials})")
+        if isinstance(cell, str):
+            print(f"    [omitido: {cell}]")
+            checkpoint.record(name, n, None, cell)
+            return
+        ss = aggregate_runs(n, cell)
+        print_size_summary(ss)
+        checkpoint.record(name, n, ss)
+
+    print("Iniciando análisis de rendimiento...\n")
+    if args.jobs > 1:
+        todo = sum((name, n) not in checkpoint.done for name in structures for n in sizes)
+        print(f"Ejecutando {todo * args.runs} celdas en {args.jobs} procesos...")
+        run_matrix_parallel(
+            structures, sizes, args.runs, args.trials, 12345,
+            bool(args.bloom), bool(args.print_large), args.jobs, bool(args.pin), args.timing,
+            args.workload, args.budget, skip=checkpoint.done.keys(), on_cell=finish_cell,
+            with_counters=bool(args.count_ops),
+        )
+    else:
+        if args.pin:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+            else:
+                print("  [--pin no disponible en esta plataforma; se ignora]")
+        for name in structures:
+            factory = build_factory(name)
+            if args.bloom:
+                factory = with_bloom(factory)
+            timed_out_at: int | None = None
+            for n in sorted(sizes):
+                if (name, n) in checkpoint.done:
+                    if checkpoint.error(name, n) == "timeout":
+                        timed_out_at = n
+                    continue
+                if timed_out_at is not None:
+                    # un N mayor solo tardaría más
+                    finish_cell(name, n, f"timeout (N={timed_out_at} ya lo superó)")
+                    continue
+                try:
+                    ss = benchmark_one_size(
+                        name,
+                        factory,
+                        n=n,
+                        runs=args.runs,
+                        trials=args.trials,
+                        seed=12345,
+                        enable_print_large=bool(args.print_large),
+                        timing=args.timing,
+                        workload=args.workload,
+                        budget=args.budget,
+                        with_counters=bool(args.count_ops),
+                    )
+                except Exception as e:
+                    if isinstance(e, CellTimeout):
+                        timed_out_at = n
+                    finish_cell(name, n, error_label(e))
+                    continue
+                print(f"==> {name} N={n} (runs={args.runs}, trials={args.trials})")
+                print_size_summary(ss)
+                checkpoint.record(name, n, ss)
+    checkpoint.close()
 
+    results: list[StructureResult] = []
+    skipped: list[dict] = []
     for name in structures:
-        print(f"==> {name}")
-        factory = build_factory(name)
         sizes_stats: list[SizeStats] = []
         for n in sizes:
-            print(f"  - N={n} (runs={args.runs}, trials={args.trials})...")
-            try:
-                ss = benchmark_one_size(
-                    name,
-                    factory,
-                    n=n,
-                    runs=args.runs,
-                    trials=args.trials,
-                    seed=12345,
-                    enable_print_large=bool(args.print_large), 
-                )
+            ss = checkpoint.stats(name, n)
+            if ss is not None:
                 sizes_stats.append(ss)
-                print(
-                    f"    insert≈{ss.insert.mean_ns/1e6:.3f}ms, delete≈{ss.delete.mean_ns/1e6:.3f}ms, "
-                    f"search≈{ss.search.mean_ns/1e6:.3f}ms, mem≈{ss.memory_peak_bytes/1024/1024:.2f} MiB"
-                )
-            except MemoryError:
-                print("    [omitido por falta de memoria en este tamaño]")
-                continue
-            except Exception as e:
-                print(f"    [omitido por error: {type(e).__name__}]")
-                continue
+            elif (name, n) in checkpoint.done:
+                skipped.append({"name": name, "n": n, "error": checkpoint.error(name, n)})
         results.append(StructureResult(name=name, sizes=sizes_stats))
 
     json_path = os.path.join(args.out, f"bench_{ts}.json")
     with open(json_path, "w", encoding="utf-8") as f:
-        json.dump({"results": [
+        json.dump({"bloom": bool(args.bloom), "jobs": args.jobs, "timing": args.timing, "workload": args.workload,
+                   "owned_key_copies": True, "skipped": skipped, "results": [
             {"name": r.name, "sizes": [asdict(s) for s in r.sizes]} for r in results
         ]}, f, ensure_ascii=False, indent=2)
     print(f"\nResultados JSON: {json_path}")
 
     md_lines: list[str] = []
     md_lines.append(f"# Resultados de rendimiento ({ts})\n")
-    md_lines.append("Notas: tiempos en nanosegundos promedio por operación (media de corridas).\n")
+    md_lines.append(f"Notas: tiempos en nanosegundos promedio por operación (media de corridas, medición `{args.timing}`, carga `{args.workload}`). "
+                    "`retenida` es `memoria_bytes()` tras construir (sin las hileras; B/clave se da con y sin ellas); "
+                    "`pico` es el máximo de tracemalloc al construir, que incluye asignaciones temporales. "
+                    "Todas las estructuras reciben una copia propia de cada clave al construir, así que `pico` incluye "
+                    "las hileras también en las que solo guardan referencias.\n")
 
     for r in results:
         md_lines.append(f"## {r.name}\n")
-        md_lines.append("| N | insert (ns) | delete (ns) | search (ns) | print (ns) | done (ns) | mem pico (MiB) |")
-        md_lines.append("|---:|---:|---:|---:|---:|---:|---:|")
+        md_lines.append("| N | insert (ns) | delete (ns) | search (ns) | search hit (ns) | search miss (ns) | print (ns) | done (ns) | retenida (MiB) | B/clave | B/clave con claves | pico (MiB) |")
+        md_lines.append("|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
         for s in r.sizes:
             md_lines.append(
                 f"| {s.n} | {int(s.insert.mean_ns)} ± {int(s.insert.stdev_ns)} | "
                 f"{int(s.delete.mean_ns)} ± {int(s.delete.stdev_ns)} | {int(s.search.mean_ns)} ± {int(s.search.stdev_ns)} | "
-                f"{int(s.print_ns) if s.print_ns is not None else '-'} | {int(s.done_ns)} | {s.memory_peak_bytes/1024/1024:.2f} |"
+                f"{int(s.search_hit.mean_ns)} ± {int(s.search_hit.stdev_ns)} | {int(s.search_miss.mean_ns)} ± {int(s.search_miss.stdev_ns)} | "
+                f"{int(s.print_ns) if s.print_ns is not None else '-'} | {int(s.done_ns)} | "
+                f"{s.retained_bytes/1024/1024:.2f} | {s.bytes_per_key:.1f} | {s.bytes_per_key_with_keys:.1f} | "
+                f"{s.memory_peak_bytes/1024/1024:.2f} |"
             )
         md_lines.append("")
+        md_lines.append("Latencias por llamada (percentiles de todas las corridas, ns; `build` = cada inserte al construir, con tracemalloc activo):\n")
+        md_lines.append("| N | operación | p50 | p90 | p99 | p99.9 | max |")
+        md_lines.append("|---:|:---|---:|---:|---:|---:|---:|")
+        for s in r.sizes:
+            for label in ("build", "insert", "delete", "search_hit", "search_miss"):
+                op = getattr(s, label)
+                if op is None or not op.max_ns:
+                    continue
+                md_lines.append(
+                    f"| {s.n} | {label} | {int(op.p50_ns)} | {int(op.p90_ns)} | {int(op.p99_ns)} | "
+                    f"{int(op.p999_ns)} | {int(op.max_ns)} |"
+                )
+        md_lines.append("")
+        if any(s.counters for s in r.sizes):
+            md_lines.append("Contadores internos promedio por llamada (`estadisticas()`, corrida aparte):\n")
+            md_lines.append("| N | operación | contadores |")
+            md_lines.append("|---:|:---|:---|")
+            for s in r.sizes:
+                for label, values in s.counters.items():
+                    shown = ", ".join(f"{k}={v:.1f}" for k, v in values.items() if k not in ("inserte", "borre", "miembro"))
+                    md_lines.append(f"| {s.n} | {label} | {shown} |")
+            md_lines.append("")
+
+    if skipped:
+        md_lines.append("## Celdas omitidas\n")
+        for sk in skipped:
+            md_lines.append(f"- {sk['name']} N={sk['n']}: {sk['error']}")
+        md_lines.append("")
 
     md_lines.append("\n## Rangos sugeridos (heurística)\n")
     md_lines.append(analyze_ranges(results))
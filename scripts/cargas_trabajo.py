@@ -0,0 +1,260 @@
+"""Distribuciones de palabras (cargas de trabajo) para los benchmarks.
+
+Cada carga decide tres cosas a partir de un ``random.Random``:
+
+- ``base()``: las N palabras a insertar, en el orden de inserción;
+- ``fresh(k)``: candidatas nuevas con el mismo estilo (para inserciones y
+  búsquedas fallidas; quien llama descarta las que ya estén en la base);
+- ``pick(base, k)``: claves presentes a buscar o borrar.
+
+Cargas disponibles (``--workload``):
+
+- ``uniforme``: 20 letras al azar, acceso uniforme (la de siempre).
+- ``ordenada`` / ``inversa``: la base se inserta ascendente o descendente;
+  es el peor caso de un ABB sin balanceo.
+- ``casi_ordenada``: ascendente con un 5 % de pares intercambiados.
+- ``zipf``: base uniforme, pero búsquedas y borrados siguen una Zipf (s=1.1).
+- ``prefijos``: raíces compartidas + sufijos frecuentes, parecido a palabras
+  reales; favorece la compartición de prefijos en los tries.
+- ``longitud_variable``: longitudes uniformes entre 1 y 64.
+- ``multiconjunto``: N inserciones sobre un vocabulario de N/10 palabras
+  (muchos duplicados).
+"""
+from __future__ import annotations
+
+import math
+import os
+import random
+from itertools import accumulate
+
+
+ABC = "abcdefghijklmnopqrstuvwxyz"
+
+SUFFIXES = [
+    "", "s", "es", "ar", "er", "ir", "ado", "ido", "ando", "iendo",
+    "cion", "ciones", "mente", "idad", "oso", "osa", "ista", "ero", "able", "ito",
+]
+
+
+# bytes.translate con "delete": cada byte se vuelve letra y se descartan los
+# últimos 256 % 26 valores para que las 26 letras sean equiprobables
+_LETTERS = 256 - 256 % len(ABC)
+_TABLE = bytes(ord(ABC[b % len(ABC)]) for b in range(256))
+_REJECT = bytes(range(_LETTERS, 256))
+
+CORPUS_CACHE_ENV = "DICCIONARIO_CORPUS_CACHE"
+# las listas más cortas se generan más rápido de lo que se leen del disco
+CORPUS_CACHE_MIN = 10_000
+
+
+def rand_word(rng: random.Random, length: int = 20) -> str:
+    return "".join(rng.choice(ABC) for _ in range(length))
+
+
+def rand_letters(rng: random.Random, count: int) -> str:
+    """``count`` letras al azar en bloque (``randbytes`` + ``translate``)."""
+    out = ""
+    while len(out) < count:
+        need = count - len(out)
+        # pide un poco más para cubrir los bytes descartados en una pasada
+        data = rng.randbytes(need + need // 8 + 16)
+        out += data.translate(_TABLE, _REJECT).decode("ascii")
+    return out[:count]
+
+
+def gen_words_unique(n: int, seed: int, length: int = 20, cache: bool = True) -> list[str]:
+    """``n`` palabras distintas de ``length`` letras, deterministas por ``seed``.
+
+    Si la variable de entorno ``DICCIONARIO_CORPUS_CACHE`` apunta a una
+    carpeta (``--corpus-cache``), la lista se guarda ahí y se reutiliza en
+    las corridas siguientes con la misma semilla (solo desde
+    ``CORPUS_CACHE_MIN`` palabras y con ``cache``).
+    """
+    folder = os.environ.get(CORPUS_CACHE_ENV) if cache and n >= CORPUS_CACHE_MIN else None
+    path = os.path.join(folder, f"palabras_{n}_{seed}_{length}.txt") if folder else None
+    if path is not None and os.path.exists(path):
+        with open(path, "r", encoding="ascii") as f:
+            words = f.read().split("\n")
+        if len(words) == n:
+            return words
+    rng = random.Random(seed)
+    seen: dict[str, None] = {}
+    while len(seen) < n:
+        need = n - len(seen)
+        letters = rand_letters(rng, need * length)
+        seen.update(dict.fromkeys(letters[i:i + length] for i in range(0, len(letters), length)))
+    words = list(seen)[:n]
+    if path is not None:
+        os.makedirs(folder, exist_ok=True)
+        # escritura atómica: con --jobs varios procesos pueden generar la misma lista
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="ascii") as f:
+            f.write("\n".join(words))
+        os.replace(tmp, path)
+    return words
+
+
+class Workload:
+    """Carga uniforme; las demás redefinen solo lo que cambia.
+
+    Con ``corpus_seed`` la lista de palabras de la base sale de esa semilla
+    y no de ``rng``: así varias estructuras comparten el mismo corpus (y el
+    mismo archivo de ``--corpus-cache``) aunque el resto de la carga varíe.
+    """
+
+    name = "uniforme"
+
+    def __init__(self, n: int, rng: random.Random, corpus_seed: int | None = None) -> None:
+        self.n = n
+        self.rng = rng
+        self.corpus_seed = corpus_seed
+
+    def base_seed(self) -> int:
+        """Semilla de la lista de palabras de ``base()``."""
+        if self.corpus_seed is not None:
+            return self.corpus_seed
+        return self.rng.randrange(1_000_000_000)
+
+    def base(self) -> list[str]:
+        return gen_words_unique(self.n, self.base_seed())
+
+    def fresh(self, k: int) -> list[str]:
+        # semillas de un solo uso: guardarlas solo llenaría la carpeta
+        return gen_words_unique(k, self.rng.randrange(1_000_000_000), cache=False)
+
+    def pick(self, base: list[str], k: int) -> list[str]:
+        rng = self.rng
+        return [base[rng.randrange(0, len(base))] for _ in range(k)]
+
+
+class SortedWorkload(Workload):
+    name = "ordenada"
+
+    def base(self) -> list[str]:
+        return sorted(super().base())
+
+
+class ReverseWorkload(Workload):
+    name = "inversa"
+
+    def base(self) -> list[str]:
+        return sorted(super().base(), reverse=True)
+
+
+class NearlySortedWorkload(Workload):
+    name = "casi_ordenada"
+    swap_fraction = 0.05
+
+    def base(self) -> list[str]:
+        words = sorted(super().base())
+        rng = self.rng
+        for _ in range(int(len(words) * self.swap_fraction)):
+            i = rng.randrange(len(words))
+            j = rng.randrange(len(words))
+            words[i], words[j] = words[j], words[i]
+        return words
+
+
+class ZipfWorkload(Workload):
+    name = "zipf"
+    exponent = 1.1
+
+    def __init__(self, n: int, rng: random.Random, corpus_seed: int | None = None) -> None:
+        super().__init__(n, rng, corpus_seed)
+        self.__ranked: list[str] | None = None
+        self.__cum: list[float] = []
+
+    def pick(self, base: list[str], k: int) -> list[str]:
+        if self.__ranked is None or len(self.__ranked) != len(base):
+            self.__ranked = base[:]
+            self.rng.shuffle(self.__ranked)
+            s = self.exponent
+            self.__cum = list(accumulate(1.0 / (i ** s) for i in range(1, len(base) + 1)))
+        return self.rng.choices(self.__ranked, cum_weights=self.__cum, k=k)
+
+
+class PrefixWorkload(Workload):
+    """Raíz (3 a 8 letras) + sufijo frecuente + cola opcional de 0 a 3 letras."""
+
+    name = "prefijos"
+
+    def __init__(self, n: int, rng: random.Random, corpus_seed: int | None = None) -> None:
+        super().__init__(n, rng, corpus_seed)
+        stems = max(8, math.isqrt(max(1, n)))
+        self.stems = [rand_word(rng, rng.randint(3, 8)) for _ in range(stems)]
+
+    def __word(self) -> str:
+        rng = self.rng
+        return rng.choice(self.stems) + rng.choice(SUFFIXES) + rand_word(rng, rng.randint(0, 3))
+
+    def __unique(self, k: int) -> list[str]:
+        seen: set[str] = set()
+        out: list[str] = []
+        while len(out) < k:
+            w = self.__word()
+            if w not in seen:
+                seen.add(w)
+                out.append(w)
+        return out
+
+    def base(self) -> list[str]:
+        return self.__unique(self.n)
+
+    def fresh(self, k: int) -> list[str]:
+        return self.__unique(k)
+
+
+class VariableLengthWorkload(Workload):
+    name = "longitud_variable"
+    min_length = 1
+    max_length = 64
+
+    def __unique(self, k: int) -> list[str]:
+        rng = self.rng
+        seen: dict[str, None] = {}
+        while len(seen) < k:
+            lengths = [rng.randint(self.min_length, self.max_length) for _ in range(k - len(seen))]
+            letters = rand_letters(rng, sum(lengths))
+            start = 0
+            for length in lengths:
+                seen.setdefault(letters[start:start + length])
+                start += length
+        return list(seen)[:k]
+
+    def base(self) -> list[str]:
+        return self.__unique(self.n)
+
+    def fresh(self, k: int) -> list[str]:
+        return self.__unique(k)
+
+
+class MultisetWorkload(Workload):
+    name = "multiconjunto"
+    copies = 10
+
+    def base(self) -> list[str]:
+        vocabulary = gen_words_unique(max(1, self.n // self.copies), self.base_seed())
+        rng = self.rng
+        return [vocabulary[rng.randrange(len(vocabulary))] for _ in range(self.n)]
+
+
+WORKLOADS: dict[str, type[Workload]] = {
+    cls.name: cls
+    for cls in (
+        Workload,
+        SortedWorkload,
+        ReverseWorkload,
+        NearlySortedWorkload,
+        ZipfWorkload,
+        PrefixWorkload,
+        VariableLengthWorkload,
+        MultisetWorkload,
+    )
+}
+
+
+def make_workload(name: str, n: int, rng: random.Random, corpus_seed: int | None = None) -> Workload:
+    try:
+        return WORKLOADS[name](n, rng, corpus_seed)
+    except KeyError:
+        raise ValueError(f"Carga de trabajo desconocida: {name}") from None
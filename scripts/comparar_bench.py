@@ -0,0 +1,206 @@
+"""Compara corridas del análisis (bench_*.json) y detecta regresiones.
+
+El primer archivo es la referencia; cada uno de los siguientes se compara
+contra ella por estructura, tamaño N y operación. Una operación cuenta como
+regresión cuando a la vez:
+
+- la media empeora más que ``--threshold`` (relativo), y
+- la diferencia es significativa: supera ``--z`` veces el error estándar
+  combinado de ambas medias (desviación entre corridas / sqrt(corridas)).
+  Si un archivo no trae desviación o cantidad de corridas (p. ej. ``build``,
+  o JSON anteriores a ``runs``), se usa solo el umbral relativo.
+
+Además se revisa el p99 de los histogramas (``--p99-threshold``, solo si
+ambos lados tienen al menos ``--min-samples`` llamadas) y la memoria
+retenida (``--mem-threshold``), que es determinista y no necesita prueba.
+
+Termina con código 1 si hay alguna regresión, así que sirve como control
+local antes de aceptar un cambio de rendimiento.
+
+Uso rápido en consola:
+  py scripts/comparar_bench.py resultados/bench_A.json resultados/bench_B.json
+  py scripts/comparar_bench.py --latest 2
+  py scripts/comparar_bench.py base.json nuevo1.json nuevo2.json --threshold 0.05 --z 2
+
+Parámetros:
+  archivos                  Referencia seguida de uno o más bench_*.json
+  --latest 0                Sin archivos: compara los K más recientes de resultados/
+  --threshold 0.10          Empeoramiento relativo mínimo de la media
+  --z 3.0                   Desviaciones estándar de la diferencia para ser significativa
+  --p99-threshold 0.50      Empeoramiento relativo mínimo del p99 (0 lo desactiva)
+  --min-samples 100         Llamadas mínimas en el histograma para comparar p99
+  --mem-threshold 0.05      Crecimiento relativo mínimo de la memoria retenida (0 lo desactiva)
+  --ops insert,delete,...   Operaciones a comparar
+  --all                     Muestra también las filas sin cambios
+  --json salida.json        Guarda las diferencias en JSON
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from dataclasses import asdict, dataclass
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.armar_reporte_tercera_entrega import RESULTS
+
+OPS = ("build", "insert", "delete", "search_hit", "search_miss")
+SETTINGS = ("bloom", "timing", "workload")
+
+
+@dataclass
+class Diff:
+    name: str
+    n: int
+    op: str
+    metric: str
+    base: float
+    new: float
+    ratio: float
+    z: float | None
+    verdict: str  # "regresión", "mejora" o "igual"
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def index_sizes(bench: dict) -> dict[tuple[str, int], dict]:
+    return {(r["name"], int(s["n"])): s for r in bench.get("results", []) for s in r["sizes"]}
+
+
+def latest_benches(k: int, folder: str = RESULTS) -> list[str]:
+    """Los ``k`` bench_*.json más recientes, del más viejo al más nuevo."""
+    if not os.path.isdir(folder):
+        return []
+    cands = [
+        os.path.join(folder, f) for f in os.listdir(folder)
+        if f.startswith("bench_") and f.endswith(".json")
+    ]
+    cands.sort(key=os.path.getmtime)
+    return cands[-k:]
+
+
+def z_score(base: dict, new: dict, base_runs: int, new_runs: int) -> float | None:
+    """Diferencia de medias en errores estándar; ``None`` si faltan datos."""
+    if base_runs < 2 or new_runs < 2:
+        return None
+    se = math.sqrt(base["stdev_ns"] ** 2 / base_runs + new["stdev_ns"] ** 2 / new_runs)
+    if se == 0:
+        return None
+    return (new["mean_ns"] - base["mean_ns"]) / se
+
+
+def verdict(ratio: float, threshold: float, z: float | None, z_min: float) -> str:
+    significant = z is None or abs(z) >= z_min
+    if ratio > 1 + threshold and significant:
+        return "regresión"
+    if ratio < 1 / (1 + threshold) and significant:
+        return "mejora"
+    return "igual"
+
+
+def hist_total(size: dict, op: str) -> int:
+    return int(size.get("histograms", {}).get(op, {}).get("total", 0))
+
+
+def compare(base: dict, new: dict, args: argparse.Namespace) -> list[Diff]:
+    base_idx = index_sizes(base)
+    new_idx = index_sizes(new)
+    diffs: list[Diff] = []
+    for key in sorted(base_idx.keys() & new_idx.keys()):
+        name, n = key
+        a, b = base_idx[key], new_idx[key]
+        for op in args.ops:
+            sa, sb = a.get(op), b.get(op)
+            if not sa or not sb or not sa["mean_ns"] or not sb["mean_ns"]:
+                continue
+            ratio = sb["mean_ns"] / sa["mean_ns"]
+            z = z_score(sa, sb, int(a.get("runs", 0)), int(b.get("runs", 0)))
+            diffs.append(Diff(name, n, op, "media", sa["mean_ns"], sb["mean_ns"], ratio, z,
+                              verdict(ratio, args.threshold, z, args.z)))
+            if (
+                args.p99_threshold > 0
+                and sa.get("p99_ns") and sb.get("p99_ns")
+                and min(hist_total(a, op), hist_total(b, op)) >= args.min_samples
+            ):
+                ratio = sb["p99_ns"] / sa["p99_ns"]
+                diffs.append(Diff(name, n, op, "p99", sa["p99_ns"], sb["p99_ns"], ratio, None,
+                                  verdict(ratio, args.p99_threshold, None, args.z)))
+        if args.mem_threshold > 0 and a.get("retained_bytes") and b.get("retained_bytes"):
+            ratio = b["retained_bytes"] / a["retained_bytes"]
+            diffs.append(Diff(name, n, "memoria", "retenida", a["retained_bytes"], b["retained_bytes"],
+                              ratio, None, verdict(ratio, args.mem_threshold, None, args.z)))
+    return diffs
+
+
+def print_diffs(diffs: list[Diff], show_all: bool) -> None:
+    rows = [d for d in diffs if show_all or d.verdict != "igual"]
+    if not rows:
+        print("  sin cambios por encima de los umbrales")
+        return
+    print(f"  {'estructura':<30} {'N':>8} {'operación':<12} {'métrica':<9} {'antes':>12} {'después':>12} {'x':>6} {'z':>6}  veredicto")
+    for d in rows:
+        z = f"{d.z:>6.1f}" if d.z is not None else f"{'-':>6}"
+        print(
+            f"  {d.name:<30} {d.n:>8} {d.op:<12} {d.metric:<9} {d.base:>12.0f} {d.new:>12.0f} "
+            f"{d.ratio:>6.2f} {z}  {d.verdict}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compara corridas bench_*.json y detecta regresiones")
+    parser.add_argument("archivos", nargs="*")
+    parser.add_argument("--latest", type=int, default=0)
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--z", type=float, default=3.0)
+    parser.add_argument("--p99-threshold", type=float, default=0.50)
+    parser.add_argument("--min-samples", type=int, default=100)
+    parser.add_argument("--mem-threshold", type=float, default=0.05)
+    parser.add_argument("--ops", type=str, default=",".join(OPS))
+    parser.add_argument("--all", action="store_true")
+    parser.add_argument("--json", type=str, default="")
+    args = parser.parse_args(argv)
+    args.ops = [x.strip() for x in args.ops.split(",") if x.strip()]
+
+    paths = args.archivos or latest_benches(args.latest)
+    if len(paths) < 2:
+        parser.error("se necesitan al menos dos archivos (o --latest K con K >= 2)")
+
+    base = load(paths[0])
+    report: dict[str, list[dict]] = {}
+    regressions = 0
+    for path in paths[1:]:
+        new = load(path)
+        print(f"== {os.path.basename(paths[0])} -> {os.path.basename(path)}")
+        for setting in SETTINGS:
+            if base.get(setting) != new.get(setting):
+                print(f"  [aviso] {setting} difiere: {base.get(setting)!r} vs {new.get(setting)!r}")
+        missing = index_sizes(base).keys() - index_sizes(new).keys()
+        for name, n in sorted(missing):
+            print(f"  [aviso] falta {name} N={n} en {os.path.basename(path)}")
+        diffs = compare(base, new, args)
+        print_diffs(diffs, args.all)
+        regressions += sum(d.verdict == "regresión" for d in diffs)
+        report[path] = [asdict(d) for d in diffs]
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"base": paths[0], "comparisons": report}, f, ensure_ascii=False, indent=2)
+        print(f"\nReporte JSON: {args.json}")
+
+    if regressions:
+        print(f"\n{regressions} regresión(es) detectada(s).")
+        return 1
+    print("\nSin regresiones.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,8 @@
 """Generador de gráficos (Tercera Entrega)
 
 Lee un archivo JSON producido por scripts/analisis_tercera_entrega.py y
-produce gráficos PNG por operación y memoria.
+produce gráficos PNG por operación y memoria, y (si el JSON los trae)
+percentiles de latencia y los histogramas del N más grande.
 
 Uso:
   py scripts/graficas_tercera_entrega.py --json resultados/bench_YYYYMMDD_HHMMSS.json
@@ -16,9 +17,16 @@ import argparse
 import json
 import math
 import os
+import sys
 from dataclasses import dataclass
 from typing import Any
 
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.histograma_latencias import LatencyHistogram
+
 try:
     import matplotlib.pyplot as plt  
 except Exception as e:
@@ -140,6 +148,77 @@ def plot_lines_by_operation(results: dict[str, Any], out_dir: str) -> list[str]:
     return generated
 
 
+def plot_latency_percentiles(results: dict[str, Any], out_dir: str) -> list[str]:
+    """p50/p99/max por N y el histograma de latencias del N más grande."""
+    ensure_matplotlib()
+    os.makedirs(out_dir, exist_ok=True)
+
+    structures = results["results"]
+    if not any(ss.get("histograms") for r in structures for ss in r["sizes"]):
+        return []
+    Ns = sorted({ss["n"] for r in structures for ss in r["sizes"]})
+    generated: list[str] = []
+
+    for op_key, title in (("insert", "Inserción"), ("delete", "Borrado"), ("search", "Búsqueda")):
+        fig, axes = plt.subplots(1, 3, figsize=(15, 5), sharey=True)
+        for ax, (pkey, plabel) in zip(axes, (("p50_ns", "p50"), ("p99_ns", "p99"), ("max_ns", "máximo"))):
+            for r in structures:
+                ys: list[float] = []
+                for n in Ns:
+                    sstat = next((ss for ss in r["sizes"] if ss["n"] == n), None)
+                    val = sstat[op_key].get(pkey) if sstat else None
+                    ys.append(to_ms(val) if val else float("nan"))
+                ax.plot(Ns, ys, marker="o", label=r["name"])
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+            ax.set_xlabel("N (log)")
+            ax.set_title(f"{title}: {plabel}")
+            ax.grid(True, which="both", ls=":", alpha=0.5)
+        axes[0].set_ylabel("Latencia por llamada (ms, log)")
+        axes[-1].legend(loc="best", fontsize=7)
+        out_path = os.path.join(out_dir, f"{op_key}_percentiles.png")
+        fig.tight_layout()
+        fig.savefig(out_path, dpi=150)
+        plt.close(fig)
+        generated.append(out_path)
+
+    for op_key in ("build", "insert", "delete", "search_hit", "search_miss"):
+        fig, ax = plt.subplots(figsize=(9, 5))
+        drawn = False
+        for r in structures:
+            sized = [ss for ss in r["sizes"] if op_key in ss.get("histograms", {})]
+            if not sized:
+                continue
+            hist = max(sized, key=lambda ss: ss["n"])["histograms"][op_key]
+            h = LatencyHistogram.from_dict(hist)
+            total = max(1, h.total)
+            xs: list[float] = []
+            ys: list[float] = []
+            seen = 0
+            for _, upper, count in h.buckets():
+                seen += count
+                xs.append(upper / 1e3)
+                ys.append(seen / total)
+            ax.step(xs, ys, where="post", label=r["name"])
+            drawn = True
+        if not drawn:
+            plt.close(fig)
+            continue
+        ax.set_xscale("log")
+        ax.set_xlabel("Latencia (µs, log)")
+        ax.set_ylabel("Fracción acumulada")
+        ax.set_title(f"Distribución de latencias: {op_key} (N más grande)")
+        ax.grid(True, which="both", ls=":", alpha=0.5)
+        ax.legend(loc="best", fontsize=8)
+        out_path = os.path.join(out_dir, f"{op_key}_latency_cdf.png")
+        fig.tight_layout()
+        fig.savefig(out_path, dpi=150)
+        plt.close(fig)
+        generated.append(out_path)
+
+    return generated
+
+
 def main(argv: list[str] | None = None) -> None:
     ap = argparse.ArgumentParser(description="Genera gráficos a partir del JSON de benchmarks")
     ap.add_argument("--json", required=True, help="Ruta al JSON generado por analisis_tercera_entrega.py")
@@ -155,6 +234,7 @@ def main(argv: list[str] | None = None) -> None:
 
     data = load_results(json_path)
     generated = plot_lines_by_operation(data, out_dir)
+    generated += plot_latency_percentiles(data, out_dir)
 
     # Crear un markdown simple con enlaces a los PNG
     md_path = os.path.join(out_dir, "graficos.md")
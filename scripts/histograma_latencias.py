@@ -0,0 +1,118 @@
+"""Histograma de latencias con cubetas logarítmicas (al estilo HDR).
+
+Los valores (nanosegundos enteros) menores que ``2**bits`` se cuentan
+exactos; los mayores se agrupan en cubetas cuyo ancho crece con la magnitud,
+con ``2**(bits-1)`` cubetas por potencia de dos. Con ``bits=7`` el error
+relativo de cualquier percentil es menor al 1.6 %, y el histograma ocupa a
+lo sumo unos cientos de entradas sin importar cuántos valores se registren.
+
+Los conteos se guardan dispersos (``dict``), así que combinar histogramas de
+varias corridas es sumar conteos por cubeta.
+"""
+from __future__ import annotations
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    def __init__(self, bits: int = 7) -> None:
+        self.bits = bits
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.sum_ns = 0
+        self.min_ns: int | None = None
+        self.max_ns = 0
+
+    def record(self, value_ns: int, count: int = 1) -> None:
+        v = max(0, int(value_ns))
+        i = self.__index(v)
+        self.counts[i] = self.counts.get(i, 0) + count
+        self.total += count
+        self.sum_ns += v * count
+        if self.min_ns is None or v < self.min_ns:
+            self.min_ns = v
+        if v > self.max_ns:
+            self.max_ns = v
+
+    def merge(self, other: LatencyHistogram) -> None:
+        if other.bits != self.bits:
+            raise ValueError("Solo se combinan histogramas con la misma precisión.")
+        for i, c in other.counts.items():
+            self.counts[i] = self.counts.get(i, 0) + c
+        self.total += other.total
+        self.sum_ns += other.sum_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def mean(self) -> float:
+        return self.sum_ns / self.total if self.total else 0.0
+
+    def percentile(self, p: float) -> int:
+        """Valor más alto equivalente a la cubeta que contiene el percentil ``p``."""
+        if not self.total:
+            return 0
+        rank = max(1, -(-self.total * p // 100))
+        seen = 0
+        for i in sorted(self.counts):
+            seen += self.counts[i]
+            if seen >= rank:
+                return min(self.__upper(i), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> dict[str, float]:
+        out: dict[str, float] = {"count": self.total, "mean": self.mean()}
+        for p in PERCENTILES:
+            out[f"p{p:g}"] = self.percentile(p)
+        out["max"] = self.max_ns
+        return out
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """Lista de ``(desde_ns, hasta_ns, conteo)`` en orden, para graficar."""
+        return [(self.__lower(i), self.__upper(i), self.counts[i]) for i in sorted(self.counts)]
+
+    def to_dict(self) -> dict:
+        return {
+            "bits": self.bits,
+            "total": self.total,
+            "sum_ns": self.sum_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "counts": {str(i): c for i, c in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LatencyHistogram:
+        h = cls(int(data.get("bits", 7)))
+        h.counts = {int(i): int(c) for i, c in data.get("counts", {}).items()}
+        h.total = int(data.get("total", sum(h.counts.values())))
+        h.sum_ns = int(data.get("sum_ns", 0))
+        h.min_ns = data.get("min_ns")
+        h.max_ns = int(data.get("max_ns", 0))
+        return h
+
+    def __index(self, v: int) -> int:
+        m = 1 << self.bits
+        if v < m:
+            return v
+        e = v.bit_length() - self.bits
+        half = m >> 1
+        return m + (e - 1) * half + ((v >> e) - half)
+
+    def __lower(self, i: int) -> int:
+        m = 1 << self.bits
+        if i < m:
+            return i
+        half = m >> 1
+        e = (i - m) // half + 1
+        top = (i - m) % half + half
+        return top << e
+
+    def __upper(self, i: int) -> int:
+        m = 1 << self.bits
+        if i < m:
+            return i
+        half = m >> 1
+        e = (i - m) // half + 1
+        top = (i - m) % half + half
+        return ((top + 1) << e) - 1
@@ -0,0 +1,127 @@
+"""Piezas compartidas por ``pruebas_primera_entrega`` y ``pruebas_segunda_entrega``.
+
+Las pruebas que valen para cualquier ``Diccionario`` (instantáneas y
+contadores internos) se escriben una sola vez aquí y cada script las
+ejecuta con sus propias clases.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+
+
+@dataclass
+class ResultadoEstructura:
+    nombre: str
+    ok: bool = True
+    mensajes: list[str] = None
+    final_repr: str = ""
+    tamaño: int = 0
+    # Hash extras
+    factor_carga: float | None = None
+    bucket_min: int | None = None
+    bucket_max: int | None = None
+    bucket_promedio_no_vacios: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.mensajes is None:
+            self.mensajes = []
+
+    def agrega(self, msg: str) -> None:
+        self.mensajes.append(msg)
+
+    def fallo(self, msg: str) -> None:
+        self.ok = False
+        self.mensajes.append("ERROR: " + msg)
+
+
+def imprimir_resultado(r: ResultadoEstructura) -> None:
+    estado = "OK" if r.ok else "FALLO"
+    print(f"\n=== {r.nombre} -> {estado} ===")
+    for m in r.mensajes:
+        print(" -", m)
+    print(f" Final: {r.final_repr}  (tamaño={r.tamaño})")
+
+
+PALABRAS_INSTANTANEA = ["pera", "ñandú", "árbol", "pera", "über", "日本", "zeta", "a"]
+
+
+def probar_instantanea(verbose: bool, clase: type, *argumentos) -> ResultadoEstructura:
+    """guarde -> cargue -> compara, vacío y con claves no ASCII; una
+    instantánea corrupta o cortada en cualquier punto da ``ValueError``.
+    """
+    r = ResultadoEstructura(f"{clase.__name__} (guarde/cargue)")
+    try:
+        vacio = clase(*argumentos)
+        buf = io.BytesIO()
+        vacio.guarde(buf)
+        copia = clase(*argumentos)
+        copia.inserte("sobra")
+        copia.cargue(io.BytesIO(buf.getvalue()))
+        assert len(copia) == 0 and list(copia) == [], "Cargar una instantánea vacía no vació"
+
+        d = clase(*argumentos)
+        for x in PALABRAS_INSTANTANEA:
+            d.inserte(x)
+        esperado = list(d)
+        buf = io.BytesIO()
+        d.guarde(buf)
+        datos = buf.getvalue()
+        copia = clase(*argumentos)
+        copia.cargue(io.BytesIO(datos))
+        if verbose:
+            r.agrega(f"Cargada: {copia}")
+        assert list(copia) == esperado, "El contenido cargado difiere del guardado"
+        assert len(copia) == len(d), "El tamaño cargado difiere del guardado"
+        assert copia.miembro("ñandú") and copia.miembro("日本"), "Fallo en miembro() tras cargar"
+        assert not copia.miembro("nandu"), "miembro() encuentra una clave inexistente"
+        copia.borre("über")
+        copia.inserte("ñu")
+        assert "ñu" in list(copia) and "über" not in list(copia), "No se puede modificar tras cargar"
+
+        dañadas = [datos[:corte] for corte in range(len(datos))]
+        dañadas.append(b"XXXX" + datos[4:])
+        for dañada in dañadas:
+            try:
+                clase(*argumentos).cargue(io.BytesIO(dañada))
+            except ValueError:
+                continue
+            raise AssertionError(f"Cargar una instantánea dañada ({len(dañada)} bytes) no dio ValueError")
+        if verbose:
+            r.agrega(f"{len(dañadas)} instantáneas cortadas o corruptas rechazadas")
+        r.final_repr = str(copia)
+        r.tamaño = len(copia)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_contadores(verbose: bool, esperado: dict[str, int], clase: type, *argumentos) -> ResultadoEstructura:
+    """Contadores exactos para: inserte d, b, c, a, e; miembro c, z; borre b, a."""
+    r = ResultadoEstructura(f"{clase.__name__} (contadores)")
+    try:
+        d = clase(*argumentos)
+        assert d.estadisticas() == {}, "Los contadores deberían empezar apagados"
+        d.active_estadisticas()
+        for x in ["d", "b", "c", "a", "e"]:
+            d.inserte(x)
+        d.miembro("c")
+        d.miembro("z")
+        d.borre("b")
+        d.borre("a")
+        obtenidos = d.estadisticas()
+        if verbose:
+            r.agrega(f"Contadores: {dict(sorted(obtenidos.items()))}")
+        assert obtenidos == esperado, f"Contadores inesperados: {obtenidos} en vez de {esperado}"
+        d.active_estadisticas(False)
+        d.miembro("c")
+        assert d.estadisticas() == {}, "Los contadores siguen encendidos tras apagarlos"
+        r.final_repr = str(d)
+        r.tamaño = len(d)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
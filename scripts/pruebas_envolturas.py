@@ -0,0 +1,431 @@
+"""Pruebas de las envolturas que se anteponen a cualquier diccionario.
+
+Ejecuta:
+    - FiltroBloomConteo: saturación de contadores y tasa de falsos positivos
+    - DiccionarioConFiltro: sin falsos negativos tras inserciones, borrados
+      y reinserciones (con reconstrucción del filtro)
+    - DiccionarioConcurrente: lectores y escritores en hilos dan el mismo
+      contenido que en secuencia; un escritor en espera detiene lectores nuevos
+    - DiccionarioParticionado: construcción en uno y en varios procesos da
+      lo mismo, con y sin ``inserte_ordenados`` en la clase interna
+    - DiccionarioGrabador + reproducir_traza: una sesión grabada (texto y
+      gzip) se reproduce en otras implementaciones sin diferencias
+
+Produce un resumen final con métricas simples.
+
+Uso (desde la raíz del repositorio):
+    py scripts/pruebas_envolturas.py
+Opciones:
+    --sin-detalle    Muestra solo el resumen final.
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import partial
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.abbpunteros import AbbPunteros
+from src.diccionarioconcurrente import CerrojoLectoresEscritores, DiccionarioConcurrente
+from src.diccionariograbador import DiccionarioGrabador, lea_traza
+from src.diccionarioparticionado import DiccionarioParticionado
+from src.filtrobloom import DiccionarioConFiltro, FiltroBloomConteo
+from src.listaordenadadesenrollada import ListaOrdenadaDesenrollada
+from src.listaordenadadinamica import ListaOrdenadaDinámica
+from src.tablahashabierta import TablaHashAbierta
+from src.tablahashcompacta import TablaHashCompacta
+from scripts.pruebas_comunes import ResultadoEstructura, imprimir_resultado
+from scripts.reproducir_traza import replay
+
+
+def palabras_al_azar(rng: random.Random, k: int, largo: int = 8) -> list[str]:
+    """``k`` palabras distintas de ``largo`` letras."""
+    vistas: dict[str, None] = {}
+    while len(vistas) < k:
+        vistas["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(largo))] = None
+    return list(vistas)
+
+
+def probar_filtro_saturacion(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("FiltroBloomConteo (saturación)")
+    try:
+        # capacidad 1: pocos contadores, así "x" y "a" comparten casi todos
+        f = FiltroBloomConteo(1)
+        f.agregue("a")
+        for _ in range(300):
+            f.agregue("x")
+        assert f.puede_contener("a") and f.puede_contener("x"), "Falso negativo tras agregar"
+        for _ in range(300):
+            f.quite("x")
+        assert f.puede_contener("a"), "Quitar más de 255 veces una clave borró otra (falso negativo)"
+        f.quite("a")
+        if verbose:
+            r.agrega(f"{f.cantidad_contadores()} contadores, {f.cantidad_hashes()} hashes")
+        f.limpie()
+        assert not f.puede_contener("a") and not f.puede_contener("x"), "limpie() no vació el filtro"
+        r.final_repr = "saturados sin falsos negativos"
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_filtro_tasa(verbose: bool = True, tasa: float = 0.01) -> ResultadoEstructura:
+    r = ResultadoEstructura(f"FiltroBloomConteo (falsos positivos, p={tasa})")
+    try:
+        rng = random.Random(31)
+        palabras = palabras_al_azar(rng, 25000)
+        presentes, ausentes = palabras[:5000], palabras[5000:]
+        f = FiltroBloomConteo(len(presentes), tasa)
+        for x in presentes:
+            f.agregue(x)
+        assert all(f.puede_contener(x) for x in presentes), "Falso negativo en el filtro"
+        medida = sum(f.puede_contener(x) for x in ausentes) / len(ausentes)
+        if verbose:
+            r.agrega(f"Tasa medida {medida:.4f} sobre {len(ausentes)} ausentes")
+        # 20 000 ausentes: la desviación estándar ronda 0.07 p
+        assert tasa / 2 <= medida <= tasa * 2, f"Tasa de falsos positivos {medida:.4f} lejos de {tasa}"
+        r.final_repr = f"tasa={medida:.4f}"
+        r.tamaño = len(presentes)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_diccionario_con_filtro(verbose: bool = True, clase: type = ListaOrdenadaDinámica) -> ResultadoEstructura:
+    r = ResultadoEstructura(f"DiccionarioConFiltro sobre {clase.__name__}")
+    try:
+        rng = random.Random(7)
+        vocabulario = palabras_al_azar(rng, 400)
+        ausentes = palabras_al_azar(random.Random(8), 400, 9)
+        # capacidad pequeña: el filtro se reconstruye varias veces
+        d = DiccionarioConFiltro(clase(), capacidad=16)
+        duplicados = getattr(d, "permite_duplicados", True)
+        modelo: Counter[str] = Counter()
+        for _ in range(3000):
+            x = rng.choice(vocabulario)
+            if rng.random() < 0.6:
+                d.inserte(x)
+                modelo[x] = modelo[x] + 1 if duplicados else 1
+            else:
+                borrado = d.borre(x)
+                assert borrado == (modelo[x] > 0), f"borre('{x}') devolvió {borrado}"
+                if borrado:
+                    modelo[x] -= 1
+            assert d.miembro(x) == (modelo[x] > 0), f"miembro('{x}') no coincide con el modelo"
+        for x in vocabulario:
+            assert d.miembro(x) == (modelo[x] > 0), f"Falso negativo o positivo en '{x}'"
+        assert not any(d.miembro(x) for x in ausentes), "miembro() encuentra una clave ausente"
+        assert len(d) == sum(modelo.values()), "El tamaño no coincide con el modelo"
+        if verbose:
+            r.agrega(
+                f"Capacidad final del filtro {d.filtro.capacidad}, rechazos={d.rechazos}, "
+                f"falsos positivos={d.falsos_positivos}"
+            )
+        assert d.filtro.capacidad >= len(d), "El filtro no se reconstruyó al crecer"
+        assert d.rechazos > 0, "El filtro no descartó ninguna búsqueda fallida"
+        r.final_repr = f"{len(d)} claves"
+        r.tamaño = len(d)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+class ListaVigilada(ListaOrdenadaDinámica):
+    """Lista que anota quién está dentro y cede el hilo a mitad de cada
+    operación, para que una exclusión mal hecha se note siempre.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.vigia = threading.Lock()
+        self.lectores = 0
+        self.escritores = 0
+        self.violaciones: list[str] = []
+
+    def __entre(self, escritura: bool) -> None:
+        with self.vigia:
+            if self.escritores or (escritura and self.lectores):
+                self.violaciones.append("escritura" if escritura else "lectura")
+            if escritura:
+                self.escritores += 1
+            else:
+                self.lectores += 1
+        time.sleep(0)
+
+    def __salga(self, escritura: bool) -> None:
+        with self.vigia:
+            if escritura:
+                self.escritores -= 1
+            else:
+                self.lectores -= 1
+
+    def inserte(self, elemento: str) -> None:
+        self.__entre(True)
+        try:
+            super().inserte(elemento)
+        finally:
+            self.__salga(True)
+
+    def borre(self, elemento: str) -> bool:
+        self.__entre(True)
+        try:
+            return super().borre(elemento)
+        finally:
+            self.__salga(True)
+
+    def miembro(self, elemento: str) -> bool:
+        self.__entre(False)
+        try:
+            return super().miembro(elemento)
+        finally:
+            self.__salga(False)
+
+
+def probar_concurrente_hilos(verbose: bool = True, escritores: int = 4, lectores: int = 4) -> ResultadoEstructura:
+    r = ResultadoEstructura(f"DiccionarioConcurrente ({escritores} escritores, {lectores} lectores)")
+    try:
+        rng = random.Random(33)
+        propias = [palabras_al_azar(rng, 120) for _ in range(escritores)]
+        interna = ListaVigilada()
+        d = DiccionarioConcurrente(interna)
+        errores: list[str] = []
+        listos = threading.Event()
+
+        def escriba(palabras: list[str]) -> None:
+            try:
+                for x in palabras:
+                    d.inserte(x)
+                for x in palabras[::3]:
+                    if not d.borre(x):
+                        errores.append(f"No se pudo borrar '{x}'")
+                for x in palabras[::6]:
+                    d.inserte(x)
+            except Exception as e:
+                errores.append(f"{e.__class__.__name__}: {e}")
+
+        def lea() -> None:
+            try:
+                while not listos.is_set():
+                    vistas = list(d)
+                    if vistas != sorted(vistas):
+                        errores.append("Un lector vio el recorrido desordenado")
+                    for x in vistas[:20]:
+                        d.miembro(x)
+                    len(d)
+                    str(d)
+            except Exception as e:
+                errores.append(f"{e.__class__.__name__}: {e}")
+
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)  # cambios de hilo frecuentes: más intercalados
+        try:
+            hilos_lectores = [threading.Thread(target=lea) for _ in range(lectores)]
+            hilos_escritores = [threading.Thread(target=escriba, args=(p,)) for p in propias]
+            for h in hilos_lectores + hilos_escritores:
+                h.start()
+            for h in hilos_escritores:
+                h.join()
+            listos.set()
+            for h in hilos_lectores:
+                h.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+
+        secuencial = ListaOrdenadaDinámica()
+        for palabras in propias:
+            for x in palabras:
+                secuencial.inserte(x)
+            for x in palabras[::3]:
+                secuencial.borre(x)
+            for x in palabras[::6]:
+                secuencial.inserte(x)
+        assert not errores, f"Errores en los hilos: {errores[:3]}"
+        assert not interna.violaciones, f"Exclusión violada en {len(interna.violaciones)} operaciones"
+        assert list(d) == list(secuencial), "El contenido final difiere del secuencial"
+        assert len(d) == len(secuencial), "El tamaño final difiere del secuencial"
+        if verbose:
+            r.agrega(f"{len(d)} claves tras {escritores * 180} escrituras concurrentes")
+        r.final_repr = f"{len(d)} claves"
+        r.tamaño = len(d)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_cerrojo_preferencia(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("CerrojoLectoresEscritores (preferencia de escritura)")
+    try:
+        cerrojo = CerrojoLectoresEscritores()
+        orden: list[str] = []
+
+        def escritor() -> None:
+            with cerrojo.escritura():
+                orden.append("escritor")
+
+        def lector_nuevo() -> None:
+            with cerrojo.lectura():
+                orden.append("lector nuevo")
+
+        cerrojo.adquiera_lectura()
+        h_escritor = threading.Thread(target=escritor, daemon=True)
+        h_escritor.start()
+        time.sleep(0.05)  # el escritor queda esperando al primer lector
+        h_lector = threading.Thread(target=lector_nuevo, daemon=True)
+        h_lector.start()
+        time.sleep(0.05)
+        assert orden == [], f"Alguien entró con un lector dentro: {orden}"
+        cerrojo.libere_lectura()
+        h_escritor.join(2)
+        h_lector.join(2)
+        assert not h_escritor.is_alive() and not h_lector.is_alive(), "El cerrojo quedó bloqueado"
+        if verbose:
+            r.agrega(f"Orden de entrada: {orden}")
+        assert orden == ["escritor", "lector nuevo"], "Un lector nuevo se adelantó al escritor en espera"
+
+        # sin escritores, varios lectores entran a la vez
+        cerrojo.adquiera_lectura()
+        otro = threading.Thread(target=lector_nuevo, daemon=True)
+        otro.start()
+        otro.join(2)
+        cerrojo.libere_lectura()
+        assert not otro.is_alive(), "Dos lectores no pudieron leer a la vez"
+        r.final_repr = ", ".join(orden)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_particionado(verbose: bool = True, fabrica=ListaOrdenadaDinámica, particiones: int = 3) -> ResultadoEstructura:
+    nombre = getattr(fabrica, "func", fabrica).__name__
+    r = ResultadoEstructura(f"DiccionarioParticionado de {nombre} ({particiones} particiones)")
+    try:
+        rng = random.Random(34)
+        palabras = palabras_al_azar(rng, 300)
+        palabras += ["ñandú", "日本"] + palabras[:20]  # no ASCII y duplicados
+        ausentes = palabras_al_azar(random.Random(35), 50, 9)
+        secuencial = DiccionarioParticionado(fabrica, particiones)
+        secuencial.construya(palabras, trabajadores=1)
+        paralelo = DiccionarioParticionado(fabrica, particiones)
+        paralelo.construya(palabras, trabajadores=2)
+
+        esperado = sorted(palabras) if secuencial.permite_duplicados else sorted(set(palabras))
+        assert list(secuencial) == esperado, "El recorrido (1 trabajador) no es el esperado"
+        assert list(paralelo) == list(secuencial), "El recorrido difiere entre 1 y 2 trabajadores"
+        assert len(paralelo) == len(secuencial) == len(esperado), "El tamaño difiere entre 1 y 2 trabajadores"
+        # cada clave en la partición que dice su CRC-32
+        por_particion = Counter(zlib.crc32(x.encode("utf-8")) % particiones for x in esperado)
+        reparto = [por_particion[i] for i in range(particiones)]
+        assert secuencial.tamaños_particiones() == paralelo.tamaños_particiones() == reparto, \
+            "Las claves no quedaron en su partición"
+        for x in palabras + ausentes:
+            assert secuencial.miembro(x) == paralelo.miembro(x) == (x in palabras), f"miembro('{x}') difiere"
+        for x in palabras[::7] + ausentes[:5]:
+            assert secuencial.borre(x) == paralelo.borre(x), f"borre('{x}') difiere"
+        assert list(paralelo) == list(secuencial), "El contenido difiere tras borrar"
+        paralelo.inserte("zz")
+        assert paralelo.miembro("zz") and not secuencial.miembro("zz"), "Fallo en inserte() tras construir"
+        if verbose:
+            r.agrega(f"Particiones: {paralelo.tamaños_particiones()}")
+        r.final_repr = f"{len(paralelo)} claves"
+        r.tamaño = len(paralelo)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_grabador(verbose: bool = True, extension: str = ".jsonl") -> ResultadoEstructura:
+    r = ResultadoEstructura(f"DiccionarioGrabador -> reproducir_traza ({extension})")
+    try:
+        rng = random.Random(38)
+        vocabulario = palabras_al_azar(rng, 60) + ["ñandú", "日本", 'con "comillas"']
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "traza" + extension)
+            with DiccionarioGrabador(ListaOrdenadaDinámica(), ruta) as d:
+                for i in range(1500):
+                    x = rng.choice(vocabulario)
+                    eleccion = rng.random()
+                    if eleccion < 0.4:
+                        d.inserte(x)
+                    elif eleccion < 0.6:
+                        d.borre(x)
+                    else:
+                        d.miembro(x)
+                    if i == 700:
+                        d.limpie()
+                grabadas = d.operaciones
+                final = list(d)
+            with open(ruta, "rb") as f:
+                comprimido = f.read(2) == b"\x1f\x8b"
+            assert comprimido == extension.endswith(".gz"), "La compresión no sigue la extensión"
+            leidas = list(lea_traza(ruta))
+            assert len(leidas) == grabadas == 1501, "La traza no tiene todas las operaciones"
+            assert sum(op == "limpie" for op, _, _ in leidas) == 1, "Falta el limpie() grabado"
+            for clase, *argumentos in [(TablaHashAbierta, 11), (ListaOrdenadaDesenrollada, 4)]:
+                otra = clase(*argumentos)
+                reporte = replay(ruta, otra)
+                if verbose:
+                    r.agrega(f"{clase.__name__}: {reporte['ops']} ops, {reporte['mismatches']} diferencias")
+                assert reporte["ops"] == grabadas, f"{clase.__name__} no reprodujo todas las operaciones"
+                assert reporte["mismatches"] == 0, f"{clase.__name__} difiere de lo grabado"
+                assert sorted(otra) == final, f"{clase.__name__} terminó con otro contenido"
+            # los ABB ignoran duplicados: la reproducción debe notarlo
+            reporte = replay(ruta, AbbPunteros())
+            assert reporte["mismatches"] > 0, "replay() no detecta resultados distintos"
+        r.final_repr = f"{len(final)} claves"
+        r.tamaño = len(final)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  # pragma: no cover - seguridad adicional
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def main(argv: list[str]) -> None:
+    verbose = "--sin-detalle" not in argv
+    if verbose:
+        print("Iniciando pruebas de las envolturas...\n")
+    resultados: list[ResultadoEstructura] = []
+    resultados.append(probar_filtro_saturacion(verbose))
+    resultados.append(probar_filtro_tasa(verbose, 0.01))
+    resultados.append(probar_filtro_tasa(verbose, 0.05))
+    resultados.append(probar_diccionario_con_filtro(verbose, ListaOrdenadaDinámica))
+    resultados.append(probar_diccionario_con_filtro(verbose, AbbPunteros))
+    resultados.append(probar_concurrente_hilos(verbose))
+    resultados.append(probar_cerrojo_preferencia(verbose))
+    resultados.append(probar_particionado(verbose, ListaOrdenadaDinámica))
+    # sin inserte_ordenados: la carga cae a inserte clave por clave
+    resultados.append(probar_particionado(verbose, partial(TablaHashCompacta, 11)))
+    resultados.append(probar_particionado(verbose, AbbPunteros))
+    resultados.append(probar_grabador(verbose, ".jsonl"))
+    resultados.append(probar_grabador(verbose, ".jsonl.gz"))
+    if verbose:
+        for r in resultados:
+            imprimir_resultado(r)
+    else:
+        print("\nResumen compacto:")
+        for r in resultados:
+            estado = "OK" if r.ok else "FALLO"
+            print(f" - {r.nombre}: {estado} (tamaño={r.tamaño})")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
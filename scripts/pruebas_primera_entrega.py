@@ -4,6 +4,15 @@ Ejecuta:
   - ListaOrdenadaDinámica
   - ListaOrdenadaEstática
   - TablaHashAbierta
+  - ListaOrdenadaDesenrollada
+  - ListaOrdenadaEstáticaCompacta / TablaHashCompacta (claves en arena)
+  - guarde/cargue de cada una (vacía, con claves no ASCII y dañada)
+  - ListaOrdenadaMapeada escrita desde cada lista y desde una lista vacía
+  - ListaOrdenadaMapeada desde un archivo de texto, y archivos cortados o ajenos
+  - DiccionarioCache (LRU y LFU) sobre una ListaOrdenadaEstática llena
+  - Contadores internos de cada una y de DiccionarioAdaptativo en un caso pequeño
+  - DiccionarioAdaptativo: migraciones que conservan el contenido
+  - Modo por lotes (python -m src --batch): salida por bloques y resumen aparte
 
 Produce un resumen final con métricas simples.
 
@@ -14,35 +23,25 @@ Opciones:
 """
 from __future__ import annotations
 
+import io
 import os
 import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src import lotes
+from src.diccionarioadaptativo import DiccionarioAdaptativo  
+from src.diccionariocache import DiccionarioCache  
+from src.listaordenadadesenrollada import ListaOrdenadaDesenrollada  
 from src.listaordenadadinamica import ListaOrdenadaDinámica  
 from src.listaordenadaestatica import ListaOrdenadaEstática  
+from src.listaordenadaestaticacompacta import ListaOrdenadaEstáticaCompacta  
+from src.listaordenadamapeada import ListaOrdenadaMapeada, escriba_mapeado, escriba_mapeado_desde_texto  
 from src.tablahashabierta import TablaHashAbierta  
-
-
-class ResultadoEstructura:
-    def __init__(self, nombre: str):
-        self.nombre = nombre
-        self.ok = True
-        self.mensajes: list[str] = []
-        self.final_repr: str = ""
-        self.tamaño: int = 0
-        # Hash extras
-        self.factor_carga: float | None = None
-        self.bucket_min: int | None = None
-        self.bucket_max: int | None = None
-        self.bucket_promedio_no_vacios: float | None = None
-
-    def agrega(self, msg: str):
-        self.mensajes.append(msg)
-
-    def fallo(self, msg: str):
-        self.ok = False
-        self.mensajes.append("ERROR: " + msg)
+from src.tablahashcompacta import TablaHashCompacta  
+from scripts.pruebas_comunes import ResultadoEstructura, imprimir_resultado, probar_contadores, probar_instantanea
 
 
 def probar_lista_dinamica(verbose: bool = True) -> ResultadoEstructura:
@@ -65,6 +64,11 @@ def probar_lista_dinamica(verbose: bool = True) -> ResultadoEstructura:
             l.inserte(x)
         if verbose:
             r.agrega(f"Reinserciones: {l}")
+        l.inserte_ordenados(["e", "a", "d"])
+        assert str(l) == "[a, c, d, d, d, e]", "Fallo en inserte_ordenados()"
+        assert l.borre_ordenados(["d", "z", "a"]) == 2, "Fallo en borre_ordenados()"
+        if verbose:
+            r.agrega(f"Tras lotes ordenados: {l}")
         r.final_repr = str(l)
         r.tamaño = len(l)
     except AssertionError as e:
@@ -74,10 +78,10 @@ def probar_lista_dinamica(verbose: bool = True) -> ResultadoEstructura:
     return r
 
 
-def probar_lista_estatica(verbose: bool = True) -> ResultadoEstructura:
-    r = ResultadoEstructura("ListaOrdenadaEstática")
+def probar_lista_estatica(verbose: bool = True, clase=ListaOrdenadaEstática) -> ResultadoEstructura:
+    r = ResultadoEstructura(clase.__name__)
     try:
-        l = ListaOrdenadaEstática(5)
+        l = clase(5)
         for x in ["b", "a", "c", "b"]:
             l.inserte(x)
         if verbose:
@@ -109,10 +113,10 @@ def probar_lista_estatica(verbose: bool = True) -> ResultadoEstructura:
     return r
 
 
-def probar_hash_abierta(verbose: bool = True) -> ResultadoEstructura:
-    r = ResultadoEstructura("TablaHashAbierta")
+def probar_hash_abierta(verbose: bool = True, clase=TablaHashAbierta) -> ResultadoEstructura:
+    r = ResultadoEstructura(clase.__name__)
     try:
-        t = TablaHashAbierta(11)
+        t = clase(11)
         for x in ["b", "a", "c", "b"]:
             t.inserte(x)
         if verbose:
@@ -140,12 +144,286 @@ def probar_hash_abierta(verbose: bool = True) -> ResultadoEstructura:
     return r
 
 
-def imprimir_resultado(r: ResultadoEstructura):
-    estado = "OK" if r.ok else "FALLO"
-    print(f"\n=== {r.nombre} -> {estado} ===")
-    for m in r.mensajes:
-        print(" -", m)
-    print(f" Final: {r.final_repr}  (tamaño={r.tamaño})")
+def probar_lista_desenrollada(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("ListaOrdenadaDesenrollada")
+    try:
+        l = ListaOrdenadaDesenrollada(4)
+        for x in ["b", "a", "c", "b"]:
+            l.inserte(x)
+        if verbose:
+            r.agrega(f"Tras inserciones: {l}")
+        assert str(l) == "[a, b, b, c]", "Orden / duplicados inesperados"
+        assert l.miembro("a") and not l.miembro("z"), "Fallo en miembro()"
+        for i in range(20):
+            l.inserte(f"x{i:02d}")
+        if verbose:
+            r.agrega(f"Bloques tras 24 inserciones (capacidad 4): {l.cantidad_bloques()}")
+        assert l.cantidad_bloques() > 1, "Los bloques llenos no se partieron"
+        for i in range(20):
+            assert l.borre(f"x{i:02d}"), "No se borró un elemento existente"
+        l.borre("b")
+        if verbose:
+            r.agrega(f"Tras borrar 'b' y las x: {l} (bloques={l.cantidad_bloques()})")
+        assert str(l) == "[a, b, c]", "Borrado inesperado"
+        assert l.cantidad_bloques() <= 2, "Los bloques con pocas claves no se fusionaron"
+        l.borre("x")
+        l.limpie()
+        assert str(l) == "[]", "Limpieza falló"
+        for x in ["d", "d", "c"]:
+            l.inserte(x)
+        if verbose:
+            r.agrega(f"Reinserciones: {l}")
+        l.inserte_ordenados(["e", "c"])
+        assert str(l) == "[c, c, d, d, e]", "Fallo en inserte_ordenados()"
+        r.final_repr = str(l)
+        r.tamaño = len(l)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_lista_mapeada(verbose: bool = True, clase=ListaOrdenadaEstática, *argumentos) -> ResultadoEstructura:
+    r = ResultadoEstructura(f"ListaOrdenadaMapeada desde {clase.__name__}")
+    try:
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "claves.dicm")
+            origen = clase(*argumentos)
+            assert escriba_mapeado(ruta, origen) == 0, "escriba_mapeado() de una fuente vacía"
+            with ListaOrdenadaMapeada(ruta) as m:
+                assert len(m) == 0 and str(m) == "[]", "Archivo mapeado vacío inesperado"
+                assert not m.miembro("a"), "miembro() en un archivo vacío"
+
+            for x in ["mora", "ñame", "kiwi", "mora", "日本", "a"]:
+                origen.inserte(x)
+            assert escriba_mapeado(ruta, origen) == len(origen), "Cantidad escrita inesperada"
+            with ListaOrdenadaMapeada(ruta) as m:
+                if verbose:
+                    r.agrega(f"Mapeada: {m}")
+                assert list(m) == list(origen), "El archivo no reproduce la fuente"
+                assert m[0] == "a" and m[len(m) - 1] == "日本", "Fallo en __getitem__()"
+                assert m.miembro("ñame") and m.miembro("日本") and m.miembro("a"), "Fallo en miembro()"
+                assert not m.miembro("ñ") and not m.miembro("zz") and not m.miembro(""), "miembro() encuentra una clave inexistente"
+                try:
+                    m.inserte("x")
+                    raise AssertionError("inserte() debería fallar en una lista de solo lectura")
+                except TypeError:
+                    pass
+                r.final_repr = str(m)
+                r.tamaño = len(m)
+
+            try:
+                escriba_mapeado(ruta, ["b", "a"])
+                raise AssertionError("escriba_mapeado() aceptó elementos desordenados")
+            except ValueError:
+                pass
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_mapeado_archivos(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("ListaOrdenadaMapeada (texto y archivos dañados)")
+    try:
+        with tempfile.TemporaryDirectory() as carpeta:
+            texto = os.path.join(carpeta, "palabras.txt")
+            ruta = os.path.join(carpeta, "palabras.dicm")
+            with open(texto, "w", encoding="utf-8", newline="") as f:
+                f.write("pera\r\nñandú\n\nárbol\npera\n日本\r\n\nzeta\na")
+            esperado = sorted(["pera", "ñandú", "árbol", "pera", "日本", "zeta", "a"])
+            assert escriba_mapeado_desde_texto(ruta, texto) == len(esperado), "Cantidad escrita desde texto inesperada"
+            with ListaOrdenadaMapeada(ruta) as m:
+                if verbose:
+                    r.agrega(f"Desde texto: {m}")
+                assert list(m) == esperado, "El archivo no reproduce las palabras del texto"
+                assert m.miembro("ñandú") and m.miembro("日本") and not m.miembro(""), "Fallo en miembro() desde texto"
+                r.final_repr = str(m)
+                r.tamaño = len(m)
+
+            with open(ruta, "rb") as f:
+                datos = f.read()
+            dañados = [datos[:corte] for corte in range(len(datos))]
+            dañados.append(b"XXXX" + datos[4:])
+            for dañado in dañados:
+                with open(ruta, "wb") as f:
+                    f.write(dañado)
+                try:
+                    ListaOrdenadaMapeada(ruta)
+                except ValueError:
+                    continue
+                raise AssertionError(f"Abrir un archivo dañado ({len(dañado)} bytes) no dio ValueError")
+            if verbose:
+                r.agrega(f"{len(dañados)} archivos cortados o ajenos rechazados")
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+def probar_cache_lista_llena(verbose: bool = True, politica: str = "lru") -> ResultadoEstructura:
+    r = ResultadoEstructura(f"DiccionarioCache ({politica}) sobre ListaOrdenadaEstática(1)")
+    try:
+        d = DiccionarioCache(ListaOrdenadaEstática(1), capacidad=4, politica=politica)
+        d.inserte("a")
+        d.inserte("b")  # la lista está llena: se descarta
+        assert len(d) == 1, "La lista llena no debería crecer"
+        assert not d.miembro("b"), "La memoria reporta una inserción descartada"
+        assert d.miembro("a"), "Fallo en miembro() de una clave insertada"
+        assert not d.miembro("b"), "La respuesta negativa memorizada es incorrecta"
+        d.inserte("b")  # vuelve a descartarse con un negativo ya en memoria
+        assert not d.miembro("b"), "Una inserción descartada invalidó mal la memoria"
+        assert d.borre("a") and not d.miembro("a"), "Fallo en borre()"
+        d.inserte("b")  # ahora sí cabe
+        assert d.miembro("b"), "La memoria no refleja una inserción aceptada"
+        if verbose:
+            r.agrega(f"Aciertos={d.aciertos} fallos={d.fallos}")
+        r.final_repr = str(d)
+        r.tamaño = len(d)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+# Cada clase con los argumentos de sus pruebas genéricas (pruebas_comunes).
+CLASES = [
+    (ListaOrdenadaDinámica,),
+    (ListaOrdenadaEstática, 20),
+    (TablaHashAbierta, 5),
+    (ListaOrdenadaDesenrollada, 4),
+    (ListaOrdenadaEstáticaCompacta, 20),
+    (TablaHashCompacta, 5),
+]
+
+# Conteos esperados para: inserte d, b, c, a, e; miembro c, z; borre b, a.
+CONTADORES_ESPERADOS = {
+    "ListaOrdenadaDinámica": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 17, "comparaciones": 25},
+    "ListaOrdenadaEstática": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 17, "comparaciones": 20, "corrimientos": 11},
+    "ListaOrdenadaEstáticaCompacta": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 17, "comparaciones": 20, "corrimientos": 11},
+    "ListaOrdenadaDesenrollada": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 10, "comparaciones": 21, "corrimientos": 5, "particiones": 1, "fusiones": 1},
+    "TablaHashAbierta": {"inserte": 5, "miembro": 2, "borre": 2, "cubetas": 9, "largo_cubetas": 4, "comparaciones": 4, "rehashes": 1},
+    "TablaHashCompacta": {"inserte": 5, "miembro": 2, "borre": 2, "cubetas": 9, "largo_cubetas": 4, "comparaciones": 4, "comparaciones_arena": 3, "rehashes": 1},
+    "DiccionarioAdaptativo": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 8, "comparaciones": 22, "corrimientos": 11},
+}
+
+
+def probar_adaptativo(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("DiccionarioAdaptativo (migraciones)")
+    try:
+        palabras = [f"{chr(97 + i % 26)}{i:04d}" for i in range(2000)]
+        d = DiccionarioAdaptativo(ventana=256)
+        d.active_estadisticas()
+        for x in palabras:
+            d.inserte(x)
+        assert d.implementacion == "ListaOrdenadaDesenrollada", "Migró sin que otra fuera más barata"
+        for i in range(20000):
+            assert d.miembro(palabras[i % len(palabras)]), "miembro() perdió una clave"
+        if verbose:
+            r.agrega(f"Migraciones con costos por defecto: {d.migraciones}")
+        assert d.implementacion == "TriePunteros", "Con muchas búsquedas en N=2000 debería pasar al trie"
+        assert d.migraciones == [{"n": 2000, "desde": "ListaOrdenadaDesenrollada", "hacia": "TriePunteros"}], \
+            "Migraciones inesperadas"
+        assert d.estadisticas()["migraciones"] == 1, "El contador de migraciones no coincide"
+        assert list(d) == sorted(palabras) and len(d) == len(palabras), "La migración cambió el contenido"
+        assert d.borre("a0000") and not d.miembro("a0000") and d.miembro("b0001"), "Fallo en borre() tras migrar"
+        d.limpie()
+        assert d.implementacion == "ListaOrdenadaDesenrollada" and len(d) == 0, "limpie() debe volver a la inicial"
+
+        # tabla a la medida: la hash es más barata desde N=100 y migrar cuesta poco
+        costos = {
+            "ListaOrdenadaDesenrollada": [(10, {"inserte": 10, "borre": 10, "miembro": 10}),
+                                          (1000, {"inserte": 1000, "borre": 1000, "miembro": 1000})],
+            "TablaHashAbierta": [(10, {"inserte": 100, "borre": 100, "miembro": 100}),
+                                 (1000, {"inserte": 100, "borre": 100, "miembro": 100})],
+        }
+        d = DiccionarioAdaptativo(costos=costos, ventana=64)
+        for x in palabras[:600]:
+            d.inserte(x)
+        d.inserte("a0000")
+        assert d.implementacion == "TablaHashAbierta", "Con inserciones debería pasar a la tabla hash"
+        assert [m["hacia"] for m in d.migraciones] == ["TablaHashAbierta"], "Debe migrar una sola vez"
+        assert sorted(d) == sorted(palabras[:600] + ["a0000"]), "La migración cambió el contenido"
+        assert d.borre("a0000") and d.miembro("a0000"), "Los duplicados deben sobrevivir a la migración"
+        r.final_repr = f"{d.implementacion} con {len(d)} claves"
+        r.tamaño = len(d)
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
+
+LOTE = """# comentario ignorado
++pera
++manzana
++pera
+?pera
+?kiwi
+
+-pera
+?pera
+-kiwi
+len
+print
++ñandú con espacio 
+?ñandú con espacio 
+clear
+len
+print
+"""
+
+SALIDA_LOTE = "1\n0\n1\n2\n[manzana, pera]\n1\n0\n[]\n"
+
+
+def probar_lotes(verbose: bool = True) -> ResultadoEstructura:
+    r = ResultadoEstructura("Modo por lotes (python -m src --batch)")
+    try:
+        salida = io.StringIO()
+        tiempos = lotes.ejecute_lote(ListaOrdenadaDinámica(), io.StringIO(LOTE), salida, bloque=2)
+        assert salida.getvalue() == SALIDA_LOTE, f"Salida inesperada: {salida.getvalue()!r}"
+        veces = {c: v for c, (v, _) in tiempos.items()}
+        assert veces == {"inserte": 4, "borre": 2, "miembro": 4, "print": 2, "clear": 1, "len": 2}, \
+            f"Conteo de comandos inesperado: {veces}"
+
+        salida = io.StringIO()
+        try:
+            lotes.ejecute_lote(ListaOrdenadaDinámica(), io.StringIO("+a\n?a\nborrar a\n?a\n"), salida)
+            raise AssertionError("Un comando desconocido no dio ValueError")
+        except ValueError as e:
+            assert "línea 3" in str(e), "El error no indica la línea"
+        assert salida.getvalue() == "1\n", "Lo ejecutado antes del error no quedó escrito"
+
+        # main() completo, con la entrada estándar en memoria
+        for quiet in (False, True):
+            stdout, stderr = io.StringIO(), io.StringIO()
+            entrada, sys.stdin = sys.stdin, io.StringIO(LOTE)
+            try:
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    argumentos = ["--impl", "listaordenadadinamica", "--batch", "-"] + (["--quiet"] if quiet else [])
+                    codigo = lotes.main(argumentos)
+            finally:
+                sys.stdin = entrada
+            assert codigo == 0, f"main() devolvió {codigo}"
+            assert stdout.getvalue() == SALIDA_LOTE, "La salida estándar trae algo más que los resultados"
+            if quiet:
+                assert stderr.getvalue() == "", "--quiet no omitió el resumen"
+            else:
+                assert stderr.getvalue().startswith("ListaOrdenadaDinámica: 15 comandos"), "Falta el resumen en stderr"
+                if verbose:
+                    r.agrega(f"Resumen: {stderr.getvalue().splitlines()[0]}")
+        r.final_repr = SALIDA_LOTE.replace("\n", " ").strip()
+        r.tamaño = 0
+    except AssertionError as e:
+        r.fallo(str(e))
+    except Exception as e:  
+        r.fallo(f"Excepción inesperada: {e.__class__.__name__}: {e}")
+    return r
+
 
 def main(argv: list[str]):
     verbose = "--sin-detalle" not in argv
@@ -155,6 +433,24 @@ def main(argv: list[str]):
     resultados.append(probar_lista_dinamica(verbose))
     resultados.append(probar_lista_estatica(verbose))
     resultados.append(probar_hash_abierta(verbose))
+    resultados.append(probar_lista_desenrollada(verbose))
+    resultados.append(probar_lista_estatica(verbose, ListaOrdenadaEstáticaCompacta))
+    resultados.append(probar_hash_abierta(verbose, TablaHashCompacta))
+    for clase, *argumentos in CLASES:
+        resultados.append(probar_instantanea(verbose, clase, *argumentos))
+    resultados.append(probar_lista_mapeada(verbose, ListaOrdenadaEstática, 10))
+    resultados.append(probar_lista_mapeada(verbose, ListaOrdenadaEstáticaCompacta, 10))
+    resultados.append(probar_lista_mapeada(verbose, ListaOrdenadaDinámica))
+    resultados.append(probar_lista_mapeada(verbose, ListaOrdenadaDesenrollada, 4))
+    resultados.append(probar_lista_mapeada(verbose, TablaHashAbierta, 11))
+    resultados.append(probar_mapeado_archivos(verbose))
+    resultados.append(probar_cache_lista_llena(verbose, "lru"))
+    resultados.append(probar_cache_lista_llena(verbose, "lfu"))
+    for clase, *argumentos in CLASES + [(DiccionarioAdaptativo,)]:
+        esperado = CONTADORES_ESPERADOS[clase.__name__]
+        resultados.append(probar_contadores(verbose, esperado, clase, *argumentos))
+    resultados.append(probar_adaptativo(verbose))
+    resultados.append(probar_lotes(verbose))
     if verbose:
         for r in resultados:
             imprimir_resultado(r)
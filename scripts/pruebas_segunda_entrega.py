@@ -5,6 +5,8 @@ Ejecuta:
     - ABBVectorHeap
     - TriePunteros
     - TrieArreglos
+    - guarde/cargue de cada una (vacía, con claves no ASCII y dañada)
+    - contadores internos de cada una en un caso pequeño
 
 Produce un resumen final con métricas simples.
 
@@ -17,7 +19,6 @@ from __future__ import annotations
 
 import os
 import sys
-from dataclasses import dataclass
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -25,26 +26,7 @@ from src.abbpunteros import AbbPunteros
 from src.abbvectorheap import ABBVectorHeap
 from src.triearreglos import TrieArreglos
 from src.triepunteros import TriePunteros
-
-
-@dataclass
-class ResultadoEstructura:
-    nombre: str
-    ok: bool = True
-    mensajes: list[str] = None
-    final_repr: str = ""
-    tamaño: int = 0
-
-    def __post_init__(self) -> None:
-        if self.mensajes is None:
-            self.mensajes = []
-
-    def agrega(self, msg: str) -> None:
-        self.mensajes.append(msg)
-
-    def fallo(self, msg: str) -> None:
-        self.ok = False
-        self.mensajes.append("ERROR: " + msg)
+from scripts.pruebas_comunes import ResultadoEstructura, imprimir_resultado, probar_contadores, probar_instantanea
 
 
 def probar_abb_punteros(verbose: bool = True) -> ResultadoEstructura:
@@ -135,6 +117,10 @@ def _ejecutar_casos_trie(trie, verbose: bool, nombre: str) -> ResultadoEstructur
         assert len(trie) == 0, "El trie debe quedar vacío"
         assert str(trie) == "[]", "Representación inesperada tras limpiar"
 
+        trie.inserte_ordenados(["sol", "sal", "sol"])
+        assert str(trie) == "[sal, sol, sol]", "Fallo en inserte_ordenados()"
+        trie.limpie()
+
         if verbose:
             r.agrega("Trie vacío tras borrados: []")
         r.final_repr = str(trie)
@@ -154,12 +140,18 @@ def probar_trie_arreglos(verbose: bool = True) -> ResultadoEstructura:
     return _ejecutar_casos_trie(TrieArreglos(), verbose, "TrieArreglos")
 
 
-def imprimir_resultado(r: ResultadoEstructura) -> None:
-    estado = "OK" if r.ok else "FALLO"
-    print(f"\n=== {r.nombre} -> {estado} ===")
-    for m in r.mensajes:
-        print(" -", m)
-    print(f" Final: {r.final_repr}  (tamaño={r.tamaño})")
+CLASES = (AbbPunteros, ABBVectorHeap, TriePunteros, TrieArreglos)
+
+# Conteos esperados para: inserte d, b, c, a, e; miembro c, z; borre b, a.
+CONTADORES_ESPERADOS = {
+    "AbbPunteros": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 18, "comparaciones": 26},
+    "ABBVectorHeap": {
+        "inserte": 5, "miembro": 2, "borre": 2, "visitados": 16, "comparaciones": 24,
+        "ampliaciones": 9, "reconstrucciones": 2, "reubicados": 7,
+    },
+    "TriePunteros": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 3, "nodos_creados": 5, "nodos_podados": 2},
+    "TrieArreglos": {"inserte": 5, "miembro": 2, "borre": 2, "visitados": 3, "nodos_creados": 5, "nodos_podados": 2},
+}
 
 
 def main(argv: list[str]) -> None:
@@ -171,6 +163,10 @@ def main(argv: list[str]) -> None:
     resultados.append(probar_abb_vector(verbose))
     resultados.append(probar_trie_punteros(verbose))
     resultados.append(probar_trie_arreglos(verbose))
+    for clase in CLASES:
+        resultados.append(probar_instantanea(verbose, clase))
+    for clase in CLASES:
+        resultados.append(probar_contadores(verbose, CONTADORES_ESPERADOS[clase.__name__], clase))
     if verbose:
         for r in resultados:
             imprimir_resultado(r)
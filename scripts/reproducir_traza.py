@@ -0,0 +1,100 @@
+"""Reproduce una traza de operaciones (DiccionarioGrabador) sobre las estructuras.
+
+Lee la traza en flujo (una línea a la vez, también ``.gz``), así que no hace
+falta que quepa en memoria; con varias estructuras el archivo se recorre una
+vez por cada una. Para cada estructura reporta operaciones por segundo,
+percentiles de latencia por operación y cuántos resultados difieren de los
+grabados (p. ej. los ABB ignoran duplicados).
+
+Uso rápido en consola:
+  py scripts/reproducir_traza.py traza.jsonl.gz
+  py scripts/reproducir_traza.py traza.jsonl --impl TablaHashAbierta,TriePunteros
+
+Parámetros:
+  traza                  Archivo JSON lines (o .gz) con las operaciones
+  --impl todas           Estructuras separadas por comas, o "todas"
+  --capacity 100000      N esperado, para dimensionar las listas estáticas
+  --json salida.json     Guarda el reporte en JSON
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from scripts.analisis_tercera_entrega import STRUCTURES, build_factory
+from scripts.histograma_latencias import PERCENTILES, LatencyHistogram
+from src.diccionariograbador import OPERACIONES, lea_traza
+
+
+def replay(path: str, d: object) -> dict:
+    """Reproduce la traza sobre ``d`` midiendo cada llamada por separado."""
+    hists = {op: LatencyHistogram() for op in OPERACIONES}
+    calls = {op: getattr(d, op) for op in OPERACIONES}
+    clock = time.perf_counter_ns
+    mismatches = 0
+    busy_ns = 0
+    for op, x, expected in lea_traza(path):
+        fn = calls[op]
+        if x is None:
+            t0 = clock()
+            result = fn()
+            dt = clock() - t0
+        else:
+            t0 = clock()
+            result = fn(x)
+            dt = clock() - t0
+        busy_ns += dt
+        hists[op].record(dt)
+        if expected is not None and result != expected:
+            mismatches += 1
+    total = LatencyHistogram()
+    for h in hists.values():
+        total.merge(h)
+    return {
+        "ops": total.total,
+        "busy_s": busy_ns / 1e9,
+        "ops_per_s": total.total / (busy_ns / 1e9) if busy_ns else 0.0,
+        "mismatches": mismatches,
+        "final_size": len(d),  # type: ignore[arg-type]
+        "all": total.summary(),
+        "by_op": {op: h.summary() for op, h in hists.items() if h.total},
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Reproduce una traza de operaciones")
+    parser.add_argument("traza")
+    parser.add_argument("--impl", type=str, default="todas")
+    parser.add_argument("--capacity", type=int, default=100_000)
+    parser.add_argument("--json", type=str, default="")
+    args = parser.parse_args(argv)
+
+    names = STRUCTURES if args.impl == "todas" else [x.strip() for x in args.impl.split(",") if x.strip()]
+    header = " ".join(f"{'p' + format(p, 'g'):>9}" for p in PERCENTILES)
+    print(f"{'estructura':<30} {'ops/s':>12} {header} {'max':>10} {'difieren':>9}")
+    report: dict[str, dict] = {}
+    for name in names:
+        d = build_factory(name)(args.capacity)
+        r = replay(args.traza, d)
+        report[name] = r
+        cols = " ".join(f"{r['all'][f'p{p:g}']:>7}ns" for p in PERCENTILES)
+        print(f"{name:<30} {r['ops_per_s']:>12.0f} {cols} {r['all']['max']:>8}ns {r['mismatches']:>9}")
+        for op, summary in r["by_op"].items():
+            cols = " ".join(f"{summary[f'p{p:g}']:>7}ns" for p in PERCENTILES)
+            print(f"  {op:<28} {int(summary['count']):>12} {cols} {summary['max']:>8}ns")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"trace": args.traza, "results": report}, f, ensure_ascii=False, indent=2)
+        print(f"\nReporte JSON: {args.json}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
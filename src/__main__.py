@@ -1,4 +1,11 @@
+import sys
+
 from . import main
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # con argumentos: modo por lotes, sin rich ni la interfaz de menú
+        from .lotes import main as main_lotes
+
+        sys.exit(main_lotes(sys.argv[1:]))
     main()
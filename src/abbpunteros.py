@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from array import array
+from collections import Counter
 from dataclasses import dataclass
+from typing import IO, Iterator
 
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
-@dataclass
+@dataclass(slots=True)
 class _NodoAbb:
     clave: str
     izquierdo: _NodoAbb | None = None
@@ -34,6 +38,8 @@ class AbbPunteros(Diccionario):
         posición correspondiente. Al detectar un duplicado, no modifica la
         estructura para mantener claves únicas.
         """
+        if self._contadores is not None:
+            self.__cuente("inserte", elemento, self._contadores)
         self.__raiz, insertado = self.__inserte_rec(self.__raiz, elemento)
         if insertado:
             self.__tamaño += 1
@@ -46,6 +52,8 @@ class AbbPunteros(Diccionario):
         (reemplazo por el sucesor in-order) y actualiza el tamaño en
         consecuencia.
         """
+        if self._contadores is not None:
+            self.__cuente("borre", elemento, self._contadores)
         self.__raiz, borrado = self.__borre_rec(self.__raiz, elemento)
         if borrado:
             self.__tamaño -= 1
@@ -59,6 +67,8 @@ class AbbPunteros(Diccionario):
 
     def miembro(self, elemento: str) -> bool:
         """Devuelve ``True`` si ``elemento`` existe en el árbol."""
+        if self._contadores is not None:
+            self.__cuente("miembro", elemento, self._contadores)
         return self.__miembro_rec(self.__raiz, elemento)
 
     def imprima(self) -> None:
@@ -69,6 +79,78 @@ class AbbPunteros(Diccionario):
         """Entrega la cantidad de claves almacenadas."""
         return self.__tamaño
 
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda el árbol en preorden con la forma de cada nodo.
+
+        Por nodo se escribe un byte con bit 0 = tiene hijo izquierdo y
+        bit 1 = tiene hijo derecho, de modo que la carga reproduce la misma
+        forma sin comparar claves.
+        """
+        claves: list[str | None] = []
+        formas = array("B")
+        pila = [self.__raiz] if self.__raiz is not None else []
+        while pila:
+            nodo = pila.pop()
+            claves.append(nodo.clave)
+            formas.append((nodo.izquierdo is not None) | ((nodo.derecho is not None) << 1))
+            if nodo.derecho is not None:
+                pila.append(nodo.derecho)
+            if nodo.izquierdo is not None:
+                pila.append(nodo.izquierdo)
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, formas, "B")
+            instantanea.escriba_hileras(f, claves)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Reconstruye los nodos en preorden siguiendo las formas guardadas."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            formas = instantanea.lea_enteros(f, invertir)
+            claves = instantanea.lea_hileras_completas(f, invertir)
+        nodos = [_NodoAbb(c) for c in claves]
+        pendientes: list[int] = []  # nodos cuyo hijo derecho aún no aparece
+        for i in range(1, len(nodos)):
+            j = i - 1
+            forma = formas[j]
+            if forma & 1:
+                nodos[j].izquierdo = nodos[i]
+                if forma & 2:
+                    pendientes.append(j)
+            elif forma & 2:
+                nodos[j].derecho = nodos[i]
+            else:
+                nodos[pendientes.pop()].derecho = nodos[i]
+        self.__raiz = nodos[0] if nodos else None
+        self.__tamaño = len(nodos)
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto y cada nodo (más las claves si se piden).
+
+        Los nodos usan ``__slots__``: su tamaño es el de ``sys.getsizeof``,
+        sin diccionario de atributos.
+        """
+        total = memoria.bytes_objeto(self)
+        claves: list[str] = []
+        pendientes = [self.__raiz] if self.__raiz is not None else []
+        while pendientes:
+            nodo = pendientes.pop()
+            total += memoria.tamaño(nodo)
+            claves.append(nodo.clave)
+            if nodo.izquierdo is not None:
+                pendientes.append(nodo.izquierdo)
+            if nodo.derecho is not None:
+                pendientes.append(nodo.derecho)
+        if incluir_claves:
+            total += memoria.bytes_hileras(claves)
+        return total
+
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las claves in-order."""
+        elementos: list[str] = []
+        self.__recorrido_inorder(self.__raiz, elementos)
+        return iter(elementos)
+
     def __str__(self) -> str:
         """Construye una representación legible con las claves ordenadas."""
         elementos: list[str] = []
@@ -120,6 +202,37 @@ class AbbPunteros(Diccionario):
         salida.append(raiz.clave)
         self.__recorrido_inorder(raiz.derecho, salida)
 
+    def __cuente(self, op: str, elemento: str, c: Counter[str]) -> None:
+        """Repite el descenso de ``op`` contando nodos visitados y comparaciones.
+
+        Cada nivel compara con ``<`` y, si no alcanza, con ``>``. Un borrado
+        con dos hijos suma la bajada al sucesor y su borrado recursivo.
+        """
+        c[op] += 1
+        visitados = comparaciones = 0
+        nodo = self.__raiz
+        while nodo is not None:
+            visitados += 1
+            comparaciones += 1
+            if elemento < nodo.clave:
+                nodo = nodo.izquierdo
+                continue
+            comparaciones += 1
+            if elemento > nodo.clave:
+                nodo = nodo.derecho
+                continue
+            if op == "borre" and nodo.izquierdo is not None and nodo.derecho is not None:
+                camino = 1
+                sucesor = nodo.derecho
+                while sucesor.izquierdo is not None:
+                    sucesor = sucesor.izquierdo
+                    camino += 1
+                visitados += 2 * camino
+                comparaciones += camino + 1
+            break
+        c["visitados"] += visitados
+        c["comparaciones"] += comparaciones
+
     def __minimo(self, raiz: _NodoAbb) -> _NodoAbb:
         actual = raiz
         while actual.izquierdo is not None:
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections import Counter
+from typing import IO, Iterator
+
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
@@ -11,9 +15,17 @@ class ABBVectorHeap(Diccionario):
     facilita los cálculos y mantiene buena localidad de referencia, pero
     requiere compactar el arreglo cada vez que se liberan huecos tras un
     borrado.
+
+    Con claves ordenadas o casi ordenadas el árbol degenera en una rama y
+    el vector crece exponencialmente con la profundidad (profundidad ``d``
+    pide ``2**d`` posiciones). Por eso el vector no pasa de
+    ``CAPACIDAD_MAXIMA`` posiciones (unos 256 MiB de punteros): una
+    inserción que lo requeriría lanza ``MemoryError`` y deja el árbol sin
+    cambios, en lugar de agotar la memoria del sistema.
     """
 
     permite_duplicados = False
+    CAPACIDAD_MAXIMA = 1 << 25
 
     def __init__(self) -> None:
         """Crea un ABB vacío inicializando el vector con una entrada centinela."""
@@ -26,6 +38,8 @@ class ABBVectorHeap(Diccionario):
         Si la clave ya existe no se realiza ninguna modificación para mantener
         la propiedad de claves únicas del ABB.
         """
+        if self._contadores is not None:
+            self.__cuente("inserte", elemento, self._contadores)
         indice = 1
         while True:
             self.__asegure_capacidad(indice)
@@ -50,6 +64,8 @@ class ABBVectorHeap(Diccionario):
         dos hijos) mediante sustitución por el sucesor inmediato. Ajusta el
         contador interno y compacta el vector para evitar residuos al final.
         """
+        if self._contadores is not None:
+            self.__cuente("borre", elemento, self._contadores)
         if self.__borre_rec(1, elemento):
             self.__tamaño -= 1
 
@@ -57,6 +73,9 @@ class ABBVectorHeap(Diccionario):
             self.__recorrido_inorder(1, elems)
 
 
+            if self._contadores is not None:
+                self._contadores["reconstrucciones"] += 1
+                self._contadores["reubicados"] += len(elems)
             self.__vector = [None]
             self.__tamaño = 0
             self.__reconstruya_desde_ordenado(elems, 1)
@@ -74,12 +93,20 @@ class ABBVectorHeap(Diccionario):
 
     def miembro(self, elemento: str) -> bool:
         """Devuelve ``True`` si ``elemento`` existe en el árbol."""
+        if self._contadores is not None:
+            self.__cuente("miembro", elemento, self._contadores)
         return self.__miembro_rec(1, elemento)
 
     def imprima(self) -> None:
         """Imprime el recorrido in-order del ABB."""
         print(self)
 
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las claves in-order."""
+        elems: list[str] = []
+        self.__recorrido_inorder(1, elems)
+        return iter(elems)
+
     def __str__(self) -> str:
         """Genera una representación tipo lista ordenada para depuración."""
         elems: list[str] = []
@@ -90,6 +117,29 @@ class ABBVectorHeap(Diccionario):
         """Retorna la cantidad de claves almacenadas."""
         return self.__tamaño
 
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda el vector completo, huecos (``None``) incluidos."""
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, [self.__tamaño])
+            instantanea.escriba_hileras(f, self.__vector)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura el vector posición por posición, sin reconstruir el árbol."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (tamaño,) = instantanea.lea_enteros(f, invertir)
+            vector = instantanea.lea_hileras(f, invertir)
+        self.__vector = vector if vector else [None]
+        self.__tamaño = tamaño
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto y vector completo, huecos incluidos (más las claves si se piden)."""
+        total = memoria.bytes_objeto(self) + memoria.tamaño(self.__vector)
+        if incluir_claves:
+            total += memoria.bytes_hileras(self.__vector)
+        return total
+
     def __borre_rec(self, indice: int, elemento: str) -> bool:
         if self.__es_vacio(indice):
             return False
@@ -140,6 +190,29 @@ class ABBVectorHeap(Diccionario):
         salida.append(valor)
         self.__recorrido_inorder(self.__hijo_derecho(indice), salida)
 
+    def __cuente(self, op: str, elemento: str, c: Counter[str]) -> None:
+        """Repite el descenso de ``op`` contando casillas visitadas y
+        comparaciones (``<`` y, si no alcanza, ``>`` en cada nivel); el
+        costo del borrado lo dominan ``reconstrucciones`` y ``reubicados``.
+        """
+        c[op] += 1
+        visitados = comparaciones = 0
+        indice = 1
+        while not self.__es_vacio(indice):
+            valor = self.__vector[indice]
+            visitados += 1
+            comparaciones += 1
+            if elemento < valor:
+                indice = self.__hijo_izquierdo(indice)
+                continue
+            comparaciones += 1
+            if elemento > valor:
+                indice = self.__hijo_derecho(indice)
+                continue
+            break
+        c["visitados"] += visitados
+        c["comparaciones"] += comparaciones
+
     def __indice_minimo(self, indice: int) -> int:
         actual = indice
         while not self.__es_vacio(self.__hijo_izquierdo(actual)):
@@ -156,6 +229,12 @@ class ABBVectorHeap(Diccionario):
 
     def __asegure_capacidad(self, indice: int) -> None:
         if indice >= len(self.__vector):
+            if indice >= self.CAPACIDAD_MAXIMA:
+                raise MemoryError(
+                    f"ABBVectorHeap necesitaría {indice + 1} posiciones (árbol degenerado)."
+                )
+            if self._contadores is not None:
+                self._contadores["ampliaciones"] += 1
             self.__vector.extend([None] * (indice - len(self.__vector) + 1))
 
     def __es_vacio(self, indice: int) -> bool:
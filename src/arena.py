@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import struct
+from array import array
+
+from . import memoria
+
+_LARGO = struct.Struct("<I")
+
+
+class ArenaHileras:
+    """Almacén contiguo de hileras en UTF-8 referenciadas por desplazamiento.
+
+    Cada hilera se guarda como ``largo (u32) | bytes`` dentro de un único
+    ``bytearray``; quien la guarda conserva solo el desplazamiento (un entero
+    que cabe en un ``array('q')``). Los borrados no liberan espacio de
+    inmediato: se contabilizan como bytes muertos y ``compacte`` reescribe la
+    arena con las hileras vivas cuando el desperdicio lo amerita.
+    """
+
+    __slots__ = ("__datos", "__muertos")
+
+    def __init__(self) -> None:
+        self.__datos = bytearray()
+        self.__muertos: int = 0
+
+    def __len__(self) -> int:
+        """Bytes ocupados por la arena (vivos y muertos)."""
+        return len(self.__datos)
+
+    def agregue(self, codificada: bytes) -> int:
+        """Copia ``codificada`` al final de la arena y devuelve su posición."""
+        pos = len(self.__datos)
+        self.__datos += _LARGO.pack(len(codificada))
+        self.__datos += codificada
+        return pos
+
+    def crudo(self, pos: int) -> bytearray:
+        """Bytes UTF-8 de la hilera en ``pos``.
+
+        Devuelve la tajada del ``bytearray`` (una sola copia), que se compara
+        con ``bytes`` igual que estos. No es una ``memoryview``: una vista no
+        admite ``<`` y, mientras viva, impide que la arena crezca.
+        """
+        (largo,) = _LARGO.unpack_from(self.__datos, pos)
+        inicio = pos + 4
+        return self.__datos[inicio : inicio + largo]
+
+    def hilera(self, pos: int) -> str:
+        return self.crudo(pos).decode("utf-8", "surrogatepass")
+
+    def es_igual(self, pos: int, codificada: bytes) -> bool:
+        """Compara sin copiar, sobre una vista de la arena."""
+        (largo,) = _LARGO.unpack_from(self.__datos, pos)
+        if largo != len(codificada):
+            return False
+        inicio = pos + 4
+        with memoryview(self.__datos) as vista:
+            return vista[inicio : inicio + largo] == codificada
+
+    def libere(self, pos: int) -> None:
+        """Marca como muerta la hilera en ``pos`` (no mueve nada)."""
+        (largo,) = _LARGO.unpack_from(self.__datos, pos)
+        self.__muertos += 4 + largo
+
+    def requiere_compactar(self) -> bool:
+        """``True`` cuando más de la mitad de la arena son bytes muertos."""
+        return self.__muertos > 4096 and 2 * self.__muertos > len(self.__datos)
+
+    def compacte(self, posiciones: array) -> array:
+        """Reescribe la arena solo con ``posiciones`` y devuelve las nuevas.
+
+        El resultado conserva el orden de ``posiciones``.
+        """
+        viejos = self.__datos
+        nuevos = bytearray()
+        salida = array("q")
+        for pos in posiciones:
+            (largo,) = _LARGO.unpack_from(viejos, pos)
+            salida.append(len(nuevos))
+            nuevos += viejos[pos : pos + 4 + largo]
+        self.__datos = nuevos
+        self.__muertos = 0
+        return salida
+
+    def limpie(self) -> None:
+        self.__datos = bytearray()
+        self.__muertos = 0
+
+    def como_bytes(self) -> bytes:
+        return bytes(self.__datos)
+
+    def restaure(self, datos: bytes, muertos: int) -> None:
+        self.__datos = bytearray(datos)
+        self.__muertos = muertos
+
+    def memoria_bytes(self, incluir_datos: bool = True) -> int:
+        """Objeto más, si se pide, el ``bytearray`` con las hileras codificadas."""
+        total = memoria.bytes_objeto(self)
+        if incluir_datos:
+            total += memoria.tamaño(self.__datos)
+        return total
+
+    def bytes_muertos(self) -> int:
+        return self.__muertos
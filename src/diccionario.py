@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import Counter
+from typing import IO, Iterator
 
 
 class Diccionario(ABC):
@@ -9,6 +11,9 @@ class Diccionario(ABC):
 	Todas las implementaciones trabajarán con elementos de tipo str.
 	"""
 
+	# contadores de instrumentación; None = apagados (ver active_estadisticas)
+	_contadores: Counter[str] | None = None
+
 	@abstractmethod
 	def inserte(self, elemento: str) -> None:
 		"""Inserta un elemento (se permiten repetidos)."""
@@ -34,6 +39,45 @@ class Diccionario(ABC):
 		"""Imprime el contenido del diccionario (representación amigable)."""
 		raise NotImplementedError
 
+	def __iter__(self) -> Iterator[str]:
+		"""Recorre los elementos en orden ascendente (incluye duplicados)."""
+		raise NotImplementedError(
+			f"{self.__class__.__name__} no soporta recorrido ordenado."
+		)
+
+	@abstractmethod
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Escribe una instantánea binaria (ver ``instantanea.py``) en ``destino``."""
+		raise NotImplementedError
+
+	@abstractmethod
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		"""Reemplaza el contenido con el de una instantánea, sin reinsertar."""
+		raise NotImplementedError
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Bytes que retiene la estructura (ver ``memoria.py``).
+
+		Con ``incluir_claves`` suma además las hileras almacenadas.
+		"""
+		raise NotImplementedError(
+			f"{self.__class__.__name__} no reporta su memoria."
+		)
+
+	def active_estadisticas(self, activar: bool = True) -> None:
+		"""Enciende (desde cero) o apaga los contadores de operaciones internas.
+
+		Apagados, cada operación solo paga una comparación con ``None``;
+		encendidos, las implementaciones recorren de nuevo el camino de la
+		operación para contar comparaciones, nodos visitados, corrimientos,
+		etc., así que los tiempos medidos con ellos encendidos no sirven.
+		"""
+		self._contadores = Counter() if activar else None
+
+	def estadisticas(self) -> dict[str, int]:
+		"""Copia de los contadores (vacía si están apagados o no se llevan)."""
+		return dict(self._contadores) if self._contadores is not None else {}
+
 	@abstractmethod
 	def __str__(self) -> str:  # pragma: no cover - contrato de representación
 		raise NotImplementedError
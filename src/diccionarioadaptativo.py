@@ -0,0 +1,336 @@
+"""Diccionario que cambia de implementación según el tamaño y la carga.
+
+El modelo de costos es una tabla, por implementación, de tiempos medios
+(ns) de ``inserte``, ``borre`` y ``miembro`` medidos en algunos tamaños N,
+como los que deja ``scripts/analisis_tercera_entrega.py`` en
+``bench_*.json`` (``costos_desde_bench``). Entre dos N medidos el costo se
+interpola en escala log–log y fuera del rango se extrapola con la pendiente
+de los dos puntos extremos, así que una estructura O(n) sigue encareciéndose
+más allá de lo medido.
+"""
+from __future__ import annotations
+
+import io
+import json
+import math
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from . import cargue_clase, cree_diccionario, instantanea, memoria, resuelva_nombre
+from .diccionario import Diccionario
+
+OPERACIONES = ("inserte", "borre", "miembro")
+
+# operación del diccionario -> operación en bench_*.json
+_OPERACIONES_BENCH = {"inserte": "insert", "borre": "delete", "miembro": "search"}
+
+# estructuras de capacidad fija: descartan inserciones al llenarse
+_CAPACIDAD_FIJA = ("ListaOrdenadaEstática", "ListaOrdenadaEstáticaCompacta")
+
+Costos = dict[str, list[tuple[int, dict[str, float]]]]
+
+# medianas de tres corridas del análisis (--sizes 100,1000,10000,100000,
+# --trials 200) con la verificación de invariantes desactivada: esa
+# verificación es O(n) por mutación y haría que las listas parecieran
+# mucho más caras de lo que son, y el resto igual de caro que ellas
+COSTOS_POR_DEFECTO: Costos = {
+    "ListaOrdenadaDesenrollada": [
+        (100, {"inserte": 380, "borre": 300, "miembro": 260}),
+        (1000, {"inserte": 780, "borre": 940, "miembro": 820}),
+        (10000, {"inserte": 4_610, "borre": 5_510, "miembro": 5_220}),
+        (100000, {"inserte": 91_970, "borre": 113_520, "miembro": 89_270}),
+    ],
+    "ListaOrdenadaDinámica": [
+        (100, {"inserte": 2_220, "borre": 710, "miembro": 1_120}),
+        (1000, {"inserte": 11_050, "borre": 9_550, "miembro": 10_700}),
+        (10000, {"inserte": 200_870, "borre": 225_580, "miembro": 193_500}),
+    ],
+    "TablaHashAbierta": [
+        (100, {"inserte": 2_040, "borre": 2_100, "miembro": 1_950}),
+        (1000, {"inserte": 2_150, "borre": 2_340, "miembro": 1_960}),
+        (10000, {"inserte": 2_080, "borre": 2_320, "miembro": 1_990}),
+        (100000, {"inserte": 2_060, "borre": 2_260, "miembro": 1_920}),
+    ],
+    "TriePunteros": [
+        (100, {"inserte": 4_980, "borre": 4_730, "miembro": 380}),
+        (1000, {"inserte": 4_450, "borre": 4_620, "miembro": 380}),
+        (10000, {"inserte": 4_490, "borre": 4_730, "miembro": 390}),
+        (100000, {"inserte": 14_680, "borre": 14_930, "miembro": 430}),
+    ],
+}
+
+
+def costos_desde_bench(ruta: str, candidatas: Iterable[str] | None = None) -> Costos:
+    """Tabla de costos a partir de un ``bench_*.json`` del análisis.
+
+    Toma la media de ``insert``, ``delete`` y ``search`` de cada tamaño
+    medido; las celdas omitidas (p. ej. por ``timeout``) simplemente no
+    aparecen. Con ``candidatas`` se conservan solo esas estructuras.
+    """
+    with open(ruta, "r", encoding="utf-8") as f:
+        datos = json.load(f)
+    elegidas = None if candidatas is None else {resuelva_nombre(c) for c in candidatas}
+    costos: Costos = {}
+    for resultado in datos.get("results", []):
+        nombre = resultado["name"]
+        if elegidas is not None and nombre not in elegidas:
+            continue
+        puntos: list[tuple[int, dict[str, float]]] = []
+        for tamaño in resultado["sizes"]:
+            medias = {
+                op: float(tamaño[clave]["mean_ns"])
+                for op, clave in _OPERACIONES_BENCH.items()
+                if tamaño.get(clave) and tamaño[clave].get("mean_ns")
+            }
+            if len(medias) == len(OPERACIONES):
+                puntos.append((int(tamaño["n"]), medias))
+        if puntos:
+            costos[nombre] = sorted(puntos, key=lambda p: p[0])
+    if not costos:
+        raise ValueError(f"{ruta} no tiene costos utilizables para las candidatas.")
+    return costos
+
+
+def costo_estimado(puntos: list[tuple[int, dict[str, float]]], op: str, n: int) -> float:
+    """Costo de ``op`` en tamaño ``n`` interpolando los puntos en escala log–log."""
+    if len(puntos) == 1:
+        return puntos[0][1][op]
+    x = math.log(max(n, 1))
+    if n <= puntos[0][0]:
+        a, b = puntos[0], puntos[1]
+    elif n >= puntos[-1][0]:
+        a, b = puntos[-2], puntos[-1]
+    else:
+        i = next(i for i in range(1, len(puntos)) if puntos[i][0] >= n)
+        a, b = puntos[i - 1], puntos[i]
+    xa, xb = math.log(a[0]), math.log(b[0])
+    ya, yb = math.log(max(a[1][op], 1.0)), math.log(max(b[1][op], 1.0))
+    if xb == xa:
+        return math.exp(ya)
+    return math.exp(ya + (yb - ya) * (x - xa) / (xb - xa))
+
+
+def umbrales(
+    costos: Costos, mezcla: dict[str, float], hasta: int = 1 << 24, candidatas: Iterable[str] | None = None
+) -> list[tuple[int, str]]:
+    """Cortes de tamaño para una mezcla fija de operaciones.
+
+    Recorre N = 1, 2, 4, … ``hasta`` y devuelve ``(N, implementación)`` cada
+    vez que cambia la más barata; útil para ver qué implica un ``bench_*.json``.
+    """
+    nombres = list(candidatas) if candidatas is not None else list(costos)
+    cortes: list[tuple[int, str]] = []
+    n = 1
+    while n <= hasta:
+        mejor = min(nombres, key=lambda c: _costo_mezcla(costos[c], mezcla, n))
+        if not cortes or cortes[-1][1] != mejor:
+            cortes.append((n, mejor))
+        n *= 2
+    return cortes
+
+
+def _costo_mezcla(puntos: list[tuple[int, dict[str, float]]], mezcla: dict[str, float], n: int) -> float:
+    return sum(peso * costo_estimado(puntos, op, n) for op, peso in mezcla.items() if peso)
+
+
+class DiccionarioAdaptativo(Diccionario):
+    """Envoltorio que migra su contenido a la implementación más barata.
+
+    Empieza con ``inicial`` (por defecto la lista desenrollada, la más
+    compacta) y cada ``ventana`` operaciones estima, con la tabla de
+    ``costos`` y la proporción de ``inserte``/``borre``/``miembro`` vista en
+    esa ventana, cuánto costaría en cada candidata. Cuando otra es al menos
+    ``margen`` más barata, lo que se pierde por no estar en ella se acumula
+    ventana tras ventana, y se migra cuando lo acumulado alcanza el costo de
+    migrar (aproximado como una inserción de cada clave en la nueva). Es la
+    regla del alquiler de esquís: nunca se paga más del doble que decidiendo
+    con el futuro conocido, y cerca de un cruce no se oscila.
+
+    La migración recorre las claves en orden y las carga con
+    ``inserte_ordenados`` cuando la nueva implementación lo tiene. Todas las
+    candidatas deben coincidir en si permiten duplicados, para que migrar no
+    cambie el resultado de ninguna operación; las de capacidad fija no sirven.
+    """
+
+    def __init__(
+        self,
+        candidatas: Iterable[str] | None = None,
+        costos: Costos | str | None = None,
+        inicial: str = "ListaOrdenadaDesenrollada",
+        ventana: int = 1024,
+        margen: float = 0.25,
+    ) -> None:
+        if ventana < 1:
+            raise ValueError("La ventana debe ser positiva.")
+        if margen < 0:
+            raise ValueError("El margen no puede ser negativo.")
+        if isinstance(costos, str):
+            costos = costos_desde_bench(costos, candidatas)
+        elif costos is None:
+            costos = COSTOS_POR_DEFECTO
+        nombres = [resuelva_nombre(c) for c in candidatas] if candidatas is not None else list(costos)
+        for nombre in nombres:
+            if nombre in _CAPACIDAD_FIJA:
+                raise ValueError(f"{nombre} tiene capacidad fija y no puede ser candidata.")
+            if nombre not in costos:
+                raise ValueError(f"No hay costos para {nombre}.")
+        duplicados = {getattr(cargue_clase(c), "permite_duplicados", True) for c in nombres}
+        if len(duplicados) > 1:
+            raise ValueError("Las candidatas no coinciden en si permiten duplicados.")
+        inicial = resuelva_nombre(inicial)
+        if inicial not in nombres:
+            raise ValueError(f"La implementación inicial {inicial} no está entre las candidatas.")
+        self.__costos = costos
+        self.__candidatas = nombres
+        self.__inicial = inicial
+        self.__ventana = ventana
+        self.__margen = margen
+        self.__nombre = inicial
+        self.__actual: Diccionario = cree_diccionario(inicial)
+        self.__mezcla: dict[str, int] = dict.fromkeys(OPERACIONES, 0)
+        self.__pendientes = ventana
+        self.__perdido = 0.0
+        self.__migraciones: list[dict] = []
+        self.__acumulados: Counter[str] = Counter()
+
+    @property
+    def interno(self) -> Diccionario:
+        return self.__actual
+
+    @property
+    def implementacion(self) -> str:
+        return self.__nombre
+
+    @property
+    def migraciones(self) -> list[dict]:
+        """Cada migración: tamaño, implementación de origen y de destino."""
+        return list(self.__migraciones)
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__actual, "permite_duplicados", True)
+
+    def umbrales(self, mezcla: dict[str, float], hasta: int = 1 << 24) -> list[tuple[int, str]]:
+        """Cortes de tamaño que este diccionario aplicaría con ``mezcla`` fija."""
+        return umbrales(self.__costos, mezcla, hasta, self.__candidatas)
+
+    def inserte(self, elemento: str) -> None:
+        self.__actual.inserte(elemento)
+        self.__registre("inserte")
+
+    def borre(self, elemento: str) -> bool:
+        resultado = self.__actual.borre(elemento)
+        self.__registre("borre")
+        return resultado
+
+    def miembro(self, elemento: str) -> bool:
+        resultado = self.__actual.miembro(elemento)
+        self.__registre("miembro")
+        return resultado
+
+    def limpie(self) -> None:
+        """Vacía el diccionario y vuelve a la implementación inicial."""
+        self.__actual.limpie()
+        if self.__nombre != self.__inicial:
+            self.__cambie(cree_diccionario(self.__inicial), self.__inicial)
+        self.__reinicie_ventana()
+
+    def imprima(self) -> None:
+        self.__actual.imprima()
+
+    def __str__(self) -> str:
+        return str(self.__actual)
+
+    def __len__(self) -> int:
+        return len(self.__actual)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__actual)
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda el nombre de la implementación actual y su instantánea."""
+        salida = io.BytesIO()
+        self.__actual.guarde(salida)
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_hileras(f, [self.__nombre])
+            instantanea.escriba_bytes(f, salida.getvalue())
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura la implementación guardada, que debe estar entre las candidatas."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (nombre,) = instantanea.lea_hileras_completas(f, invertir)
+            datos = instantanea.lea_bytes(f)
+        if nombre not in self.__candidatas:
+            raise ValueError(f"La instantánea usa {nombre}, que no está entre las candidatas.")
+        nuevo = cree_diccionario(nombre)
+        nuevo.cargue(io.BytesIO(datos))
+        self.__cambie(nuevo, nombre)
+        self.__reinicie_ventana()
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        self.__acumulados = Counter()
+        self.__actual.active_estadisticas(activar)
+        super().active_estadisticas(activar)
+
+    def estadisticas(self) -> dict[str, int]:
+        """Contadores de todas las implementaciones usadas desde que se
+        encendieron, más la cantidad de ``migraciones``.
+        """
+        if self._contadores is None:
+            return {}
+        total = self.__acumulados + Counter(self.__actual.estadisticas())
+        total.update(self._contadores)
+        return dict(total)
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        return memoria.bytes_objeto(self) + self.__actual.memoria_bytes(incluir_claves)
+
+    def __registre(self, op: str) -> None:
+        self.__mezcla[op] += 1
+        self.__pendientes -= 1
+        if self.__pendientes <= 0:
+            self.__reevalue()
+
+    def __reevalue(self) -> None:
+        total = sum(self.__mezcla.values())
+        mezcla = {op: veces / total for op, veces in self.__mezcla.items()}
+        self.__reinicie_ventana()
+        n = len(self.__actual)
+        costos = {c: _costo_mezcla(self.__costos[c], mezcla, n) for c in self.__candidatas}
+        mejor = min(costos, key=costos.__getitem__)
+        if mejor == self.__nombre or costos[self.__nombre] <= (1 + self.__margen) * costos[mejor]:
+            self.__perdido = 0.0
+            return
+        self.__perdido += total * (costos[self.__nombre] - costos[mejor])
+        # recorrer la actual en orden es lineal y barato; lo que cuesta es
+        # cargar cada clave en la nueva
+        if self.__perdido >= n * costo_estimado(self.__costos[mejor], "inserte", n):
+            self.__migre(mejor)
+
+    def __migre(self, nombre: str) -> None:
+        nuevo = cree_diccionario(nombre)
+        elementos = list(self.__actual)
+        inserte_ordenados = getattr(nuevo, "inserte_ordenados", None)
+        if inserte_ordenados is not None:
+            inserte_ordenados(elementos)
+        else:
+            for x in elementos:
+                nuevo.inserte(x)
+        self.__migraciones.append({"n": len(elementos), "desde": self.__nombre, "hacia": nombre})
+        if self._contadores is not None:
+            self._contadores["migraciones"] += 1
+        self.__cambie(nuevo, nombre)
+
+    def __cambie(self, nuevo: Diccionario, nombre: str) -> None:
+        if self._contadores is not None:
+            self.__acumulados.update(self.__actual.estadisticas())
+            nuevo.active_estadisticas()
+        self.__actual = nuevo
+        self.__nombre = nombre
+        self.__perdido = 0.0
+
+    def __reinicie_ventana(self) -> None:
+        self.__mezcla = dict.fromkeys(OPERACIONES, 0)
+        self.__pendientes = self.__ventana
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import IO, Iterator
+
+from . import memoria
+from .diccionario import Diccionario
+
+
+class _CacheLRU:
+    """Memoria acotada que descarta la entrada usada hace más tiempo."""
+
+    def __init__(self, capacidad: int) -> None:
+        self.__capacidad = capacidad
+        self.__datos: OrderedDict[str, bool] = OrderedDict()
+
+    def obtenga(self, clave: str) -> bool | None:
+        valor = self.__datos.get(clave)
+        if valor is not None:
+            self.__datos.move_to_end(clave)
+        return valor
+
+    def guarde(self, clave: str, valor: bool) -> None:
+        datos = self.__datos
+        if clave in datos:
+            datos.move_to_end(clave)
+        elif len(datos) >= self.__capacidad:
+            datos.popitem(last=False)
+        datos[clave] = valor
+
+    def memoria_bytes(self) -> int:
+        return memoria.bytes_objeto(self) + memoria.tamaño(self.__datos)
+
+    def descarte(self, clave: str) -> None:
+        self.__datos.pop(clave, None)
+
+    def limpie(self) -> None:
+        self.__datos.clear()
+
+    def __len__(self) -> int:
+        return len(self.__datos)
+
+
+class _CacheLFU:
+    """Memoria acotada que descarta la entrada menos usada (O(1) por acceso).
+
+    Las entradas se agrupan por frecuencia; dentro de un grupo se descarta
+    la más antigua, así que los empates se resuelven como en LRU.
+    """
+
+    def __init__(self, capacidad: int) -> None:
+        self.__capacidad = capacidad
+        self.__valores: dict[str, bool] = {}
+        self.__frecuencias: dict[str, int] = {}
+        self.__grupos: dict[int, OrderedDict[str, None]] = {}
+        self.__minima = 0
+
+    def obtenga(self, clave: str) -> bool | None:
+        valor = self.__valores.get(clave)
+        if valor is not None:
+            self.__toque(clave)
+        return valor
+
+    def guarde(self, clave: str, valor: bool) -> None:
+        if clave in self.__valores:
+            self.__valores[clave] = valor
+            self.__toque(clave)
+            return
+        if len(self.__valores) >= self.__capacidad:
+            grupo = self.__grupos[self.__minima]
+            victima, _ = grupo.popitem(last=False)
+            if not grupo:
+                del self.__grupos[self.__minima]
+            del self.__valores[victima]
+            del self.__frecuencias[victima]
+        self.__valores[clave] = valor
+        self.__frecuencias[clave] = 1
+        self.__grupos.setdefault(1, OrderedDict())[clave] = None
+        self.__minima = 1
+
+    def memoria_bytes(self) -> int:
+        total = memoria.bytes_objeto(self) + memoria.tamaño(self.__valores) + memoria.tamaño(self.__frecuencias)
+        total += memoria.tamaño(self.__grupos)
+        for grupo in self.__grupos.values():
+            total += memoria.tamaño(grupo)
+        return total
+
+    def descarte(self, clave: str) -> None:
+        if clave not in self.__valores:
+            return
+        frecuencia = self.__frecuencias.pop(clave)
+        del self.__valores[clave]
+        grupo = self.__grupos[frecuencia]
+        del grupo[clave]
+        if not grupo:
+            del self.__grupos[frecuencia]
+            if self.__minima == frecuencia:
+                self.__minima = min(self.__grupos, default=0)
+
+    def limpie(self) -> None:
+        self.__valores.clear()
+        self.__frecuencias.clear()
+        self.__grupos.clear()
+        self.__minima = 0
+
+    def __len__(self) -> int:
+        return len(self.__valores)
+
+    def __toque(self, clave: str) -> None:
+        frecuencia = self.__frecuencias[clave]
+        grupo = self.__grupos[frecuencia]
+        del grupo[clave]
+        if not grupo:
+            del self.__grupos[frecuencia]
+            if self.__minima == frecuencia:
+                self.__minima = frecuencia + 1
+        self.__frecuencias[clave] = frecuencia + 1
+        self.__grupos.setdefault(frecuencia + 1, OrderedDict())[clave] = None
+
+
+class DiccionarioCache(Diccionario):
+    """Envoltorio que memoriza los resultados de ``miembro``.
+
+    Guarda hasta ``capacidad`` respuestas (positivas y negativas) con
+    política ``"lru"`` o ``"lfu"``. La invalidación es exacta: ``inserte``
+    deja la clave como presente si la estructura interna creció (si no, la
+    descarta), ``borre`` descarta solo esa clave (con duplicados podría
+    seguir presente) y ``limpie`` vacía la memoria.
+    ``aciertos`` y ``fallos`` cuentan las consultas resueltas o no por ella.
+
+    ``miembro`` modifica la memoria, así que no es seguro llamarlo desde
+    varios hilos a la vez sin un cerrojo exclusivo.
+    """
+
+    def __init__(self, interno: Diccionario, capacidad: int = 1024, politica: str = "lru") -> None:
+        if capacidad < 1:
+            raise ValueError("La capacidad de la memoria debe ser positiva.")
+        if politica == "lru":
+            self.__cache: _CacheLRU | _CacheLFU = _CacheLRU(capacidad)
+        elif politica == "lfu":
+            self.__cache = _CacheLFU(capacidad)
+        else:
+            raise ValueError(f"Política de reemplazo desconocida: {politica}")
+        self.__interno = interno
+        self.politica = politica
+        self.aciertos: int = 0
+        self.fallos: int = 0
+        self.__desde: tuple[int, int] | None = None
+
+    @property
+    def interno(self) -> Diccionario:
+        return self.__interno
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__interno, "permite_duplicados", True)
+
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    def entradas_en_memoria(self) -> int:
+        return len(self.__cache)
+
+    def inserte(self, elemento: str) -> None:
+        antes = len(self.__interno)
+        self.__interno.inserte(elemento)
+        if len(self.__interno) > antes:
+            self.__cache.guarde(elemento, True)
+        else:
+            # la estructura pudo descartarla (lista estática llena) o ya
+            # tenerla (ABB sin duplicados): que la próxima consulta decida
+            self.__cache.descarte(elemento)
+
+    def borre(self, elemento: str) -> bool:
+        borrado = self.__interno.borre(elemento)
+        if borrado:
+            self.__cache.descarte(elemento)
+        return borrado
+
+    def limpie(self) -> None:
+        self.__interno.limpie()
+        self.__cache.limpie()
+
+    def miembro(self, elemento: str) -> bool:
+        valor = self.__cache.obtenga(elemento)
+        if valor is not None:
+            self.aciertos += 1
+            return valor
+        self.fallos += 1
+        valor = self.__interno.miembro(elemento)
+        self.__cache.guarde(elemento, valor)
+        return valor
+
+    def imprima(self) -> None:
+        self.__interno.imprima()
+
+    def __str__(self) -> str:
+        return str(self.__interno)
+
+    def __len__(self) -> int:
+        return len(self.__interno)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__interno)
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        self.__interno.active_estadisticas(activar)
+        self.__desde = (self.aciertos, self.fallos) if activar else None
+
+    def estadisticas(self) -> dict[str, int]:
+        """Contadores de la estructura interna más aciertos y fallos de la
+        memoria de búsquedas desde que se encendieron.
+        """
+        desde = self.__desde
+        if desde is None:
+            return self.__interno.estadisticas()
+        return {
+            **self.__interno.estadisticas(),
+            "aciertos": self.aciertos - desde[0],
+            "fallos": self.fallos - desde[1],
+        }
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Estructura interna más la memoria de búsquedas (sin sus claves)."""
+        return (
+            memoria.bytes_objeto(self)
+            + self.__cache.memoria_bytes()
+            + self.__interno.memoria_bytes(incluir_claves)
+        )
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda solo la estructura interna; la memoria no se persiste."""
+        self.__interno.guarde(destino)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        self.__interno.cargue(origen)
+        self.__cache.limpie()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+from .diccionario import Diccionario
+
+
+class CerrojoLectoresEscritores:
+    """Cerrojo de muchos lectores / un escritor con preferencia de escritura.
+
+    Mientras haya un escritor esperando no se admiten lectores nuevos, de
+    modo que un flujo continuo de lecturas no puede postergar una escritura
+    indefinidamente.
+    """
+
+    def __init__(self) -> None:
+        self.__condicion = threading.Condition(threading.Lock())
+        self.__lectores = 0
+        self.__escribiendo = False
+        self.__escritores_esperando = 0
+
+    def adquiera_lectura(self) -> None:
+        with self.__condicion:
+            while self.__escribiendo or self.__escritores_esperando:
+                self.__condicion.wait()
+            self.__lectores += 1
+
+    def libere_lectura(self) -> None:
+        with self.__condicion:
+            self.__lectores -= 1
+            if self.__lectores == 0:
+                self.__condicion.notify_all()
+
+    def adquiera_escritura(self) -> None:
+        with self.__condicion:
+            self.__escritores_esperando += 1
+            try:
+                while self.__escribiendo or self.__lectores:
+                    self.__condicion.wait()
+            finally:
+                self.__escritores_esperando -= 1
+            self.__escribiendo = True
+
+    def libere_escritura(self) -> None:
+        with self.__condicion:
+            self.__escribiendo = False
+            self.__condicion.notify_all()
+
+    @contextmanager
+    def lectura(self) -> Iterator[None]:
+        self.adquiera_lectura()
+        try:
+            yield
+        finally:
+            self.libere_lectura()
+
+    @contextmanager
+    def escritura(self) -> Iterator[None]:
+        self.adquiera_escritura()
+        try:
+            yield
+        finally:
+            self.libere_escritura()
+
+
+class DiccionarioConcurrente(Diccionario):
+    """Envoltorio seguro entre hilos para cualquier diccionario.
+
+    ``miembro``, ``__str__``, ``__len__``, el recorrido y ``guarde`` toman el
+    cerrojo en modo lectura (pueden ejecutarse a la vez); ``inserte``,
+    ``borre``, ``limpie`` y ``cargue`` lo toman en modo exclusivo.
+
+    Si las lecturas de la estructura interna modifican estado compartido
+    (p. ej. ``DiccionarioCache`` reordena su memoria en cada ``miembro``),
+    debe crearse con ``lecturas_exclusivas=True``.
+    """
+
+    def __init__(self, interno: Diccionario, lecturas_exclusivas: bool = False) -> None:
+        self.__interno = interno
+        self.__cerrojo = CerrojoLectoresEscritores()
+        self.__lecturas_exclusivas = lecturas_exclusivas
+
+    @property
+    def interno(self) -> Diccionario:
+        return self.__interno
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__interno, "permite_duplicados", True)
+
+    def inserte(self, elemento: str) -> None:
+        with self.__cerrojo.escritura():
+            self.__interno.inserte(elemento)
+
+    def borre(self, elemento: str) -> bool:
+        with self.__cerrojo.escritura():
+            return self.__interno.borre(elemento)
+
+    def limpie(self) -> None:
+        with self.__cerrojo.escritura():
+            self.__interno.limpie()
+
+    def miembro(self, elemento: str) -> bool:
+        with self.__lectura():
+            return self.__interno.miembro(elemento)
+
+    def imprima(self) -> None:
+        print(self)
+
+    def __str__(self) -> str:
+        with self.__lectura():
+            return str(self.__interno)
+
+    def __len__(self) -> int:
+        with self.__lectura():
+            return len(self.__interno)
+
+    def __iter__(self) -> Iterator[str]:
+        """Recorre una copia tomada bajo el cerrojo (no bloquea a escritores)."""
+        with self.__lectura():
+            return iter(list(self.__interno))
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        with self.__lectura():
+            self.__interno.guarde(destino)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        with self.__cerrojo.escritura():
+            self.__interno.cargue(origen)
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        """Los contadores no son atómicos: con lectores simultáneos pueden
+        perder cuentas, salvo con ``lecturas_exclusivas=True``.
+        """
+        with self.__cerrojo.escritura():
+            self.__interno.active_estadisticas(activar)
+
+    def estadisticas(self) -> dict[str, int]:
+        with self.__cerrojo.escritura():
+            return self.__interno.estadisticas()
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        with self.__lectura():
+            return self.__interno.memoria_bytes(incluir_claves)
+
+    def __lectura(self):
+        if self.__lecturas_exclusivas:
+            return self.__cerrojo.escritura()
+        return self.__cerrojo.lectura()
@@ -0,0 +1,129 @@
+"""Grabación de trazas de operaciones sobre un diccionario.
+
+Una traza es un archivo de texto con un objeto JSON por línea::
+
+    {"op": "inserte", "x": "hola"}
+    {"op": "miembro", "x": "hola", "r": true}
+    {"op": "borre", "x": "adios", "r": false}
+    {"op": "limpie"}
+
+``r`` es el resultado observado (solo en ``miembro`` y ``borre``) y sirve
+para detectar diferencias al reproducir la traza en otra implementación.
+Si la ruta termina en ``.gz`` el archivo se comprime con gzip.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+from typing import IO, Iterator
+
+from .diccionario import Diccionario
+
+OPERACIONES = ("inserte", "borre", "miembro", "limpie")
+
+
+def _abra_texto(ruta: str, modo: str) -> IO[str]:
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(ruta, modo, encoding="utf-8")
+
+
+def lea_traza(ruta: str) -> Iterator[tuple[str, str | None, bool | None]]:
+    """Recorre la traza línea por línea como tuplas ``(op, x, r)``.
+
+    No carga el archivo completo, así que sirve para trazas de varios GB.
+    """
+    with _abra_texto(ruta, "r") as f:
+        for numero, linea in enumerate(f, 1):
+            if not linea.strip():
+                continue
+            registro = json.loads(linea)
+            op = registro.get("op")
+            if op not in OPERACIONES:
+                raise ValueError(f"Operación desconocida en la línea {numero}: {op!r}")
+            yield op, registro.get("x"), registro.get("r")
+
+
+class DiccionarioGrabador(Diccionario):
+    """Envoltorio que anota en una traza cada operación sobre ``interno``.
+
+    Las operaciones se delegan sin cambios; ``imprima``, el recorrido,
+    ``guarde`` y ``cargue`` no se graban (si se usa ``cargue`` a mitad de la
+    grabación, la traza ya no reproduce el mismo estado). Hay que llamar a
+    ``cierre`` (o usarlo con ``with``) para vaciar el archivo.
+    """
+
+    def __init__(self, interno: Diccionario, ruta: str) -> None:
+        self.__interno = interno
+        self.__salida: IO[str] | None = _abra_texto(ruta, "w")
+        self.operaciones: int = 0
+
+    @property
+    def interno(self) -> Diccionario:
+        return self.__interno
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__interno, "permite_duplicados", True)
+
+    def inserte(self, elemento: str) -> None:
+        self.__interno.inserte(elemento)
+        self.__anote({"op": "inserte", "x": elemento})
+
+    def borre(self, elemento: str) -> bool:
+        resultado = self.__interno.borre(elemento)
+        self.__anote({"op": "borre", "x": elemento, "r": resultado})
+        return resultado
+
+    def limpie(self) -> None:
+        self.__interno.limpie()
+        self.__anote({"op": "limpie"})
+
+    def miembro(self, elemento: str) -> bool:
+        resultado = self.__interno.miembro(elemento)
+        self.__anote({"op": "miembro", "x": elemento, "r": resultado})
+        return resultado
+
+    def imprima(self) -> None:
+        self.__interno.imprima()
+
+    def __str__(self) -> str:
+        return str(self.__interno)
+
+    def __len__(self) -> int:
+        return len(self.__interno)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__interno)
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        self.__interno.guarde(destino)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        self.__interno.cargue(origen)
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        self.__interno.active_estadisticas(activar)
+
+    def estadisticas(self) -> dict[str, int]:
+        return self.__interno.estadisticas()
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        return self.__interno.memoria_bytes(incluir_claves)
+
+    def cierre(self) -> None:
+        if self.__salida is not None:
+            self.__salida.close()
+            self.__salida = None
+
+    def __enter__(self) -> DiccionarioGrabador:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.cierre()
+
+    def __anote(self, registro: dict) -> None:
+        if self.__salida is None:
+            raise ValueError("La traza ya fue cerrada.")
+        self.__salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.operaciones += 1
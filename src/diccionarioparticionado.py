@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import heapq
+import io
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Callable, Iterable, Iterator
+
+from . import instantanea, memoria
+from .diccionario import Diccionario
+
+
+def _particion(elemento: str, cantidad: int) -> int:
+    """Hash estable (CRC-32 de los bytes UTF-8): no cambia entre procesos."""
+    return zlib.crc32(elemento.encode("utf-8", "surrogatepass")) % cantidad
+
+
+def _construya_particion(fabrica: Callable[[], Diccionario], claves: list[str]) -> bytes:
+    """Construye una partición y la devuelve en su formato de instantánea.
+
+    Se ejecuta en un proceso trabajador; ``fabrica`` y el resultado viajan
+    entre procesos, así que ``fabrica`` debe ser serializable con ``pickle``
+    (una clase o un ``functools.partial``, no una función local).
+    """
+    d = _llene(fabrica(), claves)
+    salida = io.BytesIO()
+    d.guarde(salida)
+    return salida.getvalue()
+
+
+def _llene(d: Diccionario, claves: list[str]) -> Diccionario:
+    inserte_ordenados = getattr(d, "inserte_ordenados", None)
+    if inserte_ordenados is not None:
+        inserte_ordenados(sorted(claves))
+    else:
+        for x in claves:
+            d.inserte(x)
+    return d
+
+
+class DiccionarioParticionado(Diccionario):
+    """Reparte las claves entre ``particiones`` instancias de otra implementación.
+
+    Cada clave vive en una sola partición, elegida con un hash estable, así
+    que ``inserte``, ``borre`` y ``miembro`` tocan una única instancia. El
+    recorrido ordenado mezcla las particiones (``heapq.merge``).
+
+    ``construya`` hace la carga masiva en paralelo: cada partición se arma en
+    un proceso aparte y vuelve al proceso principal como instantánea
+    (``guarde``/``cargue`` de la propia estructura).
+    """
+
+    def __init__(self, fabrica: Callable[[], Diccionario], particiones: int = 4) -> None:
+        if particiones < 1:
+            raise ValueError("La cantidad de particiones debe ser positiva.")
+        self.__fabrica = fabrica
+        self.__particiones: list[Diccionario] = [fabrica() for _ in range(particiones)]
+
+    @property
+    def particiones(self) -> int:
+        return len(self.__particiones)
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__particiones[0], "permite_duplicados", True)
+
+    def tamaños_particiones(self) -> list[int]:
+        return [len(p) for p in self.__particiones]
+
+    def construya(self, elementos: Iterable[str], trabajadores: int | None = None) -> None:
+        """Reemplaza el contenido por ``elementos`` armando las particiones en paralelo.
+
+        Con ``trabajadores=1`` todo se hace en el proceso actual, sin serializar.
+        """
+        cantidad = len(self.__particiones)
+        grupos: list[list[str]] = [[] for _ in range(cantidad)]
+        for x in elementos:
+            grupos[_particion(x, cantidad)].append(x)
+        if trabajadores == 1:
+            self.__particiones = [_llene(self.__fabrica(), g) for g in grupos]
+            return
+        with ProcessPoolExecutor(max_workers=min(trabajadores or cantidad, cantidad)) as ejecutor:
+            instantaneas = list(ejecutor.map(_construya_particion, [self.__fabrica] * cantidad, grupos))
+        particiones: list[Diccionario] = []
+        for datos in instantaneas:
+            d = self.__fabrica()
+            d.cargue(io.BytesIO(datos))
+            particiones.append(d)
+        self.__particiones = particiones
+
+    def inserte(self, elemento: str) -> None:
+        self.__de(elemento).inserte(elemento)
+
+    def borre(self, elemento: str) -> bool:
+        return self.__de(elemento).borre(elemento)
+
+    def limpie(self) -> None:
+        for p in self.__particiones:
+            p.limpie()
+
+    def miembro(self, elemento: str) -> bool:
+        return self.__de(elemento).miembro(elemento)
+
+    def imprima(self) -> None:
+        print(self)
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(self) + "]"
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self.__particiones)
+
+    def __iter__(self) -> Iterator[str]:
+        return heapq.merge(*self.__particiones)
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda la cantidad de particiones y la instantánea de cada una."""
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, [len(self.__particiones)])
+            for p in self.__particiones:
+                salida = io.BytesIO()
+                p.guarde(salida)
+                instantanea.escriba_bytes(f, salida.getvalue())
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura las particiones; adopta la cantidad guardada en el archivo."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (cantidad,) = instantanea.lea_enteros(f, invertir)
+            particiones: list[Diccionario] = []
+            for _ in range(cantidad):
+                d = self.__fabrica()
+                d.cargue(io.BytesIO(instantanea.lea_bytes(f)))
+                particiones.append(d)
+        self.__particiones = particiones
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        """Aplica a las particiones actuales; ``construya`` y ``cargue`` las reemplazan."""
+        for p in self.__particiones:
+            p.active_estadisticas(activar)
+
+    def estadisticas(self) -> dict[str, int]:
+        """Suma de los contadores de todas las particiones."""
+        total: Counter[str] = Counter()
+        for p in self.__particiones:
+            total.update(p.estadisticas())
+        return dict(total)
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        total = memoria.bytes_objeto(self) + memoria.tamaño(self.__particiones)
+        return total + sum(p.memoria_bytes(incluir_claves) for p in self.__particiones)
+
+    def __de(self, elemento: str) -> Diccionario:
+        return self.__particiones[_particion(elemento, len(self.__particiones))]
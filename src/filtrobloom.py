@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import math
+from typing import IO, Iterator
+
+from . import memoria
+from .diccionario import Diccionario
+
+
+class FiltroBloomConteo:
+    """Filtro de Bloom con contadores (admite borrados).
+
+    Cada posición es un contador de 8 bits en un ``bytearray``. Un contador
+    que llega a 255 queda saturado y ya no se decrementa: así un borrado
+    nunca puede producir un falso negativo, a lo sumo un falso positivo.
+
+    El tamaño se calcula a partir de la capacidad esperada ``n`` y la tasa
+    de falsos positivos ``p``: ``m = -n ln p / (ln 2)^2`` contadores y
+    ``k = (m / n) ln 2`` funciones hash (doble hashing sobre ``hash``).
+    """
+
+    __slots__ = ("__contadores", "__m", "__k", "capacidad", "tasa_falsos")
+
+    def __init__(self, capacidad: int, tasa_falsos: float = 0.01) -> None:
+        if capacidad < 1:
+            capacidad = 1
+        if not (0.0 < tasa_falsos < 1.0):
+            raise ValueError("La tasa de falsos positivos debe estar en (0, 1).")
+        self.capacidad = capacidad
+        self.tasa_falsos = tasa_falsos
+        self.__m = max(8, math.ceil(-capacidad * math.log(tasa_falsos) / (math.log(2) ** 2)))
+        self.__k = max(1, round(self.__m / capacidad * math.log(2)))
+        self.__contadores = bytearray(self.__m)
+
+    def agregue(self, elemento: str) -> None:
+        contadores = self.__contadores
+        for i in self.__posiciones(elemento):
+            if contadores[i] < 255:
+                contadores[i] += 1
+
+    def quite(self, elemento: str) -> None:
+        """Resta una ocurrencia; solo llamar si ``elemento`` fue agregado."""
+        contadores = self.__contadores
+        for i in self.__posiciones(elemento):
+            if 0 < contadores[i] < 255:
+                contadores[i] -= 1
+
+    def puede_contener(self, elemento: str) -> bool:
+        """``False`` garantiza ausencia; ``True`` puede ser falso positivo."""
+        contadores = self.__contadores
+        for i in self.__posiciones(elemento):
+            if not contadores[i]:
+                return False
+        return True
+
+    def limpie(self) -> None:
+        self.__contadores = bytearray(self.__m)
+
+    def cantidad_contadores(self) -> int:
+        return self.__m
+
+    def cantidad_hashes(self) -> int:
+        return self.__k
+
+    def memoria_bytes(self) -> int:
+        return memoria.bytes_objeto(self) + memoria.tamaño(self.__contadores)
+
+    def __posiciones(self, elemento: str) -> Iterator[int]:
+        h = hash(elemento) & 0xFFFFFFFFFFFFFFFF
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        m = self.__m
+        for i in range(self.__k):
+            yield (h1 + i * h2) % m
+
+
+class DiccionarioConFiltro(Diccionario):
+    """Envoltorio que antepone un ``FiltroBloomConteo`` a cualquier diccionario.
+
+    ``miembro`` consulta primero el filtro y solo desciende a la estructura
+    interna si el filtro no descarta la clave, de modo que casi todas las
+    búsquedas fallidas cuestan O(k). El filtro se actualiza en ``inserte``
+    (solo si la estructura realmente creció, p. ej. los ABB ignoran
+    duplicados) y en ``borre`` (solo si se borró algo). Cuando el tamaño
+    supera la capacidad del filtro, este se reconstruye con el doble.
+    """
+
+    def __init__(
+        self, interno: Diccionario, capacidad: int = 1024, tasa_falsos: float = 0.01
+    ) -> None:
+        self.__interno = interno
+        self.__filtro = FiltroBloomConteo(max(capacidad, len(interno)), tasa_falsos)
+        if len(interno):
+            for x in interno:
+                self.__filtro.agregue(x)
+        self.rechazos: int = 0
+        self.falsos_positivos: int = 0
+        self.__desde: tuple[int, int] | None = None
+
+    @property
+    def interno(self) -> Diccionario:
+        return self.__interno
+
+    @property
+    def filtro(self) -> FiltroBloomConteo:
+        return self.__filtro
+
+    @property
+    def permite_duplicados(self) -> bool:
+        return getattr(self.__interno, "permite_duplicados", True)
+
+    def inserte(self, elemento: str) -> None:
+        antes = len(self.__interno)
+        self.__interno.inserte(elemento)
+        if len(self.__interno) > antes:
+            self.__filtro.agregue(elemento)
+            if len(self.__interno) > self.__filtro.capacidad:
+                self.__reconstruya(2 * self.__filtro.capacidad)
+
+    def borre(self, elemento: str) -> bool:
+        if not self.__filtro.puede_contener(elemento):
+            self.rechazos += 1
+            return False
+        if self.__interno.borre(elemento):
+            self.__filtro.quite(elemento)
+            return True
+        return False
+
+    def limpie(self) -> None:
+        self.__interno.limpie()
+        self.__filtro.limpie()
+
+    def miembro(self, elemento: str) -> bool:
+        if not self.__filtro.puede_contener(elemento):
+            self.rechazos += 1
+            return False
+        if self.__interno.miembro(elemento):
+            return True
+        self.falsos_positivos += 1
+        return False
+
+    def imprima(self) -> None:
+        self.__interno.imprima()
+
+    def __str__(self) -> str:
+        return str(self.__interno)
+
+    def __len__(self) -> int:
+        return len(self.__interno)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__interno)
+
+    def active_estadisticas(self, activar: bool = True) -> None:
+        self.__interno.active_estadisticas(activar)
+        self.__desde = (self.rechazos, self.falsos_positivos) if activar else None
+
+    def estadisticas(self) -> dict[str, int]:
+        """Contadores de la estructura interna más rechazos y falsos
+        positivos del filtro desde que se encendieron.
+        """
+        desde = self.__desde
+        if desde is None:
+            return self.__interno.estadisticas()
+        return {
+            **self.__interno.estadisticas(),
+            "rechazos": self.rechazos - desde[0],
+            "falsos_positivos": self.falsos_positivos - desde[1],
+        }
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        return (
+            memoria.bytes_objeto(self)
+            + self.__filtro.memoria_bytes()
+            + self.__interno.memoria_bytes(incluir_claves)
+        )
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda solo la estructura interna; el filtro se recalcula al cargar."""
+        self.__interno.guarde(destino)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        self.__interno.cargue(origen)
+        self.__reconstruya(max(self.__filtro.capacidad, len(self.__interno)))
+
+    def __reconstruya(self, capacidad: int) -> None:
+        filtro = FiltroBloomConteo(capacidad, self.__filtro.tasa_falsos)
+        for x in self.__interno:
+            filtro.agregue(x)
+        self.__filtro = filtro
@@ -0,0 +1,130 @@
+"""Formato binario de instantáneas para los diccionarios.
+
+Una instantánea empieza con un encabezado fijo::
+
+    b"DICC" | versión (u16) | orden de bytes (u8) | len(etiqueta) (u8) | etiqueta
+
+seguido de secciones que cada clase escribe en su propio orden (su
+"disposición nativa"). Hay tres tipos de sección:
+
+- arreglo de enteros: código de tipo (1 byte), cantidad (u64) y los bytes del
+  ``array`` tal como están en memoria;
+- lista de hileras: un arreglo ``'q'`` con la longitud en caracteres de cada
+  hilera (``-1`` representa ``None``) y un único bloque UTF-8 con todas ellas;
+- bloque de bytes crudos: tamaño (u64) y los bytes.
+
+Cargar una lista de hileras decodifica el bloque una sola vez y lo corta por
+longitudes, así que el costo es proporcional al tamaño del archivo.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import IO, Iterable, Iterator
+
+MAGIA = b"DICC"
+VERSION = 1
+
+_ENCABEZADO = struct.Struct("<4sHBB")
+_SECCION = struct.Struct("<cQ")
+_ORDEN = {"little": 0, "big": 1}
+
+
+@contextmanager
+def abra(destino: str | IO[bytes], modo: str) -> Iterator[IO[bytes]]:
+    """Abre ``destino`` en modo binario, o lo usa tal cual si ya es un archivo."""
+    if hasattr(destino, "read") or hasattr(destino, "write"):
+        yield destino  # type: ignore[misc]
+        return
+    with open(destino, modo + "b") as f:
+        yield f
+
+
+def escriba_encabezado(f: IO[bytes], etiqueta: str) -> None:
+    datos = etiqueta.encode("utf-8")
+    f.write(_ENCABEZADO.pack(MAGIA, VERSION, _ORDEN[sys.byteorder], len(datos)))
+    f.write(datos)
+
+
+def lea_encabezado(f: IO[bytes], etiqueta: str) -> bool:
+    """Valida el encabezado y devuelve ``True`` si hay que invertir bytes."""
+    crudo = _lea_exacto(f, _ENCABEZADO.size)
+    magia, version, orden, largo = _ENCABEZADO.unpack(crudo)
+    if magia != MAGIA:
+        raise ValueError("El archivo no es una instantánea de diccionario.")
+    if version != VERSION:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    encontrada = _lea_exacto(f, largo).decode("utf-8")
+    if encontrada != etiqueta:
+        raise ValueError(
+            f"La instantánea es de '{encontrada}', no de '{etiqueta}'."
+        )
+    return orden != _ORDEN[sys.byteorder]
+
+
+def escriba_enteros(f: IO[bytes], valores: Iterable[int] | array, tipo: str = "q") -> None:
+    arr = valores if isinstance(valores, array) and valores.typecode == tipo else array(tipo, valores)
+    f.write(_SECCION.pack(tipo.encode("ascii"), len(arr)))
+    f.write(arr.tobytes())
+
+
+def lea_enteros(f: IO[bytes], invertir: bool = False) -> array:
+    tipo, cantidad = _SECCION.unpack(_lea_exacto(f, _SECCION.size))
+    arr = array(tipo.decode("ascii"))
+    arr.frombytes(_lea_exacto(f, cantidad * arr.itemsize))
+    if invertir:
+        arr.byteswap()
+    return arr
+
+
+def escriba_bytes(f: IO[bytes], datos: bytes | bytearray) -> None:
+    f.write(struct.pack("<Q", len(datos)))
+    f.write(datos)
+
+
+def lea_bytes(f: IO[bytes]) -> bytes:
+    (tamaño,) = struct.unpack("<Q", _lea_exacto(f, 8))
+    return _lea_exacto(f, tamaño)
+
+
+def escriba_hileras(f: IO[bytes], hileras: list[str | None]) -> None:
+    escriba_enteros(f, (-1 if h is None else len(h) for h in hileras))
+    blob = "".join(h for h in hileras if h is not None).encode("utf-8", "surrogatepass")
+    f.write(struct.pack("<Q", len(blob)))
+    f.write(blob)
+
+
+def lea_hileras(f: IO[bytes], invertir: bool = False) -> list[str | None]:
+    largos = lea_enteros(f, invertir)
+    (tamaño,) = struct.unpack("<Q", _lea_exacto(f, 8))
+    texto = _lea_exacto(f, tamaño).decode("utf-8", "surrogatepass")
+    salida: list[str | None] = []
+    inicio = 0
+    for largo in largos:
+        if largo < 0:
+            salida.append(None)
+            continue
+        fin = inicio + largo
+        salida.append(texto[inicio:fin])
+        inicio = fin
+    return salida
+
+
+def lea_hileras_completas(f: IO[bytes], invertir: bool = False) -> list[str]:
+    """Como ``lea_hileras`` pero para secciones sin ``None`` (más rápido)."""
+    largos = lea_enteros(f, invertir)
+    (tamaño,) = struct.unpack("<Q", _lea_exacto(f, 8))
+    texto = _lea_exacto(f, tamaño).decode("utf-8", "surrogatepass")
+    finales = list(accumulate(largos))
+    inicios = [0] + finales[:-1]
+    return [texto[i:j] for i, j in zip(inicios, finales)]
+
+
+def _lea_exacto(f: IO[bytes], n: int) -> bytes:
+    datos = f.read(n)
+    if len(datos) != n:
+        raise ValueError("Instantánea truncada.")
+    return datos
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from . import instantanea, memoria
+from .diccionario import Diccionario
+
+
+class Bloque:
+	"""Nodo de la lista desenrollada: un bloque ordenado de claves."""
+
+	__slots__ = ("claves", "siguiente")
+
+	def __init__(self, claves: list[str] | None = None):
+		self.claves: list[str] = claves if claves is not None else []
+		self.siguiente: Bloque | None = None
+
+
+class ListaOrdenadaDesenrollada(Diccionario):
+	"""Lista enlazada ordenada cuyos nodos guardan bloques de claves.
+
+	Características:
+	- Cada bloque contiene hasta ``capacidad_bloque`` claves ordenadas; la
+	  búsqueda dentro del bloque es binaria.
+	- Un bloque lleno se parte en dos mitades; uno que baja de un cuarto de
+	  su capacidad se fusiona con (o toma claves de) el siguiente.
+	- Permite duplicados (el nuevo duplicado se coloca tras los existentes).
+	- Inserción / borrado / búsqueda: O(n / B + B) en el peor caso.
+	"""
+
+	def __init__(self, capacidad_bloque: int = 64) -> None:
+		if capacidad_bloque < 4:
+			raise ValueError("La capacidad del bloque debe ser al menos 4.")
+		self.__capacidad: int = capacidad_bloque
+		self.__minimo: int = capacidad_bloque // 4
+		self.__cabeza: Bloque = Bloque()
+		self.__tamaño: int = 0
+		self.__bloques: int = 0
+
+	def __len__(self) -> int:
+		return self.__tamaño
+
+	def __getitem__(self, indice: int) -> str:
+		if not (0 <= indice < self.__tamaño):
+			raise IndexError("Índice fuera de rango")
+		act = self.__cabeza.siguiente
+		while act is not None and indice >= len(act.claves):
+			indice -= len(act.claves)
+			act = act.siguiente
+		assert act is not None
+		return act.claves[indice]
+
+	def cantidad_bloques(self) -> int:
+		"""Número de nodos (bloques) enlazados actualmente."""
+		return self.__bloques
+
+	def inserte(self, elemento: str) -> None:
+		"""Inserta manteniendo orden ascendente (permite duplicados)."""
+		if self._contadores is not None:
+			self.__cuente("inserte", elemento, self._contadores)
+		act = self.__cabeza.siguiente
+		if act is None:
+			nuevo = Bloque([elemento])
+			self.__cabeza.siguiente = nuevo
+			self.__bloques = 1
+			self.__tamaño = 1
+			self.__verifique_invariante()
+			return
+		# último bloque cuyo primer elemento es <= elemento (o el primero)
+		sig = act.siguiente
+		while sig is not None and sig.claves[0] <= elemento:
+			act = sig
+			sig = act.siguiente
+		claves = act.claves
+		claves.insert(bisect_right(claves, elemento), elemento)
+		self.__tamaño += 1
+		if len(claves) > self.__capacidad:
+			self.__parta(act)
+		self.__verifique_invariante()
+
+	def borre(self, elemento: str) -> bool:
+		if self._contadores is not None:
+			self.__cuente("borre", elemento, self._contadores)
+		ant = self.__cabeza
+		act = ant.siguiente
+		while act is not None and act.claves[-1] < elemento:
+			ant = act
+			act = act.siguiente
+		if act is None:
+			return False
+		claves = act.claves
+		i = bisect_left(claves, elemento)
+		if i < len(claves) and claves[i] == elemento:
+			del claves[i]
+			self.__tamaño -= 1
+			if len(claves) < self.__minimo:
+				self.__rebalancee(ant, act)
+			self.__verifique_invariante()
+			return True
+		return False
+
+	def inserte_ordenados(self, elementos: Iterable[str]) -> None:
+		"""Inserta un lote rearmando los bloques en una sola pasada.
+
+		Mezcla el lote ordenado con las claves actuales (los duplicados quedan
+		tras los existentes, como en ``inserte``) y corta el resultado en
+		bloques llenos a tres cuartos, para que las inserciones siguientes no
+		los partan enseguida. Costo O(n + k log k).
+		"""
+		claves = list(heapq.merge(self, sorted(elementos)))
+		paso = max(1, (self.__capacidad * 3) // 4)
+		ant = self.__cabeza
+		for inicio in range(0, len(claves), paso):
+			bloque = Bloque(claves[inicio:inicio + paso])
+			ant.siguiente = bloque
+			ant = bloque
+		ant.siguiente = None
+		self.__tamaño = len(claves)
+		self.__bloques = -(-len(claves) // paso)
+		self.__verifique_invariante()
+
+	def limpie(self) -> None:
+		self.__cabeza.siguiente = None
+		self.__tamaño = 0
+		self.__bloques = 0
+
+	def miembro(self, elemento: str) -> bool:
+		if self._contadores is not None:
+			self.__cuente("miembro", elemento, self._contadores)
+		act = self.__cabeza.siguiente
+		while act is not None and act.claves[-1] < elemento:
+			act = act.siguiente
+		if act is None:
+			return False
+		claves = act.claves
+		i = bisect_left(claves, elemento)
+		return i < len(claves) and claves[i] == elemento
+
+	def imprima(self) -> None:
+		print(self)
+
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Guarda la capacidad, el tamaño de cada bloque y las claves en orden."""
+		largos: list[int] = []
+		elems: list[str | None] = []
+		act = self.__cabeza.siguiente
+		while act is not None:
+			largos.append(len(act.claves))
+			elems.extend(act.claves)
+			act = act.siguiente
+		with instantanea.abra(destino, "w") as f:
+			instantanea.escriba_encabezado(f, type(self).__name__)
+			instantanea.escriba_enteros(f, [self.__capacidad])
+			instantanea.escriba_enteros(f, largos)
+			instantanea.escriba_hileras(f, elems)
+
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		"""Reconstruye los bloques con la misma partición que se guardó."""
+		with instantanea.abra(origen, "r") as f:
+			invertir = instantanea.lea_encabezado(f, type(self).__name__)
+			(capacidad,) = instantanea.lea_enteros(f, invertir)
+			largos = instantanea.lea_enteros(f, invertir)
+			elems = instantanea.lea_hileras_completas(f, invertir)
+		self.__capacidad = capacidad
+		self.__minimo = capacidad // 4
+		ant = self.__cabeza
+		inicio = 0
+		for largo in largos:
+			bloque = Bloque(elems[inicio:inicio + largo])
+			ant.siguiente = bloque
+			ant = bloque
+			inicio += largo
+		ant.siguiente = None
+		self.__tamaño = len(elems)
+		self.__bloques = len(largos)
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Objeto y, por bloque, el nodo y su lista de claves."""
+		total = memoria.bytes_objeto(self)
+		act: Bloque | None = self.__cabeza
+		while act is not None:
+			total += memoria.tamaño(act) + memoria.tamaño(act.claves)
+			if incluir_claves:
+				total += memoria.bytes_hileras(act.claves)
+			act = act.siguiente
+		return total
+
+	def __iter__(self) -> Iterator[str]:
+		act = self.__cabeza.siguiente
+		while act is not None:
+			yield from act.claves
+			act = act.siguiente
+
+	def __str__(self) -> str:
+		elems: list[str] = []
+		act = self.__cabeza.siguiente
+		while act is not None:
+			elems.extend(act.claves)
+			act = act.siguiente
+		return "[" + ", ".join(elems) + "]"
+
+	def __del__(self) -> None:
+		self.limpie()
+
+	def __parta(self, bloque: Bloque) -> None:
+		"""Divide un bloque desbordado en dos mitades consecutivas."""
+		mitad = len(bloque.claves) // 2
+		nuevo = Bloque(bloque.claves[mitad:])
+		del bloque.claves[mitad:]
+		nuevo.siguiente = bloque.siguiente
+		bloque.siguiente = nuevo
+		self.__bloques += 1
+		if self._contadores is not None:
+			self._contadores["particiones"] += 1
+
+	def __rebalancee(self, ant: Bloque, bloque: Bloque) -> None:
+		"""Repara un bloque con pocas claves fusionándolo o redistribuyendo.
+
+		Si queda vacío se desenlaza. Si cabe junto con el siguiente se
+		fusionan; en otro caso se toman claves del siguiente hasta igualar.
+		"""
+		c = self._contadores
+		if not bloque.claves:
+			ant.siguiente = bloque.siguiente
+			self.__bloques -= 1
+			if c is not None:
+				c["fusiones"] += 1
+			return
+		sig = bloque.siguiente
+		if sig is None:
+			return
+		if len(bloque.claves) + len(sig.claves) <= self.__capacidad:
+			if c is not None:
+				c["fusiones"] += 1
+				c["reubicados"] += len(sig.claves)
+			bloque.claves.extend(sig.claves)
+			bloque.siguiente = sig.siguiente
+			self.__bloques -= 1
+			return
+		total = len(bloque.claves) + len(sig.claves)
+		mover = total // 2 - len(bloque.claves)
+		if c is not None:
+			c["redistribuciones"] += 1
+			c["reubicados"] += mover
+		bloque.claves.extend(sig.claves[:mover])
+		del sig.claves[:mover]
+
+	def __cuente(self, op: str, elemento: str, c: Counter[str]) -> None:
+		"""Repite el recorrido de ``op`` sin modificar nada: bloques
+		visitados, comparaciones (límites de bloque y búsqueda binaria dentro
+		del bloque) y claves corridas dentro del bloque.
+		"""
+		c[op] += 1
+		act = self.__cabeza.siguiente
+		if act is None:
+			return
+		visitados = 1
+		comparaciones = 0
+		if op == "inserte":
+			# avanza mientras el siguiente bloque empiece en <= elemento
+			sig = act.siguiente
+			while sig is not None:
+				comparaciones += 1
+				if sig.claves[0] > elemento:
+					break
+				act = sig
+				sig = act.siguiente
+				visitados += 1
+		else:
+			# avanza mientras el bloque termine en < elemento
+			while True:
+				comparaciones += 1
+				if act.claves[-1] >= elemento:
+					break
+				act = act.siguiente
+				if act is None:
+					c["visitados"] += visitados
+					c["comparaciones"] += comparaciones
+					return
+				visitados += 1
+		claves = act.claves
+		lo, hi = 0, len(claves)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			comparaciones += 1
+			if claves[mid] <= elemento if op == "inserte" else claves[mid] < elemento:
+				lo = mid + 1
+			else:
+				hi = mid
+		if op == "inserte":
+			c["corrimientos"] += len(claves) - lo
+		elif lo < len(claves):
+			comparaciones += 1  # la igualdad final de borre/miembro
+			if op == "borre" and claves[lo] == elemento:
+				c["corrimientos"] += len(claves) - 1 - lo
+		c["visitados"] += visitados
+		c["comparaciones"] += comparaciones
+
+	def __verifique_invariante(self) -> None:
+		"""Comprueba orden no decreciente dentro y entre bloques, que no
+		existan bloques vacíos ni desbordados y que los contadores coincidan.
+		"""
+		contador = 0
+		bloques = 0
+		prev: str | None = None
+		act = self.__cabeza.siguiente
+		while act is not None:
+			assert 0 < len(act.claves) <= self.__capacidad, (
+				f"Bloque con tamaño inválido: {len(act.claves)}"
+			)
+			for clave in act.claves:
+				if prev is not None:
+					assert prev <= clave, (
+						"Lista desordenada: '%s' antes de '%s'" % (prev, clave)
+					)
+				prev = clave
+			contador += len(act.claves)
+			bloques += 1
+			act = act.siguiente
+		assert contador == self.__tamaño, (
+			f"Tamaño inconsistente: contador={contador} almacenado={self.__tamaño}"
+		)
+		assert bloques == self.__bloques, (
+			f"Bloques inconsistentes: contador={bloques} almacenado={self.__bloques}"
+		)
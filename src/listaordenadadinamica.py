@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
 class Nodo:
+	__slots__ = ("elemento", "siguiente")
+
 	def __init__(self, elemento: str = ""):
 		self.elemento: str = elemento
 		self.siguiente: Nodo | None = None
@@ -15,12 +21,17 @@ class ListaOrdenadaDinámica(Diccionario):
 	Características:
 	- Permite duplicados (el nuevo duplicado se coloca tras los existentes).
 	- Inserción / borrado / búsqueda: O(n) en el peor caso.
+	- Un "dedo" recuerda el último nodo menor a la clave consultada; las
+	  operaciones sobre claves mayores arrancan desde él y no desde la cabeza.
+	- Lotes ordenados (``inserte_ordenados`` / ``borre_ordenados``): una sola
+	  pasada de mezcla, O(n + k log k).
 	- Limpieza: O(1) (se descarta la sub-lista).
 	"""
 
 	def __init__(self) -> None:
 		self.__cabeza: Nodo = Nodo()
 		self.__tamaño: int = 0
+		self.__dedo: Nodo = self.__cabeza
 
 	def __len__(self) -> int:
 		return self.__tamaño
@@ -38,23 +49,29 @@ class ListaOrdenadaDinámica(Diccionario):
 
 	def inserte(self, elemento: str) -> None:
 		"""Inserta manteniendo orden ascendente (permite duplicados)."""
+		if self._contadores is not None:
+			self.__cuente("inserte", elemento, self._contadores, hasta_iguales=True)
 		nuevo = Nodo(elemento)
-		ant = self.__cabeza
+		ant = self.__inicio(elemento)
 		act = ant.siguiente
 		while act is not None and act.elemento <= elemento:
 			ant = act
 			act = act.siguiente
 		nuevo.siguiente = act
 		ant.siguiente = nuevo
+		self.__dedo = ant
 		self.__tamaño += 1
 		self.__verifique_invariante()
 
 	def borre(self, elemento: str) -> bool:
-		ant = self.__cabeza
+		if self._contadores is not None:
+			self.__cuente("borre", elemento, self._contadores, hasta_iguales=False)
+		ant = self.__inicio(elemento)
 		act = ant.siguiente
 		while act is not None and act.elemento < elemento:
 			ant = act
 			act = act.siguiente
+		self.__dedo = ant
 		if act is not None and act.elemento == elemento:
 			ant.siguiente = act.siguiente
 			self.__tamaño -= 1
@@ -62,19 +79,111 @@ class ListaOrdenadaDinámica(Diccionario):
 			return True
 		return False
 
+	def inserte_ordenados(self, elementos: Iterable[str]) -> None:
+		"""Inserta un lote en una sola pasada de mezcla sobre la lista.
+
+		El lote se ordena primero (O(k log k)); luego se avanza un único
+		cursor por la lista, de modo que el costo total es O(n + k log k).
+		Los duplicados quedan tras los existentes, como en ``inserte``.
+		"""
+		ant = self.__cabeza
+		for elemento in sorted(elementos):
+			act = ant.siguiente
+			while act is not None and act.elemento <= elemento:
+				ant = act
+				act = act.siguiente
+			nuevo = Nodo(elemento)
+			nuevo.siguiente = act
+			ant.siguiente = nuevo
+			ant = nuevo
+			self.__tamaño += 1
+		self.__dedo = self.__cabeza
+		self.__verifique_invariante()
+
+	def borre_ordenados(self, elementos: Iterable[str]) -> int:
+		"""Borra una ocurrencia por cada elemento del lote en una sola pasada.
+
+		Devuelve la cantidad de elementos efectivamente borrados.
+		"""
+		borrados = 0
+		ant = self.__cabeza
+		for elemento in sorted(elementos):
+			act = ant.siguiente
+			while act is not None and act.elemento < elemento:
+				ant = act
+				act = act.siguiente
+			if act is not None and act.elemento == elemento:
+				ant.siguiente = act.siguiente
+				borrados += 1
+		self.__tamaño -= borrados
+		self.__dedo = self.__cabeza
+		self.__verifique_invariante()
+		return borrados
+
 	def limpie(self) -> None:
 		self.__cabeza.siguiente = None
 		self.__tamaño = 0
+		self.__dedo = self.__cabeza
 
 	def miembro(self, elemento: str) -> bool:
-		act = self.__cabeza.siguiente
+		if self._contadores is not None:
+			self.__cuente("miembro", elemento, self._contadores, hasta_iguales=False)
+		ant = self.__inicio(elemento)
+		act = ant.siguiente
 		while act is not None and act.elemento < elemento:
+			ant = act
 			act = act.siguiente
+		self.__dedo = ant
 		return act is not None and act.elemento == elemento
 
 	def imprima(self) -> None:
 		print(self)
 
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Guarda la secuencia ordenada de claves."""
+		elems: list[str | None] = []
+		act = self.__cabeza.siguiente
+		while act is not None:
+			elems.append(act.elemento)
+			act = act.siguiente
+		with instantanea.abra(destino, "w") as f:
+			instantanea.escriba_encabezado(f, type(self).__name__)
+			instantanea.escriba_hileras(f, elems)
+
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		"""Enlaza los nodos directamente desde la secuencia ya ordenada."""
+		with instantanea.abra(origen, "r") as f:
+			invertir = instantanea.lea_encabezado(f, type(self).__name__)
+			elems = instantanea.lea_hileras_completas(f, invertir)
+		sig: Nodo | None = None
+		for elemento in reversed(elems):
+			nodo = Nodo(elemento)
+			nodo.siguiente = sig
+			sig = nodo
+		self.__cabeza.siguiente = sig
+		self.__tamaño = len(elems)
+		self.__dedo = self.__cabeza
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Objeto, nodo cabeza y un nodo por elemento (más las claves si se piden)."""
+		total = memoria.bytes_objeto(self)
+		claves: list[str] = []
+		act: Nodo | None = self.__cabeza
+		while act is not None:
+			total += memoria.tamaño(act)
+			if act is not self.__cabeza:
+				claves.append(act.elemento)
+			act = act.siguiente
+		if incluir_claves:
+			total += memoria.bytes_hileras(claves)
+		return total
+
+	def __iter__(self) -> Iterator[str]:
+		act = self.__cabeza.siguiente
+		while act is not None:
+			yield act.elemento
+			act = act.siguiente
+
 	def __str__(self) -> str:
 		elems: list[str] = []
 		act = self.__cabeza.siguiente
@@ -86,6 +195,35 @@ class ListaOrdenadaDinámica(Diccionario):
 	def __del__(self) -> None: 
 		self.limpie()
 
+	def __inicio(self, elemento: str) -> Nodo:
+		"""Nodo desde el cual recorrer: el dedo si su clave es menor a
+		``elemento`` (sigue siendo un predecesor válido), o la cabeza.
+		"""
+		dedo = self.__dedo
+		if dedo is not self.__cabeza and dedo.elemento < elemento:
+			return dedo
+		return self.__cabeza
+
+	def __cuente(self, op: str, elemento: str, c: Counter[str], hasta_iguales: bool) -> None:
+		"""Repite el recorrido de ``op`` sin modificar nada, contando nodos
+		visitados y comparaciones de claves (incluida la del dedo).
+		"""
+		c[op] += 1
+		comparaciones = 0 if self.__dedo is self.__cabeza else 1
+		visitados = 0
+		act = self.__inicio(elemento).siguiente
+		while act is not None:
+			visitados += 1
+			comparaciones += 1
+			if act.elemento < elemento or (hasta_iguales and act.elemento == elemento):
+				act = act.siguiente
+			else:
+				break
+		if not hasta_iguales and act is not None:
+			comparaciones += 1  # la igualdad final de borre/miembro
+		c["visitados"] += visitados
+		c["comparaciones"] += comparaciones
+
 	def __verifique_invariante(self) -> None:
 		"""Comprueba (solo en modo debug) que:
 		- La secuencia está en orden no decreciente.
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections import Counter
+from typing import IO, Iterator
+
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
@@ -27,6 +31,9 @@ class Array:
 	def __len__(self) -> int:
 		return self.__tamaño
 
+	def memoria_bytes(self) -> int:
+		return memoria.bytes_objeto(self) + memoria.tamaño(self.__lista)
+
 	def __repr__(self) -> str:
 		return f"Array({self.__lista})"
 
@@ -59,12 +66,18 @@ class ListaOrdenadaEstática(Diccionario):
 			raise IndexError("Índice fuera de rango")
 		return self.__arreglo[indice]
 
+	def __iter__(self) -> Iterator[str]:
+		for i in range(len(self)):
+			yield self.__arreglo[i]
+
 	def inserte(self, elemento: str) -> None:
 		capacidad = len(self.__arreglo)
 		n = len(self)
 		if n >= capacidad:
 			return
 		pos = self.__upper_bound(elemento, 0, n)
+		if self._contadores is not None:
+			self.__cuente("inserte", elemento, n, self._contadores, corrimientos=n - pos)
 		# correr a la derecha
 		i = n - 1
 		while i >= pos:
@@ -79,7 +92,10 @@ class ListaOrdenadaEstática(Diccionario):
 		if n == 0:
 			return False
 		idx = self.__lower_bound(elemento, 0, n)
-		if idx < n and self.__arreglo[idx] == elemento:
+		encontrado = idx < n and self.__arreglo[idx] == elemento
+		if self._contadores is not None:
+			self.__cuente("borre", elemento, n, self._contadores, corrimientos=n - 1 - idx if encontrado else 0)
+		if encontrado:
 			i = idx
 			while i < n - 1:
 				self.__arreglo[i] = self.__arreglo[i + 1]
@@ -104,11 +120,39 @@ class ListaOrdenadaEstática(Diccionario):
 		if n == 0:
 			return False
 		idx = self.__lower_bound(elemento, 0, n)
+		if self._contadores is not None:
+			self.__cuente("miembro", elemento, n, self._contadores)
 		return idx < n and self.__arreglo[idx] == elemento
 
 	def imprima(self) -> None:
 		print(self)
 
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Guarda la capacidad y el prefijo ocupado del arreglo."""
+		with instantanea.abra(destino, "w") as f:
+			instantanea.escriba_encabezado(f, type(self).__name__)
+			instantanea.escriba_enteros(f, [len(self.__arreglo)])
+			instantanea.escriba_hileras(f, [self.__arreglo[i] for i in range(len(self))])
+
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		"""Restaura el arreglo de una vez, sin corrimientos ni búsquedas."""
+		with instantanea.abra(origen, "r") as f:
+			invertir = instantanea.lea_encabezado(f, type(self).__name__)
+			(capacidad,) = instantanea.lea_enteros(f, invertir)
+			elems: list = instantanea.lea_hileras_completas(f, invertir)
+		n = len(elems)
+		if n > capacidad:
+			raise ValueError("La instantánea excede la capacidad guardada.")
+		self.__arreglo = Array(valor_inicial=elems + [None] * (capacidad - n), tamaño=capacidad)
+		self.__ultimo = n - 1 if n else None
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Objeto y arreglo completo (toda la capacidad, no solo lo ocupado)."""
+		total = memoria.bytes_objeto(self) + self.__arreglo.memoria_bytes()
+		if incluir_claves:
+			total += memoria.bytes_hileras(self)
+		return total
+
 	def __str__(self) -> str:
 		if self.__ultimo is None:
 			return "[]"
@@ -132,6 +176,29 @@ class ListaOrdenadaEstática(Diccionario):
 				raise AssertionError("Invariante roto: arreglo no ordenado")
 			prev = curr
 
+	def __cuente(self, op: str, x: str, n: int, c: Counter[str], corrimientos: int = 0) -> None:
+		"""Repite la búsqueda binaria de ``op`` contando casillas visitadas y
+		comparaciones; los corrimientos los calcula quien llama (n - posición).
+		"""
+		c[op] += 1
+		lo, hi = 0, n
+		visitados = 0
+		while lo < hi:
+			mid = (lo + hi) // 2
+			visitados += 1
+			if op == "inserte":
+				menor = self.__arreglo[mid] <= x
+			else:
+				menor = self.__arreglo[mid] < x
+			if menor:
+				lo = mid + 1
+			else:
+				hi = mid
+		c["visitados"] += visitados
+		# borre y miembro comparan además la casilla encontrada por igualdad
+		c["comparaciones"] += visitados + (op != "inserte" and lo < n)
+		c["corrimientos"] += corrimientos
+
 	def __lower_bound(self, x: str, lo: int, hi: int) -> int:
 		"""Primer índice i en [lo,hi) tal que a[i] >= x."""
 		while lo < hi:
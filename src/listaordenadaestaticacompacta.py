@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import IO, Iterator
+
+from . import instantanea, memoria
+from .arena import ArenaHileras
+from .diccionario import Diccionario
+
+
+class ListaOrdenadaEstáticaCompacta(Diccionario):
+	"""Lista ordenada de capacidad fija con las claves en una arena de bytes.
+
+	Mismas reglas que ``ListaOrdenadaEstática`` (orden ascendente,
+	duplicados tras los existentes, inserciones extra descartadas), pero el
+	arreglo es un ``array('q')`` de posiciones dentro de una ``ArenaHileras``.
+	Las comparaciones se hacen sobre los bytes UTF-8, cuyo orden coincide con
+	el de ``str``. Tras muchos borrados la arena se compacta.
+	"""
+
+	def __init__(self, tamaño: int):
+		if not isinstance(tamaño, int) or tamaño < 0:
+			raise ValueError("El tamaño debe ser un entero no negativo.")
+		self.__arreglo: array = array("q", bytes(8 * tamaño))
+		self.__n: int = 0
+		self.__arena = ArenaHileras()
+
+	def __len__(self) -> int:
+		return self.__n
+
+	def __getitem__(self, indice: int) -> str:
+		if not (0 <= indice < self.__n):
+			raise IndexError("Índice fuera de rango")
+		return self.__arena.hilera(self.__arreglo[indice])
+
+	def inserte(self, elemento: str) -> None:
+		n = self.__n
+		if n >= len(self.__arreglo):
+			return
+		x = elemento.encode("utf-8", "surrogatepass")
+		pos = self.__upper_bound(x, 0, n)
+		if self._contadores is not None:
+			self.__cuente("inserte", x, n, self._contadores, corrimientos=n - pos)
+		# correr a la derecha
+		self.__arreglo[pos + 1 : n + 1] = self.__arreglo[pos:n]
+		self.__arreglo[pos] = self.__arena.agregue(x)
+		self.__n = n + 1
+		self.__verifique_invariante()
+
+	def borre(self, elemento: str) -> bool:
+		n = self.__n
+		if n == 0:
+			return False
+		x = elemento.encode("utf-8", "surrogatepass")
+		idx = self.__lower_bound(x, 0, n)
+		encontrado = idx < n and self.__arena.es_igual(self.__arreglo[idx], x)
+		if self._contadores is not None:
+			self.__cuente("borre", x, n, self._contadores, corrimientos=n - 1 - idx if encontrado else 0)
+		if encontrado:
+			self.__arena.libere(self.__arreglo[idx])
+			self.__arreglo[idx : n - 1] = self.__arreglo[idx + 1 : n]
+			self.__arreglo[n - 1] = 0
+			self.__n = n - 1
+			if self.__arena.requiere_compactar():
+				self.__arreglo[: self.__n] = self.__arena.compacte(self.__arreglo[: self.__n])
+				if self._contadores is not None:
+					self._contadores["compactaciones"] += 1
+			self.__verifique_invariante()
+			return True
+		return False
+
+	def limpie(self) -> None:
+		self.__n = 0
+		self.__arena.limpie()
+
+	def miembro(self, elemento: str) -> bool:
+		n = self.__n
+		if n == 0:
+			return False
+		x = elemento.encode("utf-8", "surrogatepass")
+		idx = self.__lower_bound(x, 0, n)
+		if self._contadores is not None:
+			self.__cuente("miembro", x, n, self._contadores)
+		return idx < n and self.__arena.es_igual(self.__arreglo[idx], x)
+
+	def imprima(self) -> None:
+		print(self)
+
+	def __iter__(self) -> Iterator[str]:
+		for i in range(self.__n):
+			yield self.__arena.hilera(self.__arreglo[i])
+
+	def __str__(self) -> str:
+		if self.__n == 0:
+			return "[]"
+		return str(list(self))
+
+	def bytes_arena(self) -> int:
+		"""Tamaño actual de la arena (incluye bytes muertos no compactados)."""
+		return len(self.__arena)
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Objeto y arreglo de posiciones; las claves son el contenido de la arena."""
+		return (
+			memoria.bytes_objeto(self)
+			+ memoria.tamaño(self.__arreglo)
+			+ self.__arena.memoria_bytes(incluir_datos=incluir_claves)
+		)
+
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Guarda la capacidad, las posiciones ocupadas y la arena cruda."""
+		with instantanea.abra(destino, "w") as f:
+			instantanea.escriba_encabezado(f, type(self).__name__)
+			instantanea.escriba_enteros(f, [len(self.__arreglo), self.__arena.bytes_muertos()])
+			instantanea.escriba_enteros(f, self.__arreglo[: self.__n])
+			instantanea.escriba_bytes(f, self.__arena.como_bytes())
+
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		"""Restaura el arreglo de posiciones y la arena tal cual."""
+		with instantanea.abra(origen, "r") as f:
+			invertir = instantanea.lea_encabezado(f, type(self).__name__)
+			capacidad, muertos = instantanea.lea_enteros(f, invertir)
+			ocupadas = instantanea.lea_enteros(f, invertir)
+			datos = instantanea.lea_bytes(f)
+		n = len(ocupadas)
+		if n > capacidad:
+			raise ValueError("La instantánea excede la capacidad guardada.")
+		ocupadas.frombytes(bytes(8 * (capacidad - n)))
+		self.__arreglo = ocupadas
+		self.__n = n
+		self.__arena.restaure(datos, muertos)
+
+	def __del__(self) -> None:
+		self.limpie()
+
+	def __verifique_invariante(self) -> None:
+		"""Verifica orden ascendente (comparando bytes) y consistencia de tamaño."""
+		n = self.__n
+		if n > len(self.__arreglo):
+			raise AssertionError("Invariante roto: más elementos que capacidad")
+		if n == 0:
+			return
+		prev = self.__arena.crudo(self.__arreglo[0])
+		for i in range(1, n):
+			curr = self.__arena.crudo(self.__arreglo[i])
+			if prev > curr:
+				raise AssertionError("Invariante roto: arreglo no ordenado")
+			prev = curr
+
+	def __cuente(self, op: str, x: bytes, n: int, c: Counter[str], corrimientos: int = 0) -> None:
+		"""Como en ``ListaOrdenadaEstática``: repite la búsqueda binaria
+		contando casillas visitadas y comparaciones (de bytes); los
+		corrimientos los calcula quien llama.
+		"""
+		c[op] += 1
+		lo, hi = 0, n
+		visitados = 0
+		while lo < hi:
+			mid = (lo + hi) // 2
+			visitados += 1
+			clave = self.__arena.crudo(self.__arreglo[mid])
+			if clave <= x if op == "inserte" else clave < x:
+				lo = mid + 1
+			else:
+				hi = mid
+		c["visitados"] += visitados
+		c["comparaciones"] += visitados + (op != "inserte" and lo < n)
+		c["corrimientos"] += corrimientos
+
+	def __lower_bound(self, x: bytes, lo: int, hi: int) -> int:
+		"""Primer índice i en [lo,hi) tal que a[i] >= x."""
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self.__arena.crudo(self.__arreglo[mid]) < x:
+				lo = mid + 1
+			else:
+				hi = mid
+		return lo
+
+	def __upper_bound(self, x: bytes, lo: int, hi: int) -> int:
+		"""Primer índice i en [lo,hi) tal que a[i] > x."""
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self.__arena.crudo(self.__arreglo[mid]) <= x:
+				lo = mid + 1
+			else:
+				hi = mid
+		return lo
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import IO, Iterable, Iterator
+
+from . import instantanea, memoria
+from .diccionario import Diccionario
+
+MAGIA = b"DICM"
+VERSION = 1
+
+# magia | versión | reservado | cantidad de claves | posición de la tabla
+_ENCABEZADO = struct.Struct("<4sHHQQ")
+
+
+class ListaOrdenadaMapeada(Diccionario):
+	"""Lista ordenada de solo lectura respaldada por un archivo mapeado.
+
+	El archivo contiene un encabezado, un bloque con todas las claves en UTF-8
+	(una tras otra, en orden) y una tabla de ``n + 1`` posiciones (u64) donde
+	la clave ``i`` ocupa ``[pos[i], pos[i+1])``.
+
+	Características:
+	- Abrir es O(1): no se crea ningún objeto Python por clave.
+	- Búsqueda binaria comparando bytes (el orden UTF-8 coincide con el de
+	  ``str``); solo se leen las claves sondeadas.
+	- Duplicados permitidos si el archivo los trae.
+	- ``inserte``, ``borre``, ``limpie`` y ``cargue`` no están permitidos.
+	"""
+
+	def __init__(self, ruta: str) -> None:
+		self.__archivo = open(ruta, "rb")
+		try:
+			self.__mapa = mmap.mmap(self.__archivo.fileno(), 0, access=mmap.ACCESS_READ)
+			if len(self.__mapa) < _ENCABEZADO.size:
+				raise ValueError("El archivo no es un diccionario mapeado (encabezado incompleto).")
+			magia, version, _, n, tabla = _ENCABEZADO.unpack_from(self.__mapa, 0)
+			if magia != MAGIA:
+				raise ValueError("El archivo no es un diccionario mapeado.")
+			if version != VERSION:
+				raise ValueError(f"Versión de diccionario mapeado no soportada: {version}")
+			if tabla + 8 * (n + 1) > len(self.__mapa):
+				raise ValueError("Diccionario mapeado truncado: falta la tabla de posiciones.")
+		except BaseException:
+			self.cierre()
+			raise
+		self.__n: int = n
+		vista = memoryview(self.__mapa)[tabla : tabla + 8 * (n + 1)]
+		if sys.byteorder == "little":
+			self.__posiciones = vista.cast("Q")
+		else:  # pragma: no cover - solo en plataformas big-endian
+			self.__posiciones = array("Q", vista.tobytes())
+			self.__posiciones.byteswap()
+			vista.release()
+
+	def __len__(self) -> int:
+		return self.__n
+
+	def __getitem__(self, indice: int) -> str:
+		if not (0 <= indice < self.__n):
+			raise IndexError("Índice fuera de rango")
+		return self.__bytes(indice).decode("utf-8", "surrogatepass")
+
+	def __iter__(self) -> Iterator[str]:
+		for i in range(self.__n):
+			yield self.__bytes(i).decode("utf-8", "surrogatepass")
+
+	def __enter__(self) -> ListaOrdenadaMapeada:
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		self.cierre()
+
+	def inserte(self, elemento: str) -> None:
+		raise TypeError("ListaOrdenadaMapeada es de solo lectura.")
+
+	def borre(self, elemento: str) -> bool:
+		raise TypeError("ListaOrdenadaMapeada es de solo lectura.")
+
+	def limpie(self) -> None:
+		raise TypeError("ListaOrdenadaMapeada es de solo lectura.")
+
+	def miembro(self, elemento: str) -> bool:
+		x = elemento.encode("utf-8", "surrogatepass")
+		idx = self.__lower_bound(x)
+		return idx < self.__n and self.__bytes(idx) == x
+
+	def imprima(self) -> None:
+		print(self)
+
+	def __str__(self) -> str:
+		return "[" + ", ".join(self) + "]"
+
+	def guarde(self, destino: str | IO[bytes]) -> None:
+		"""Guarda las claves como instantánea; el archivo mapeado no cambia."""
+		with instantanea.abra(destino, "w") as f:
+			instantanea.escriba_encabezado(f, type(self).__name__)
+			instantanea.escriba_hileras(f, list(self))
+
+	def cargue(self, origen: str | IO[bytes]) -> None:
+		raise TypeError("ListaOrdenadaMapeada es de solo lectura.")
+
+	def memoria_bytes(self, incluir_claves: bool = False) -> int:
+		"""Objeto y tabla de posiciones; con ``incluir_claves``, todo el mapeo.
+
+		El mapeo vive en la caché de páginas del sistema, no en el montículo
+		de Python: solo ocupa RAM lo que se haya leído.
+		"""
+		total = memoria.bytes_objeto(self)
+		if self.__mapa.closed:
+			return total
+		if incluir_claves:
+			return total + len(self.__mapa)
+		return total + 8 * (self.__n + 1)
+
+	def cierre(self) -> None:
+		"""Libera el mapeo y el archivo; la instancia deja de ser usable."""
+		posiciones = getattr(self, "_ListaOrdenadaMapeada__posiciones", None)
+		if isinstance(posiciones, memoryview):
+			posiciones.release()
+		mapa = getattr(self, "_ListaOrdenadaMapeada__mapa", None)
+		if mapa is not None and not mapa.closed:
+			mapa.close()
+		archivo = getattr(self, "_ListaOrdenadaMapeada__archivo", None)
+		if archivo is not None:
+			archivo.close()
+		self.__n = 0
+
+	def __del__(self) -> None:
+		self.cierre()
+
+	def __bytes(self, indice: int) -> bytes:
+		pos = self.__posiciones
+		return self.__mapa[pos[indice] : pos[indice + 1]]
+
+	def __lower_bound(self, x: bytes) -> int:
+		"""Primer índice i tal que clave[i] >= x."""
+		pos = self.__posiciones
+		mapa = self.__mapa
+		lo, hi = 0, self.__n
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if mapa[pos[mid] : pos[mid + 1]] < x:
+				lo = mid + 1
+			else:
+				hi = mid
+		return lo
+
+
+def escriba_mapeado(ruta: str, elementos: Iterable[str]) -> int:
+	"""Escribe un archivo para ``ListaOrdenadaMapeada`` y devuelve la cantidad.
+
+	``elementos`` debe venir en orden ascendente; cualquier ``Diccionario`` de
+	este paquete sirve, ya que su recorrido (``__iter__``) es ordenado. El
+	bloque de claves se escribe en streaming; solo la tabla de posiciones
+	(8 bytes por clave) se mantiene en memoria.
+	"""
+	posiciones = array("Q")
+	with open(ruta, "wb") as f:
+		f.write(_ENCABEZADO.pack(MAGIA, VERSION, 0, 0, 0))
+		actual = _ENCABEZADO.size
+		anterior: str | None = None
+		for elemento in elementos:
+			if anterior is not None and elemento < anterior:
+				raise ValueError(
+					f"Los elementos no vienen ordenados: '{anterior}' antes de '{elemento}'"
+				)
+			anterior = elemento
+			datos = elemento.encode("utf-8", "surrogatepass")
+			posiciones.append(actual)
+			f.write(datos)
+			actual += len(datos)
+		posiciones.append(actual)
+		relleno = -actual % 8
+		f.write(b"\0" * relleno)
+		tabla = actual + relleno
+		if sys.byteorder != "little":  # pragma: no cover - solo en big-endian
+			posiciones.byteswap()
+		f.write(posiciones.tobytes())
+		n = len(posiciones) - 1
+		f.seek(0)
+		f.write(_ENCABEZADO.pack(MAGIA, VERSION, 0, n, tabla))
+	return n
+
+
+def escriba_mapeado_desde_texto(ruta: str, ruta_texto: str, codificacion: str = "utf-8") -> int:
+	"""Construye el archivo mapeado desde un texto con una palabra por línea.
+
+	Las líneas vacías se ignoran; las palabras se ordenan antes de escribir.
+	"""
+	with open(ruta_texto, "r", encoding=codificacion) as f:
+		palabras = [linea.rstrip("\r\n") for linea in f]
+	palabras = [p for p in palabras if p]
+	palabras.sort()
+	return escriba_mapeado(ruta, palabras)
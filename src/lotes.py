@@ -0,0 +1,130 @@
+"""Modo por lotes de ``python -m src``: comandos de texto sin interfaz.
+
+Cada línea de la entrada es un comando::
+
+    +palabra    inserte
+    -palabra    borre
+    ?palabra    miembro (escribe 1 o 0)
+    print       escribe el contenido
+    clear       limpie
+    len         escribe el tamaño
+
+Las líneas vacías y las que empiezan con ``#`` se ignoran. La palabra es
+todo lo que sigue al primer carácter, sin recortar espacios. La salida se
+acumula y se escribe por bloques; el resumen de tiempos va a la salida de
+errores para no mezclarse con los resultados.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import IO, Iterable
+
+from . import IMPLEMENTACIONES, cree_diccionario, resuelva_nombre
+from .diccionario import Diccionario
+
+COMANDOS = ("inserte", "borre", "miembro", "print", "clear", "len")
+
+_PREFIJOS = {"+": "inserte", "-": "borre", "?": "miembro"}
+_PALABRAS = {"print": "print", "clear": "clear", "len": "len"}
+
+
+def ejecute_lote(
+    diccionario: Diccionario, lineas: Iterable[str], salida: IO[str], bloque: int = 4096
+) -> dict[str, list[int]]:
+    """Ejecuta los comandos de ``lineas`` y devuelve, por comando, [veces, ns].
+
+    Solo se mide el tiempo dentro de las llamadas al diccionario. Un comando
+    desconocido lanza ``ValueError`` con el número de línea; lo ya ejecutado
+    queda escrito en ``salida``.
+    """
+    tiempos: dict[str, list[int]] = {c: [0, 0] for c in COMANDOS}
+    llamadas = {
+        "inserte": diccionario.inserte,
+        "borre": diccionario.borre,
+        "miembro": diccionario.miembro,
+        "print": diccionario.__str__,
+        "clear": diccionario.limpie,
+        "len": diccionario.__len__,
+    }
+    reloj = time.perf_counter_ns
+    pendiente: list[str] = []
+    try:
+        for numero, linea in enumerate(lineas, 1):
+            linea = linea.rstrip("\r\n")
+            if not linea or linea[0] == "#":
+                continue
+            comando = _PREFIJOS.get(linea[0])
+            if comando is not None:
+                fn = llamadas[comando]
+                t0 = reloj()
+                resultado = fn(linea[1:])
+                dt = reloj() - t0
+                if comando == "miembro":
+                    pendiente.append("1\n" if resultado else "0\n")
+            else:
+                comando = _PALABRAS.get(linea.strip())
+                if comando is None:
+                    raise ValueError(f"Comando desconocido en la línea {numero}: {linea!r}")
+                fn = llamadas[comando]
+                t0 = reloj()
+                resultado = fn()
+                dt = reloj() - t0
+                if comando != "clear":
+                    pendiente.append(f"{resultado}\n")
+            contador = tiempos[comando]
+            contador[0] += 1
+            contador[1] += dt
+            if len(pendiente) >= bloque:
+                salida.writelines(pendiente)
+                pendiente.clear()
+    finally:
+        salida.writelines(pendiente)
+        salida.flush()
+    return tiempos
+
+
+def imprima_resumen(nombre: str, tiempos: dict[str, list[int]], pared_ns: int, salida: IO[str]) -> None:
+    veces = sum(v for v, _ in tiempos.values())
+    dentro = sum(ns for _, ns in tiempos.values())
+    lineas = [f"{nombre}: {veces} comandos en {pared_ns / 1e9:.3f} s"]
+    if dentro:
+        lineas[0] += f" ({dentro / 1e9:.3f} s en el diccionario, {veces / (dentro / 1e9):,.0f} ops/s)"
+    for comando, (v, ns) in tiempos.items():
+        if v:
+            lineas.append(f"  {comando:<8} {v:>10} × {ns / v / 1e3:>10.2f} µs = {ns / 1e9:.3f} s")
+    salida.write("\n".join(lineas) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Ejecuta comandos +palabra, -palabra, ?palabra, print, clear y len sobre un diccionario",
+    )
+    parser.add_argument("--impl", required=True, help=f"Implementación: {', '.join(IMPLEMENTACIONES)}")
+    parser.add_argument("--batch", required=True, help="Archivo de comandos, o - para la entrada estándar")
+    parser.add_argument("--capacity", type=int, default=0, help="Capacidad inicial (listas estáticas, tablas hash)")
+    parser.add_argument("--quiet", action="store_true", help="Omite el resumen de tiempos")
+    args = parser.parse_args(argv)
+
+    try:
+        nombre = resuelva_nombre(args.impl)
+    except ValueError as e:
+        parser.error(str(e))
+    argumentos = (args.capacity,) if args.capacity and IMPLEMENTACIONES[nombre][1] else ()
+    diccionario = cree_diccionario(nombre, *argumentos)
+
+    inicio = time.perf_counter_ns()
+    try:
+        if args.batch == "-":
+            tiempos = ejecute_lote(diccionario, sys.stdin, sys.stdout)
+        else:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                tiempos = ejecute_lote(diccionario, f, sys.stdout)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if not args.quiet:
+        imprima_resumen(nombre, tiempos, time.perf_counter_ns() - inicio, sys.stderr)
+    return 0
@@ -0,0 +1,41 @@
+"""Contabilidad de memoria retenida para ``memoria_bytes``.
+
+A diferencia del pico de ``tracemalloc``, aquí se suman solo los objetos que
+la estructura conserva (contenedores, nodos, arreglos) medidos con
+``sys.getsizeof``; no incluye asignaciones temporales ni el costo del
+rastreo. Las claves se cuentan aparte y una sola vez por objeto, porque
+varias referencias pueden apuntar a la misma hilera.
+"""
+from __future__ import annotations
+
+import sys
+from typing import Iterable
+
+tamaño = sys.getsizeof
+
+
+def bytes_hileras(hileras: Iterable[str | None]) -> int:
+    """Suma el tamaño de cada hilera distinta (por identidad), ignorando ``None``."""
+    vistos: set[int] = set()
+    total = 0
+    for h in hileras:
+        if h is None or id(h) in vistos:
+            continue
+        vistos.add(id(h))
+        total += tamaño(h)
+    return total
+
+
+def bytes_objeto(objeto: object) -> int:
+    """Tamaño de un objeto más su ``__dict__`` si lo tiene.
+
+    Pensado para el objeto de cada estructura, no para sus nodos: leer
+    ``__dict__`` lo materializa si el intérprete guardaba los atributos en
+    línea, y eso infla la memoria que se quiere medir. Los nodos usan
+    ``__slots__`` y se miden solo con ``tamaño``.
+    """
+    total = tamaño(objeto)
+    atributos = getattr(objeto, "__dict__", None)
+    if atributos is not None:
+        total += tamaño(atributos)
+    return total
@@ -1,8 +1,34 @@
 from __future__ import annotations
 
+from array import array
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
+def siguiente_primo(n: int) -> int:
+    """Menor primo impar >= ``n`` (capacidad de las tablas hash)."""
+    p = n if n % 2 else n + 1
+    while not _es_primo(p):
+        p += 2
+    return p
+
+
+def _es_primo(x: int) -> bool:
+    if x <= 3:
+        return x >= 2
+    if x % 2 == 0 or x % 3 == 0:
+        return False
+    f = 5
+    while f * f <= x:
+        if x % f == 0 or x % (f + 2) == 0:
+            return False
+        f += 6
+    return True
+
+
 class TablaHashAbierta(Diccionario):
     """Tabla hash abierta (encadenamiento) para hileras.
 
@@ -19,13 +45,15 @@ class TablaHashAbierta(Diccionario):
     def __init__(self, capacidad: int = 101) -> None:
         if capacidad < 4:
             capacidad = 4
-        self.__capacidad_inicial = self.___siguiente_primo(capacidad)
+        self.__capacidad_inicial = siguiente_primo(capacidad)
         self.__buckets: list[list[str]] = [[] for _ in range(self.__capacidad_inicial)]
         self.__n: int = 0
 
 
     def inserte(self, elemento: str) -> None:
         idx = self.__indice(elemento)
+        if self._contadores is not None:
+            self.__cuente("inserte", elemento, self.__buckets[idx], self._contadores)
         self.__buckets[idx].append(elemento)
         self.__n += 1
         self.__verifique_invariante()
@@ -36,6 +64,8 @@ class TablaHashAbierta(Diccionario):
     def borre(self, elemento: str) -> bool:
         idx = self.__indice(elemento)
         bucket = self.__buckets[idx]
+        if self._contadores is not None:
+            self.__cuente("borre", elemento, bucket, self._contadores)
         for i, v in enumerate(bucket):
             if v == elemento:
                 del bucket[i]
@@ -44,6 +74,22 @@ class TablaHashAbierta(Diccionario):
                 return True
         return False
 
+    def inserte_ordenados(self, elementos: Iterable[str]) -> None:
+        """Inserta un lote con a lo sumo un rehash y una sola verificación.
+
+        El orden del lote no importa aquí; el nombre es el de la carga masiva
+        de las listas, para que quien construye en lote lo use con cualquiera.
+        """
+        lote = list(elementos)
+        total = self.__n + len(lote)
+        if total > (len(self.__buckets) * 3) // 4:
+            self.__rehash((total * 4) // 3 + 1)
+        buckets = self.__buckets
+        for elemento in lote:
+            buckets[self.__indice(elemento)].append(elemento)
+        self.__n = total
+        self.__verifique_invariante()
+
     def limpie(self) -> None:
         cap = len(self.__buckets)
         self.__buckets = [[] for _ in range(cap)]
@@ -52,6 +98,8 @@ class TablaHashAbierta(Diccionario):
     def miembro(self, elemento: str) -> bool:
         idx = self.__indice(elemento)
         bucket = self.__buckets[idx]
+        if self._contadores is not None:
+            self.__cuente("miembro", elemento, bucket, self._contadores)
         for v in bucket:
             if v == elemento:
                 return True
@@ -60,6 +108,53 @@ class TablaHashAbierta(Diccionario):
     def imprima(self) -> None:
         print(self)
 
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto, lista de buckets y cada bucket (más las claves si se piden)."""
+        total = memoria.bytes_objeto(self) + memoria.tamaño(self.__buckets)
+        for bucket in self.__buckets:
+            total += memoria.tamaño(bucket)
+        if incluir_claves:
+            total += memoria.bytes_hileras(x for bucket in self.__buckets for x in bucket)
+        return total
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda los buckets tal cual: largo de cada uno y claves en orden.
+
+        Al cargar no se recalcula ningún hash ni se hace rehash.
+        """
+        largos = array("q", [len(b) for b in self.__buckets])
+        elems: list[str | None] = []
+        for bucket in self.__buckets:
+            elems.extend(bucket)
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, [self.__capacidad_inicial])
+            instantanea.escriba_enteros(f, largos)
+            instantanea.escriba_hileras(f, elems)
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura los buckets cortando la lista de claves por sus largos."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (self.__capacidad_inicial,) = instantanea.lea_enteros(f, invertir)
+            largos = instantanea.lea_enteros(f, invertir)
+            elems = instantanea.lea_hileras_completas(f, invertir)
+        buckets: list[list[str]] = []
+        inicio = 0
+        for largo in largos:
+            buckets.append(elems[inicio:inicio + largo])
+            inicio += largo
+        self.__buckets = buckets
+        self.__n = len(elems)
+
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las claves ordenadas (se ordena una copia, O(n log n))."""
+        elems: list[str] = []
+        for bucket in self.__buckets:
+            elems.extend(bucket)
+        elems.sort()
+        return iter(elems)
+
     def __str__(self) -> str:  
         if self.__n == 0:
             return "[]"
@@ -81,7 +176,7 @@ class TablaHashAbierta(Diccionario):
         return h % len(self.__buckets)
 
     def __rehash(self, nueva_capacidad: int) -> None:
-        nueva_cap = self.___siguiente_primo(max(nueva_capacidad, 2 * len(self.__buckets)))
+        nueva_cap = siguiente_primo(max(nueva_capacidad, 2 * len(self.__buckets)))
         nuevos: list[list[str]] = [[] for _ in range(nueva_cap)]
         for bucket in self.__buckets:
             for v in bucket:
@@ -90,7 +185,23 @@ class TablaHashAbierta(Diccionario):
                     h = (h * 257 + ord(ch)) & 0xFFFFFFFF
                 nuevos[h % nueva_cap].append(v)
         self.__buckets = nuevos
+        if self._contadores is not None:
+            self._contadores["rehashes"] += 1
+
 
+    @staticmethod
+    def __cuente(op: str, elemento: str, bucket: list[str], c: Counter[str]) -> None:
+        """Cuenta la cubeta sondeada, su largo y las claves comparadas
+        (``inserte`` agrega al final sin comparar).
+        """
+        c[op] += 1
+        c["cubetas"] += 1
+        c["largo_cubetas"] += len(bucket)
+        if op != "inserte":
+            try:
+                c["comparaciones"] += bucket.index(elemento) + 1
+            except ValueError:
+                c["comparaciones"] += len(bucket)
 
     def factor_carga(self) -> float:
         """Retorna el factor de carga actual (n / m)."""
@@ -109,22 +220,3 @@ class TablaHashAbierta(Diccionario):
                 total += 1
         if total != self.__n:
             raise AssertionError("Conteo inconsistente en la tabla hash")
-
-    @staticmethod
-    def ___siguiente_primo(n: int) -> int:
-        def es_primo(x: int) -> bool:
-            if x <= 3:
-                return x >= 2
-            if x % 2 == 0 or x % 3 == 0:
-                return False
-            f = 5
-            while f * f <= x:
-                if x % f == 0 or x % (f + 2) == 0:
-                    return False
-                f += 6
-            return True
-
-        p = n if n % 2 else n + 1
-        while not es_primo(p):
-            p += 2
-        return p
\ No newline at end of file
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import IO, Iterator
+
+from . import instantanea, memoria
+from .arena import ArenaHileras
+from .diccionario import Diccionario
+from .tablahashabierta import siguiente_primo
+
+
+class TablaHashCompacta(Diccionario):
+    """Tabla hash abierta cuyas claves viven en una arena de bytes.
+
+    Mismas reglas que ``TablaHashAbierta`` (duplicados, borrado de una
+    ocurrencia, rehash al superar 0.75), pero sin un objeto por bucket ni
+    por clave. Todo está en arreglos ``array`` paralelos:
+
+    - ``__cabezas[b]``: primera entrada del bucket ``b`` (``-1`` si vacío);
+    - ``__siguientes[e]``: entrada que sigue a ``e`` en su cadena;
+    - ``__posiciones[e]``: posición de la clave en la ``ArenaHileras``
+      (``-1`` si la entrada está libre y se puede reutilizar);
+    - ``__hashes[e]``: hash de 32 bits de la clave, para rehashear sin leerla.
+
+    El hash se calcula sobre los bytes UTF-8. Tras muchos borrados la arena
+    se compacta.
+    """
+
+    __slots__ = (
+        "__cabezas", "__siguientes", "__posiciones", "__hashes", "__libres",
+        "__n", "__capacidad_inicial", "__arena",
+    )
+
+    def __init__(self, capacidad: int = 101) -> None:
+        if capacidad < 4:
+            capacidad = 4
+        self.__capacidad_inicial = siguiente_primo(capacidad)
+        self.__cabezas = array("q", [-1]) * self.__capacidad_inicial
+        self.__siguientes = array("q")
+        self.__posiciones = array("q")
+        self.__hashes = array("I")
+        self.__libres = array("q")
+        self.__n: int = 0
+        self.__arena = ArenaHileras()
+
+    def inserte(self, elemento: str) -> None:
+        x = elemento.encode("utf-8", "surrogatepass")
+        h = self.__hash(x)
+        if self._contadores is not None:
+            self.__cuente("inserte", x, h, self._contadores)
+        pos = self.__arena.agregue(x)
+        if self.__libres:
+            e = self.__libres.pop()
+            self.__posiciones[e] = pos
+            self.__hashes[e] = h
+        else:
+            e = len(self.__posiciones)
+            self.__posiciones.append(pos)
+            self.__hashes.append(h)
+            self.__siguientes.append(-1)
+        b = h % len(self.__cabezas)
+        self.__siguientes[e] = self.__cabezas[b]
+        self.__cabezas[b] = e
+        self.__n += 1
+        self.__verifique_invariante()
+        if self.__n > (len(self.__cabezas) * 3) // 4:
+            self.__rehash(len(self.__cabezas) * 2)
+            self.__verifique_invariante()
+
+    def borre(self, elemento: str) -> bool:
+        x = elemento.encode("utf-8", "surrogatepass")
+        h = self.__hash(x)
+        if self._contadores is not None:
+            self.__cuente("borre", x, h, self._contadores)
+        b = h % len(self.__cabezas)
+        arena = self.__arena
+        ant = -1
+        e = self.__cabezas[b]
+        while e != -1:
+            if self.__hashes[e] == h and arena.es_igual(self.__posiciones[e], x):
+                if ant == -1:
+                    self.__cabezas[b] = self.__siguientes[e]
+                else:
+                    self.__siguientes[ant] = self.__siguientes[e]
+                arena.libere(self.__posiciones[e])
+                self.__posiciones[e] = -1
+                self.__libres.append(e)
+                self.__n -= 1
+                if arena.requiere_compactar():
+                    self.__compacte()
+                self.__verifique_invariante()
+                return True
+            ant = e
+            e = self.__siguientes[e]
+        return False
+
+    def limpie(self) -> None:
+        self.__cabezas = array("q", [-1]) * len(self.__cabezas)
+        self.__siguientes = array("q")
+        self.__posiciones = array("q")
+        self.__hashes = array("I")
+        self.__libres = array("q")
+        self.__n = 0
+        self.__arena.limpie()
+
+    def miembro(self, elemento: str) -> bool:
+        x = elemento.encode("utf-8", "surrogatepass")
+        h = self.__hash(x)
+        if self._contadores is not None:
+            self.__cuente("miembro", x, h, self._contadores)
+        arena = self.__arena
+        e = self.__cabezas[h % len(self.__cabezas)]
+        while e != -1:
+            if self.__hashes[e] == h and arena.es_igual(self.__posiciones[e], x):
+                return True
+            e = self.__siguientes[e]
+        return False
+
+    def imprima(self) -> None:
+        print(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las claves ordenadas (se decodifican y ordenan, O(n log n))."""
+        arena = self.__arena
+        elems = [arena.hilera(pos) for pos in self.__posiciones if pos != -1]
+        elems.sort()
+        return iter(elems)
+
+    def __str__(self) -> str:
+        if self.__n == 0:
+            return "[]"
+        return "[" + ", ".join(self) + "]"
+
+    def __len__(self) -> int:
+        """Número total de elementos almacenados (incluye duplicados)."""
+        return self.__n
+
+    def factor_carga(self) -> float:
+        """Retorna el factor de carga actual (n / m)."""
+        return self.__n / len(self.__cabezas)
+
+    def bytes_arena(self) -> int:
+        """Tamaño actual de la arena (incluye bytes muertos no compactados)."""
+        return len(self.__arena)
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto y sus cinco arreglos; las claves son el contenido de la arena."""
+        total = memoria.bytes_objeto(self)
+        for arreglo in (self.__cabezas, self.__siguientes, self.__posiciones, self.__hashes, self.__libres):
+            total += memoria.tamaño(arreglo)
+        return total + self.__arena.memoria_bytes(incluir_datos=incluir_claves)
+
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda los arreglos de cadenas, los hashes y la arena cruda."""
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(
+                f, [self.__capacidad_inicial, self.__n, self.__arena.bytes_muertos()]
+            )
+            instantanea.escriba_enteros(f, self.__cabezas)
+            instantanea.escriba_enteros(f, self.__siguientes)
+            instantanea.escriba_enteros(f, self.__posiciones)
+            instantanea.escriba_enteros(f, self.__hashes, "I")
+            instantanea.escriba_enteros(f, self.__libres)
+            instantanea.escriba_bytes(f, self.__arena.como_bytes())
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura todos los arreglos tal cual, sin hashear ni decodificar."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            capacidad_inicial, n, muertos = instantanea.lea_enteros(f, invertir)
+            self.__cabezas = instantanea.lea_enteros(f, invertir)
+            self.__siguientes = instantanea.lea_enteros(f, invertir)
+            self.__posiciones = instantanea.lea_enteros(f, invertir)
+            self.__hashes = instantanea.lea_enteros(f, invertir)
+            self.__libres = instantanea.lea_enteros(f, invertir)
+            datos = instantanea.lea_bytes(f)
+        self.__capacidad_inicial = capacidad_inicial
+        self.__n = n
+        self.__arena.restaure(datos, muertos)
+
+    @staticmethod
+    def __hash(x: bytes) -> int:
+        h = 0
+        for b in x:
+            h = (h * 257 + b) & 0xFFFFFFFF
+        return h
+
+    def __rehash(self, nueva_capacidad: int) -> None:
+        nueva_cap = siguiente_primo(max(nueva_capacidad, 2 * len(self.__cabezas)))
+        cabezas = array("q", [-1]) * nueva_cap
+        siguientes = self.__siguientes
+        hashes = self.__hashes
+        for e, pos in enumerate(self.__posiciones):
+            if pos == -1:
+                continue
+            b = hashes[e] % nueva_cap
+            siguientes[e] = cabezas[b]
+            cabezas[b] = e
+        self.__cabezas = cabezas
+        if self._contadores is not None:
+            self._contadores["rehashes"] += 1
+
+    def __compacte(self) -> None:
+        """Reescribe la arena con las claves vivas y actualiza las posiciones."""
+        posiciones = self.__posiciones
+        vivas = array("q", [e for e, pos in enumerate(posiciones) if pos != -1])
+        nuevas = self.__arena.compacte(array("q", [posiciones[e] for e in vivas]))
+        for e, pos in zip(vivas, nuevas):
+            posiciones[e] = pos
+        if self._contadores is not None:
+            self._contadores["compactaciones"] += 1
+
+    def __cuente(self, op: str, x: bytes, h: int, c: Counter[str]) -> None:
+        """Cuenta la cubeta sondeada, su largo, las entradas comparadas
+        (``inserte`` enlaza al inicio sin comparar) y, de ellas, cuántas
+        pasaron el filtro del hash guardado y se compararon en la arena.
+        """
+        c[op] += 1
+        c["cubetas"] += 1
+        largo = examinadas = en_arena = 0
+        encontrada = False
+        e = self.__cabezas[h % len(self.__cabezas)]
+        while e != -1:
+            largo += 1
+            if op != "inserte" and not encontrada:
+                examinadas += 1
+                if self.__hashes[e] == h:
+                    en_arena += 1
+                    encontrada = self.__arena.es_igual(self.__posiciones[e], x)
+            e = self.__siguientes[e]
+        c["largo_cubetas"] += largo
+        c["comparaciones"] += examinadas
+        c["comparaciones_arena"] += en_arena
+
+    def __verifique_invariante(self) -> None:
+        """Verifica que el conteo coincida y que las posiciones caigan en la arena."""
+        total = 0
+        limite = len(self.__arena)
+        for e in self.__cabezas:
+            while e != -1:
+                pos = self.__posiciones[e]
+                if not (0 <= pos < limite):
+                    raise AssertionError("Posición fuera de la arena")
+                total += 1
+                e = self.__siguientes[e]
+        if total != self.__n:
+            raise AssertionError("Conteo inconsistente en la tabla hash")
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from array import array
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
@@ -23,6 +28,8 @@ class TrieArreglos(Diccionario):
 
     def inserte(self, elemento: str) -> None:
         """Agrega ``elemento`` y aumenta el contador en su nodo terminal."""
+        if self._contadores is not None:
+            self.__cuente("inserte", elemento, self._contadores)
         indice = 0
         for ch in elemento:
             siguiente = self.__hijos[indice].get(ch)
@@ -36,6 +43,8 @@ class TrieArreglos(Diccionario):
 
     def borre(self, elemento: str) -> bool:
         """Elimina una ocurrencia de ``elemento`` si está presente."""
+        if self._contadores is not None:
+            self.__cuente("borre", elemento, self._contadores)
         pila: list[tuple[int, str]] = []
         indice = 0
         for ch in elemento:
@@ -53,6 +62,21 @@ class TrieArreglos(Diccionario):
         self.__verifique_invariante()
         return True
 
+    def inserte_ordenados(self, elementos: Iterable[str]) -> None:
+        """Inserta un lote verificando el invariante una sola vez, al final."""
+        hijos = self.__hijos
+        for elemento in elementos:
+            indice = 0
+            for ch in elemento:
+                siguiente = hijos[indice].get(ch)
+                if siguiente is None:
+                    siguiente = self.__nuevo_nodo()
+                    hijos[indice][ch] = siguiente
+                indice = siguiente
+            self.__finales[indice] += 1
+            self.__total += 1
+        self.__verifique_invariante()
+
     def limpie(self) -> None:
         """Reinicia la estructura dejando solo el nodo raíz."""
         self.__hijos = [{}]
@@ -61,6 +85,8 @@ class TrieArreglos(Diccionario):
 
     def miembro(self, elemento: str) -> bool:
         """Devuelve ``True`` cuando ``elemento`` posee al menos una copia."""
+        if self._contadores is not None:
+            self.__cuente("miembro", elemento, self._contadores)
         indice = 0
         for ch in elemento:
             indice = self.__hijos[indice].get(ch, -1)
@@ -72,6 +98,12 @@ class TrieArreglos(Diccionario):
         """Imprime el recorrido lexicográfico de las palabras almacenadas."""
         print(self)
 
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las palabras en orden lexicográfico (con duplicados)."""
+        palabras: list[str] = []
+        self.__dfs(0, [], palabras)
+        return iter(palabras)
+
     def __str__(self) -> str:
         """Retorna el contenido ordenado como lista para depuración."""
         palabras: list[str] = []
@@ -82,6 +114,57 @@ class TrieArreglos(Diccionario):
         """Entrega el total de palabras del trie (contando duplicados)."""
         return self.__total
 
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda los arreglos paralelos tal cual están indexados.
+
+        ``__finales`` va directo; ``__hijos`` se aplana en la cantidad de
+        transiciones por nodo, sus caracteres y los índices destino.
+        """
+        cantidades = array("q")
+        caracteres: list[str] = []
+        destinos = array("q")
+        for transiciones in self.__hijos:
+            cantidades.append(len(transiciones))
+            caracteres.extend(transiciones.keys())
+            destinos.extend(transiciones.values())
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, [self.__total])
+            instantanea.escriba_enteros(f, self.__finales)
+            instantanea.escriba_enteros(f, cantidades)
+            instantanea.escriba_enteros(f, destinos)
+            instantanea.escriba_hileras(f, ["".join(caracteres)])
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Restaura los arreglos con los mismos índices de nodo."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (total,) = instantanea.lea_enteros(f, invertir)
+            finales = instantanea.lea_enteros(f, invertir)
+            cantidades = instantanea.lea_enteros(f, invertir)
+            destinos = instantanea.lea_enteros(f, invertir)
+            (caracteres,) = instantanea.lea_hileras_completas(f, invertir)
+        hijos: list[dict[str, int]] = []
+        inicio = 0
+        for cantidad in cantidades:
+            fin = inicio + cantidad
+            hijos.append(dict(zip(caracteres[inicio:fin], destinos[inicio:fin])))
+            inicio = fin
+        self.__hijos = hijos
+        self.__finales = finales.tolist()
+        self.__total = total
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto, las listas de nodos, cada diccionario de transiciones y los contadores.
+
+        Como en ``TriePunteros``, las claves viven en las aristas y
+        ``incluir_claves`` no cambia el resultado.
+        """
+        total = memoria.bytes_objeto(self) + memoria.tamaño(self.__hijos) + memoria.tamaño(self.__finales)
+        for hijos in self.__hijos:
+            total += memoria.tamaño(hijos)
+        return total
+
     def __dfs(self, indice: int, prefijo: list[str], salida: list[str]) -> None:
         for _ in range(self.__finales[indice]):
             salida.append("".join(prefijo))
@@ -90,10 +173,28 @@ class TrieArreglos(Diccionario):
             self.__dfs(self.__hijos[indice][ch], prefijo, salida)
             prefijo.pop()
 
+    def __cuente(self, op: str, elemento: str, c: Counter[str]) -> None:
+        """Recorre el prefijo existente de ``elemento`` contando nodos
+        visitados; en ``inserte``, lo que falta del camino son nodos nuevos.
+        """
+        c[op] += 1
+        indice = 0
+        profundidad = 0
+        for ch in elemento:
+            indice = self.__hijos[indice].get(ch, -1)
+            if indice == -1:
+                break
+            profundidad += 1
+        c["visitados"] += profundidad
+        if op == "inserte":
+            c["nodos_creados"] += len(elemento) - profundidad
+
     def __podar(self, pila: list[tuple[int, str]]) -> None:
         while pila:
             padre, ch = pila.pop()
             del self.__hijos[padre][ch]
+            if self._contadores is not None:
+                self._contadores["nodos_podados"] += 1
             if self.__finales[padre] > 0 or self.__hijos[padre]:
                 break
 
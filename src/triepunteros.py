@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
+from typing import IO, Iterable, Iterator
 
+from . import instantanea, memoria
 from .diccionario import Diccionario
 
 
-@dataclass
+@dataclass(slots=True)
 class _NodoTrie:
     fin: int = 0
     hijos: dict[str, _NodoTrie] = field(default_factory=dict)
@@ -29,6 +33,8 @@ class TriePunteros(Diccionario):
 
     def inserte(self, elemento: str) -> None:
         """Agrega ``elemento`` incrementando el contador en el nodo terminal."""
+        if self._contadores is not None:
+            self.__cuente("inserte", elemento, self._contadores)
         nodo = self.__raiz
         for ch in elemento:
             nodo = nodo.hijos.setdefault(ch, _NodoTrie())
@@ -43,6 +49,8 @@ class TriePunteros(Diccionario):
         huérfanos (sin hijos ni ocurrencias) para mantener compacto el
         almacenamiento.
         """
+        if self._contadores is not None:
+            self.__cuente("borre", elemento, self._contadores)
         pila: list[tuple[_NodoTrie, str]] = []
         nodo = self.__raiz
         for ch in elemento:
@@ -59,6 +67,16 @@ class TriePunteros(Diccionario):
         self.__verifique_invariante()
         return True
 
+    def inserte_ordenados(self, elementos: Iterable[str]) -> None:
+        """Inserta un lote verificando el invariante una sola vez, al final."""
+        for elemento in elementos:
+            nodo = self.__raiz
+            for ch in elemento:
+                nodo = nodo.hijos.setdefault(ch, _NodoTrie())
+            nodo.fin += 1
+            self.__total += 1
+        self.__verifique_invariante()
+
     def limpie(self) -> None:
         """Reinicia el trie descartando todos los nodos creados."""
         self.__raiz = _NodoTrie()
@@ -66,6 +84,8 @@ class TriePunteros(Diccionario):
 
     def miembro(self, elemento: str) -> bool:
         """Retorna ``True`` si ``elemento`` tiene al menos una ocurrencia."""
+        if self._contadores is not None:
+            self.__cuente("miembro", elemento, self._contadores)
         nodo = self.__raiz
         for ch in elemento:
             nodo = nodo.hijos.get(ch)
@@ -77,6 +97,12 @@ class TriePunteros(Diccionario):
         """Muestra por consola la lista ordenada de palabras almacenadas."""
         print(self)
 
+    def __iter__(self) -> Iterator[str]:
+        """Recorre las palabras en orden lexicográfico (con duplicados)."""
+        palabras: list[str] = []
+        self.__dfs(self.__raiz, [], palabras)
+        return iter(palabras)
+
     def __str__(self) -> str:
         """Construye una representación legible del contenido del trie."""
         palabras: list[str] = []
@@ -87,6 +113,63 @@ class TriePunteros(Diccionario):
         """Devuelve el total de palabras considerando duplicados."""
         return self.__total
 
+    def guarde(self, destino: str | IO[bytes]) -> None:
+        """Guarda los nodos en preorden: contador ``fin``, cantidad de hijos
+        y el carácter de la arista que llega a cada nodo (salvo la raíz).
+        """
+        fines = array("q")
+        cantidades = array("q")
+        etiquetas: list[str] = []
+        pila: list[tuple[str, _NodoTrie]] = [("", self.__raiz)]
+        while pila:
+            ch, nodo = pila.pop()
+            fines.append(nodo.fin)
+            cantidades.append(len(nodo.hijos))
+            etiquetas.append(ch)
+            pila.extend(reversed(nodo.hijos.items()))
+        with instantanea.abra(destino, "w") as f:
+            instantanea.escriba_encabezado(f, type(self).__name__)
+            instantanea.escriba_enteros(f, [self.__total])
+            instantanea.escriba_enteros(f, fines)
+            instantanea.escriba_enteros(f, cantidades)
+            instantanea.escriba_hileras(f, ["".join(etiquetas)])
+
+    def cargue(self, origen: str | IO[bytes]) -> None:
+        """Reconstruye los nodos en preorden sin recorrer ninguna palabra."""
+        with instantanea.abra(origen, "r") as f:
+            invertir = instantanea.lea_encabezado(f, type(self).__name__)
+            (total,) = instantanea.lea_enteros(f, invertir)
+            fines = instantanea.lea_enteros(f, invertir)
+            cantidades = instantanea.lea_enteros(f, invertir)
+            (etiquetas,) = instantanea.lea_hileras_completas(f, invertir)
+        raiz = _NodoTrie(fin=fines[0])
+        pila: list[list] = [[raiz, cantidades[0]]]
+        for i in range(1, len(fines)):
+            while pila[-1][1] == 0:
+                pila.pop()
+            tope = pila[-1]
+            tope[1] -= 1
+            nodo = _NodoTrie(fin=fines[i])
+            tope[0].hijos[etiquetas[i - 1]] = nodo
+            pila.append([nodo, cantidades[i]])
+        self.__raiz = raiz
+        self.__total = total
+
+    def memoria_bytes(self, incluir_claves: bool = False) -> int:
+        """Objeto y cada nodo (con ``__slots__``) con su diccionario de hijos.
+
+        Las claves no se guardan como hileras sino repartidas en las aristas
+        (hileras de un carácter, compartidas por el intérprete), así que
+        ``incluir_claves`` no cambia el resultado.
+        """
+        total = memoria.bytes_objeto(self)
+        pendientes = [self.__raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            total += memoria.tamaño(nodo) + memoria.tamaño(nodo.hijos)
+            pendientes.extend(nodo.hijos.values())
+        return total
+
     def __dfs(self, nodo: _NodoTrie, prefijo: list[str], salida: list[str]) -> None:
         for _ in range(nodo.fin):
             salida.append("".join(prefijo))
@@ -95,12 +178,30 @@ class TriePunteros(Diccionario):
             self.__dfs(nodo.hijos[ch], prefijo, salida)
             prefijo.pop()
 
+    def __cuente(self, op: str, elemento: str, c: Counter[str]) -> None:
+        """Recorre el prefijo existente de ``elemento`` contando nodos
+        visitados; en ``inserte``, lo que falta del camino son nodos nuevos.
+        """
+        c[op] += 1
+        nodo = self.__raiz
+        profundidad = 0
+        for ch in elemento:
+            nodo = nodo.hijos.get(ch)
+            if nodo is None:
+                break
+            profundidad += 1
+        c["visitados"] += profundidad
+        if op == "inserte":
+            c["nodos_creados"] += len(elemento) - profundidad
+
     def __podar(self, pila: list[tuple[_NodoTrie, str]]) -> None:
         while pila:
             nodo, ch = pila.pop()
             hijo = nodo.hijos[ch]
             if hijo.fin == 0 and not hijo.hijos:
                 del nodo.hijos[ch]
+                if self._contadores is not None:
+                    self._contadores["nodos_podados"] += 1
             else:
                 break
 